@@ -0,0 +1,81 @@
+"""
+Benchmark runner.
+
+Usage:
+    python -m benchmarks run [-k inventory] [--rounds 5] [--save-baseline]
+    python -m benchmarks compare [baseline.json] [results.json] [--threshold 0.1]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+from benchmarks.harness import (
+    baseline_path,
+    compare,
+    dump_results,
+    load_benchmarks,
+    load_results,
+    results_dir,
+    select,
+)
+
+latest_path = results_dir.joinpath("latest.json")
+
+
+def run(args: argparse.Namespace) -> int:
+    benchmarks = load_benchmarks()
+    results = []
+    for name in select(benchmarks, args.k):
+        result = benchmarks[name].run(rounds=args.rounds)
+        print(
+            f"{name:<45} {result.median * 1000:>10.2f} ms (median of {len(result.timings)})"
+        )
+        results.append(result)
+
+    output = baseline_path if args.save_baseline else args.output
+    dump_results(results, output)
+    print(f"Results saved to {output}")
+    return 0
+
+
+def compare_results(args: argparse.Namespace) -> int:
+    comparisons = compare(
+        baseline=load_results(args.baseline),
+        current=load_results(args.current),
+        threshold=args.threshold,
+    )
+    print(f"{'benchmark':<45} {'base ms':>10} {'curr ms':>10} {'change':>8}")
+    for comparison in comparisons:
+        print(comparison.format())
+    return 1 if any(comparison.is_regression for comparison in comparisons) else 0
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run benchmarks")
+    run_parser.add_argument("-k", help="Run only benchmarks containing this string")
+    run_parser.add_argument("--rounds", type=int, help="Override amount of rounds")
+    run_parser.add_argument("--output", type=Path, default=latest_path)
+    run_parser.add_argument(
+        "--save-baseline", action="store_true", help=f"Save results to {baseline_path}"
+    )
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare results with baseline, exits with 1 on regression"
+    )
+    compare_parser.add_argument("baseline", type=Path, nargs="?", default=baseline_path)
+    compare_parser.add_argument("current", type=Path, nargs="?", default=latest_path)
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    compare_parser.set_defaults(handler=compare_results)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,17 @@
+import random
+from typing import Any, Callable
+
+from benchmarks.harness import benchmark
+from tarkov.bots.container import BotContainer
+
+
+@benchmark("bots.generate")
+def generate() -> Callable[[], Any]:
+    random.seed(42)
+    bot_generator = BotContainer().bot_generator()
+
+    def generate_bots() -> None:
+        for _ in range(10):
+            bot_generator.generate(bot_role="assault")
+
+    return generate_bots
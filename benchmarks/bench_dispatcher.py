@@ -0,0 +1,34 @@
+import itertools
+from typing import Any, Callable, List
+
+from benchmarks.harness import benchmark, load_profile
+from tarkov.inventory_dispatcher import DispatcherManager
+
+
+@benchmark("dispatcher.examine_and_move")
+def examine_and_move() -> Callable[[], Any]:
+    profile = load_profile()
+    inventory = profile.inventory
+
+    stash_items = [
+        item
+        for item in inventory.items.values()
+        if item.parent_id == inventory.stash_id and item.location is not None
+    ]
+    actions: List[dict] = []
+    for item in itertools.islice(stash_items, 25):
+        actions.append({"Action": "Examine", "item": item.id})
+        # Moving item into the same place, so the batch could be dispatched again
+        actions.append(
+            {
+                "Action": "Move",
+                "item": item.id,
+                "to": {
+                    "id": inventory.stash_id,
+                    "container": item.slot_id,
+                    "location": item.location.dict(exclude_none=True),
+                },
+            }
+        )
+
+    return lambda: DispatcherManager(profile).dispatch(actions)
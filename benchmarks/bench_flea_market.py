@@ -0,0 +1,57 @@
+import random
+from typing import Any, Callable
+
+from benchmarks.harness import benchmark
+from server.app import container
+from tarkov.fleamarket.models import FleaMarketRequest
+
+_REQUEST = {
+    "buildCount": 0,
+    "buildItems": {},
+    "conditionFrom": 0,
+    "conditionTo": 100,
+    "currency": 0,
+    "handbookId": "",
+    "limit": 100,
+    "linkedSearchId": "",
+    "neededSearchId": "",
+    "offerOwnerType": 0,
+    "oneHourExpiration": False,
+    "onlyFunctional": True,
+    "page": 0,
+    "priceFrom": 0,
+    "priceTo": 0,
+    "quantityFrom": 0,
+    "quantityTo": 0,
+    "reload": 0,
+    "removeBartering": False,
+    "sortDirection": 0,
+    "sortType": 5,
+    "tm": 1,
+    "updateOfferCount": True,
+}
+
+
+@benchmark("flea_market.get_response")
+def get_response() -> Callable[[], Any]:
+    random.seed(42)
+    view = container.flea.market().view
+
+    requests = [
+        # Weapons category
+        FleaMarketRequest.parse_obj(
+            {**_REQUEST, "handbookId": "5b5f78dc86f77409407a7f8e"}
+        ),
+        # Items compatible with M4A1
+        FleaMarketRequest.parse_obj(
+            {**_REQUEST, "linkedSearchId": "5447a9cd4bdc2dbd208b4567"}
+        ),
+        # Whole flea market
+        FleaMarketRequest.parse_obj(_REQUEST),
+    ]
+
+    def get_responses() -> None:
+        for request in requests:
+            view.get_response(request)
+
+    return get_responses
@@ -0,0 +1,66 @@
+import atexit
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
+
+from starlette.testclient import TestClient
+
+from benchmarks.harness import PROFILE_ID, benchmark, profiles_dir
+from benchmarks.bench_flea_market import _REQUEST
+from server.app import app, container
+
+
+def _make_client() -> TestClient:
+    # Routes save the profile after request, so they should work on a copy
+    tmp_profiles_dir = Path(tempfile.mkdtemp(prefix="jet_benchmarks_"))
+    atexit.register(shutil.rmtree, tmp_profiles_dir, ignore_errors=True)
+    shutil.copytree(
+        profiles_dir.joinpath(PROFILE_ID), tmp_profiles_dir.joinpath(PROFILE_ID)
+    )
+    container.profile.config.profiles_dir.override(str(tmp_profiles_dir))
+    container.profile.manager.reset()
+
+    client = TestClient(app)
+    client.cookies["PHPSESSID"] = PROFILE_ID
+    return client
+
+
+def _round_trip(path: str, body: Any = None) -> Callable[[], Any]:
+    client = _make_client()
+
+    def request() -> None:
+        response = client.post(path, json=body)
+        response.raise_for_status()
+
+    return request
+
+
+@benchmark("http.client_items")
+def client_items() -> Callable[[], Any]:
+    return _round_trip("/client/items")
+
+
+@benchmark("http.client_globals")
+def client_globals() -> Callable[[], Any]:
+    return _round_trip("/client/globals")
+
+
+@benchmark("http.trader_assort")
+def trader_assort() -> Callable[[], Any]:
+    return _round_trip("/client/trading/api/getTraderAssort/54cb50c76803fa8b248b4571")
+
+
+@benchmark("http.ragfair_find")
+def ragfair_find() -> Callable[[], Any]:
+    return _round_trip(
+        "/client/ragfair/find", {**_REQUEST, "handbookId": "5b5f78dc86f77409407a7f8e"}
+    )
+
+
+@benchmark("http.profile_items_moving")
+def profile_items_moving() -> Callable[[], Any]:
+    return _round_trip(
+        "/client/game/profile/items/moving",
+        {"data": [{"Action": "Examine", "item": "5df7b9abef12bf7a252437a1"}]},
+    )
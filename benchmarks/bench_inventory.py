@@ -0,0 +1,39 @@
+import random
+from typing import Any, Callable, List, Tuple
+
+from benchmarks.harness import benchmark, load_profile
+from server.app import container
+from tarkov.exceptions import NoSpaceError
+from tarkov.inventory.inventory import PlayerInventoryStashMap
+from tarkov.inventory.models import Item
+
+
+@benchmark("inventory.stash_map_construction")
+def stash_map_construction() -> Callable[[], Any]:
+    inventory = load_profile().inventory
+    return lambda: PlayerInventoryStashMap(inventory=inventory)
+
+
+@benchmark("inventory.find_location_for_item")
+def find_location_for_item() -> Callable[[], Any]:
+    inventory = load_profile().inventory
+    templates_repository = container.repos.templates()
+    item_factory = container.items.factory()
+
+    random.seed(42)
+    templates = random.sample(sorted(templates_repository.templates), k=50)
+    items: List[Tuple[Item, List[Item]]] = [
+        item_factory.create_item(templates_repository.get_template(template_id))
+        for template_id in templates
+    ]
+
+    def find_locations() -> None:
+        for item, child_items in items:
+            try:
+                inventory.stash_map.find_location_for_item(
+                    item, child_items=child_items
+                )
+            except NoSpaceError:
+                pass
+
+    return find_locations
@@ -0,0 +1,29 @@
+from typing import Any, Callable, Optional
+
+from benchmarks.harness import benchmark
+from server.snapshot import Snapshot
+from tarkov.inventory.repositories import ItemTemplatesRepository, templates_snapshot
+
+
+class _NoSnapshot(Snapshot):
+    def load(self, key: bytes) -> Optional[Any]:
+        return None
+
+    def dump(self, key: bytes, data: Any) -> None:
+        pass
+
+
+@benchmark("items.templates_loading", rounds=3)
+def templates_loading() -> Callable[[], Any]:
+    # Snapshot is created during warmup round
+    return ItemTemplatesRepository
+
+
+@benchmark("items.templates_parsing", rounds=3)
+def templates_parsing() -> Callable[[], Any]:
+    snapshot = _NoSnapshot(
+        path=templates_snapshot.path,
+        sources=templates_snapshot.sources,
+        code=templates_snapshot.code,
+    )
+    return lambda: ItemTemplatesRepository(snapshot=snapshot)
@@ -0,0 +1,12 @@
+import random
+from typing import Any, Callable
+
+from benchmarks.harness import benchmark
+from tarkov.lib.locations import LocationGenerator
+
+
+@benchmark("locations.generate_location", rounds=5)
+def generate_location() -> Callable[[], Any]:
+    random.seed(42)
+    # Generator fills location base in place, so it's created on every round
+    return lambda: LocationGenerator("bigmap").generate_location()
@@ -0,0 +1,109 @@
+"""
+Same operations as other benchmarks but on big synthetic profile and flea market
+"""
+
+import atexit
+import random
+import shutil
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks.bench_flea_market import _REQUEST
+from benchmarks.harness import benchmark, load_profile
+from benchmarks.workload import WorkloadGenerator
+from server.app import container
+from tarkov.exceptions import NoSpaceError
+from tarkov.fleamarket.models import FleaMarketRequest
+from tarkov.inventory.inventory import PlayerInventoryStashMap
+from tarkov.profile.profile import Profile
+from tarkov.trader.models import TraderType
+
+
+@lru_cache()
+def _large_profile_dir() -> Path:
+    tmp_dir = Path(tempfile.mkdtemp(prefix="jet_benchmarks_"))
+    atexit.register(shutil.rmtree, tmp_dir, ignore_errors=True)
+    WorkloadGenerator(container).make_profile(
+        tmp_dir, items=5000, nesting_depth=3, mail_messages=500, quests=200
+    )
+    return tmp_dir
+
+
+def _large_profile() -> Profile:
+    return load_profile(_large_profile_dir())
+
+
+@benchmark("workload.profile_read", rounds=5)
+def profile_read() -> Callable[[], Any]:
+    profile_dir = _large_profile_dir()
+    return lambda: load_profile(profile_dir)
+
+
+@benchmark("workload.stash_map_construction", rounds=5)
+def stash_map_construction() -> Callable[[], Any]:
+    inventory = _large_profile().inventory
+    return lambda: PlayerInventoryStashMap(inventory=inventory)
+
+
+@benchmark("workload.find_location_for_item", rounds=5)
+def find_location_for_item() -> Callable[[], Any]:
+    inventory = _large_profile().inventory
+    item_factory = container.items.factory()
+    templates_repository = container.repos.templates()
+
+    random.seed(42)
+    templates = random.sample(sorted(templates_repository.templates), k=20)
+    items = [
+        item_factory.create_item(templates_repository.get_template(template_id))
+        for template_id in templates
+    ]
+
+    def find_locations() -> None:
+        for item, child_items in items:
+            try:
+                inventory.stash_map.find_location_for_item(
+                    item, child_items=child_items
+                )
+            except NoSpaceError:
+                pass
+
+    return find_locations
+
+
+@benchmark("workload.flea_market_get_response", rounds=5)
+def flea_market_get_response() -> Callable[[], Any]:
+    view = WorkloadGenerator(container).make_flea_market(offers=20_000).view
+    requests = [
+        FleaMarketRequest.parse_obj(
+            {**_REQUEST, "handbookId": "5b5f78dc86f77409407a7f8e"}
+        ),
+        FleaMarketRequest.parse_obj(
+            {**_REQUEST, "linkedSearchId": "5447a9cd4bdc2dbd208b4567"}
+        ),
+        FleaMarketRequest.parse_obj(_REQUEST),
+    ]
+
+    def get_responses() -> None:
+        for request in requests:
+            view.get_response(request)
+
+    return get_responses
+
+
+@benchmark("workload.trader_sell_prices", rounds=5)
+def trader_sell_prices() -> Callable[[], Any]:
+    # Same as /client/trading/api/getUserAssortPrice
+    inventory = _large_profile().inventory
+    trader = container.trader.manager().get_trader(TraderType.Mechanic)
+
+    def sell_prices() -> None:
+        for item in inventory.items.values():
+            if item.parent_id != inventory.root_id or not trader.can_sell(item):
+                continue
+            trader.get_sell_price(
+                item, children_items=inventory.iter_item_children_recursively(item)
+            )
+
+    return sell_prices
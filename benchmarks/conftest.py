@@ -0,0 +1,13 @@
+from typing import Iterator, List
+
+import pytest
+
+from benchmarks.harness import BenchmarkResult, dump_results, results_dir
+
+
+@pytest.fixture(scope="session")
+def benchmark_results() -> Iterator[List[BenchmarkResult]]:
+    results: List[BenchmarkResult] = []
+    yield results
+    if results:
+        dump_results(results, results_dir.joinpath("pytest.json"))
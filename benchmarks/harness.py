@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import importlib
+import pkgutil
+import platform
+import statistics
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import orjson
+
+from server import root_dir
+
+results_dir = root_dir.joinpath("benchmarks", "results")
+baseline_path = results_dir.joinpath("baseline.json")
+
+# Setup function, returns the function that is measured
+BenchmarkSetup = Callable[[], Callable[[], Any]]
+
+
+class Benchmark:
+    def __init__(self, name: str, setup: BenchmarkSetup, rounds: int, warmup: int):
+        self.name = name
+        self.setup = setup
+        self.rounds = rounds
+        self.warmup = warmup
+
+    def run(self, rounds: int = None) -> BenchmarkResult:
+        function = self.setup()
+        for _ in range(self.warmup):
+            function()
+
+        timings = []
+        for _ in range(rounds or self.rounds):
+            start_time = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start_time)
+        return BenchmarkResult(name=self.name, timings=timings)
+
+
+class BenchmarkResult:
+    def __init__(self, name: str, timings: List[float]):
+        self.name = name
+        self.timings = timings
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.timings)
+
+    def to_dict(self) -> dict:
+        return {
+            "rounds": len(self.timings),
+            "min": min(self.timings),
+            "median": self.median,
+            "mean": statistics.mean(self.timings),
+            "stdev": statistics.stdev(self.timings) if len(self.timings) > 1 else 0,
+        }
+
+
+benchmarks: Dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str, rounds: int = 10, warmup: int = 1
+) -> Callable[[BenchmarkSetup], BenchmarkSetup]:
+    """
+    Registers benchmark, decorated function does the setup and returns the function to measure
+    """
+
+    def decorator(setup: BenchmarkSetup) -> BenchmarkSetup:
+        benchmarks[name] = Benchmark(
+            name=name, setup=setup, rounds=rounds, warmup=warmup
+        )
+        return setup
+
+    return decorator
+
+
+def load_benchmarks() -> Dict[str, Benchmark]:
+    """
+    Imports every bench_* module from benchmarks package
+    """
+    setup_app()
+    package_dir = root_dir.joinpath("benchmarks")
+    for module in pkgutil.iter_modules([str(package_dir)]):
+        if module.name.startswith("bench_"):
+            importlib.import_module(f"benchmarks.{module.name}")
+    return benchmarks
+
+
+def setup_app() -> None:
+    """
+    Wires containers the same way main.py does
+    """
+    # pylint: disable=import-outside-toplevel
+    import tarkov
+    import server.app  # noqa: F401
+    from tarkov.bots.container import BotContainer
+
+    BotContainer().wire(packages=[tarkov])  # pylint: disable=no-member
+
+
+def select(names: Iterable[str], pattern: Optional[str]) -> List[str]:
+    return [name for name in names if pattern is None or pattern in name]
+
+
+def dump_results(results: Iterable[BenchmarkResult], path: Path) -> None:
+    data = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "benchmarks": {result.name: result.to_dict() for result in results},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def load_results(path: Path) -> Dict[str, dict]:
+    return orjson.loads(path.read_bytes())["benchmarks"]
+
+
+class Comparison:
+    def __init__(self, name: str, baseline: float, current: float, threshold: float):
+        self.name = name
+        self.baseline = baseline
+        self.current = current
+        self.change = current / baseline - 1
+        self.is_regression = self.change > threshold
+
+    def format(self) -> str:
+        flag = "REGRESSION" if self.is_regression else ""
+        return (
+            f"{self.name:<45} {self.baseline * 1000:>10.2f} {self.current * 1000:>10.2f}"
+            f" {self.change:>+8.1%} {flag}"
+        )
+
+
+def compare(
+    baseline: Dict[str, dict], current: Dict[str, dict], threshold: float
+) -> List[Comparison]:
+    """
+    Compares medians of benchmarks present in both results,
+    benchmark is a regression if it got slower by more than threshold (0.1 - 10%)
+    """
+    return [
+        Comparison(
+            name=name,
+            baseline=baseline[name]["median"],
+            current=current[name]["median"],
+            threshold=threshold,
+        )
+        for name in sorted(current)
+        if name in baseline
+    ]
+
+
+PROFILE_ID = "9039420f851f50d547c06e93"
+profiles_dir = root_dir.joinpath("tests", "resources", "profiles")
+
+
+def load_profile(profile_dir: Path = profiles_dir.joinpath(PROFILE_ID)) -> Any:
+    """
+    Reads test profile, same one as tests use
+    """
+    # pylint: disable=import-outside-toplevel
+    from server.app import container
+
+    profile = container.profile.profile(profile_id=PROFILE_ID, profile_dir=profile_dir)
+    profile.read()
+    return profile
@@ -0,0 +1,19 @@
+"""
+Runs benchmarks with pytest: "pytest benchmarks" or "pytest benchmarks -k http",
+results are saved to benchmarks/results/pytest.json
+"""
+
+from typing import List
+
+import pytest
+
+from benchmarks.harness import BenchmarkResult, load_benchmarks
+
+benchmarks = load_benchmarks()
+
+
+@pytest.mark.parametrize("name", sorted(benchmarks))
+def test_benchmark(name: str, benchmark_results: List[BenchmarkResult]) -> None:
+    result = benchmarks[name].run()
+    benchmark_results.append(result)
+    print(f"{name}: {result.median * 1000:.2f} ms")
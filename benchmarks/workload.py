@@ -0,0 +1,303 @@
+"""
+Synthetic workloads: big profiles (stash with thousands of nested items, mail, quest progress)
+and flea markets with many offers, built with real ItemFactory and ItemTemplatesRepository.
+
+Usage:
+    python -m benchmarks.workload <profile_dir> --items 5000 --depth 3 --mail 300 --quests 150
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, TYPE_CHECKING, Tuple
+
+from benchmarks.harness import PROFILE_ID, profiles_dir, setup_app
+from tarkov.config import FleaMarketConfig
+from tarkov.exceptions import NoSpaceError
+from tarkov.fleamarket.fleamarket import FleaMarket
+from tarkov.inventory.models import Item, ItemInventoryLocation, ItemTemplate
+from tarkov.inventory.prop_models import CompoundProps
+from tarkov.mail.models import MailDialogueMessage, MailMessageItems, MailMessageType
+from tarkov.quests.models import Quest, QuestStatus
+from tarkov.repositories.categories import category_repository
+from tarkov.trader.models import TraderType
+
+if TYPE_CHECKING:
+    # pylint: disable=cyclic-import
+    from server.container import AppContainer
+    from tarkov.inventory.inventory import PlayerInventory
+    from tarkov.profile.profile import Profile
+
+
+class WorkloadGenerator:
+    """
+    Generates valid but big profiles and flea markets.
+    Items are placed so they don't overlap, grid filters of containers are not checked.
+    """
+
+    # Chance that generated item is a container (if nesting depth allows it)
+    container_chance: float = 0.3
+
+    def __init__(self, container: AppContainer, seed: int = 42) -> None:
+        self.container = container
+        self.random = random.Random(seed)
+        self.templates_repository = container.repos.templates()
+        self.item_factory = container.items.factory()
+        self.quests_repository = container.quests.repository()
+
+        # Only items that can be seen in handbook, same as flea market uses
+        templates = [
+            template
+            for template in self.templates_repository.templates.values()
+            if template.id in category_repository.item_categories
+        ]
+        self.containers: List[ItemTemplate] = [
+            template
+            for template in templates
+            if isinstance(template.props, CompoundProps) and template.props.Grids
+        ]
+        # Containers that hold more than they take are picked more often
+        self.containers_weights: List[float] = [
+            sum(grid.props.width * grid.props.height for grid in template.props.Grids)
+            / (template.props.Width * template.props.Height)
+            for template in self.containers
+        ]
+        containers_ids = {template.id for template in self.containers}
+        self.loot: List[ItemTemplate] = [
+            template for template in templates if template.id not in containers_ids
+        ]
+
+    def make_profile(
+        self,
+        profile_dir: Path,
+        *,
+        items: int = 1000,
+        nesting_depth: int = 2,
+        mail_messages: int = 100,
+        items_per_message: int = 3,
+        quests: int = 100,
+    ) -> Profile:
+        """
+        Creates profile in profile_dir based on the test profile and fills it
+
+        :param items: Amount of items to add into stash, including nested ones
+        :param nesting_depth: How deep containers can be nested into each other
+        :param mail_messages: Amount of mail messages
+        :param items_per_message: Amount of items attached to every message
+        :param quests: Amount of quests with some progress
+        """
+        if profile_dir.exists():
+            shutil.rmtree(profile_dir)
+        shutil.copytree(profiles_dir.joinpath(PROFILE_ID), profile_dir)
+
+        profile: Profile = self.container.profile.profile(
+            profile_id=PROFILE_ID, profile_dir=profile_dir
+        )
+        profile.read()
+
+        self.fill_stash(profile.inventory, items=items, nesting_depth=nesting_depth)
+        self.fill_mail(
+            profile, messages=mail_messages, items_per_message=items_per_message
+        )
+        self.fill_quests(profile, quests=quests)
+
+        profile.write()
+        return profile
+
+    def make_flea_market(self, offers: int) -> FleaMarket:
+        """
+        Creates flea market with given amount of offers
+        """
+        flea_market = FleaMarket(
+            offer_generator=self.container.flea.generator(),
+            flea_view_factory=self.container.flea.view,
+            flea_config=FleaMarketConfig(offers_amount=offers),
+        )
+        # Offer generator uses global random
+        random.seed(self.random.random())
+        flea_market.add_offers(flea_market.generator.generate_offers(offers))
+        flea_market.updated_at = datetime.now()
+        return flea_market
+
+    def fill_stash(
+        self, inventory: PlayerInventory, items: int, nesting_depth: int
+    ) -> int:
+        """
+        Adds items into stash until there's no space left or items limit is reached
+
+        :returns: Amount of added items
+        """
+        added = 0
+        while added < items:
+            item, child_items = self.__create_item(depth=0, nesting_depth=nesting_depth)
+            # Container is filled before placing so stash map is updated only once
+            child_items.extend(
+                self.__fill_container(
+                    inventory,
+                    item,
+                    items - added - 1 - len(child_items),
+                    depth=1,
+                    nesting_depth=nesting_depth,
+                )
+            )
+            try:
+                inventory.place_item(item, child_items=child_items)
+            except NoSpaceError:
+                break
+            added += 1 + len(child_items)
+        return added
+
+    def __fill_container(
+        self,
+        inventory: PlayerInventory,
+        container_item: Item,
+        items: int,
+        depth: int,
+        nesting_depth: int,
+    ) -> List[Item]:
+        """
+        :returns: Items put into container including their children
+        """
+        template = self.templates_repository.get_template(container_item)
+        if not isinstance(template.props, CompoundProps):
+            return []
+
+        nested_items: List[Item] = []
+        for grid in template.props.Grids:
+            taken = [[False] * grid.props.height for _ in range(grid.props.width)]
+            while len(nested_items) < items:
+                item, child_items = self.__create_item(depth, nesting_depth)
+                location = self.__find_location(
+                    taken, inventory.get_item_size(item, child_items)
+                )
+                if location is None:
+                    break
+
+                item.parent_id = container_item.id
+                item.slot_id = grid.name
+                item.location = location
+                nested_items.extend((item, *child_items))
+                nested_items.extend(
+                    self.__fill_container(
+                        inventory,
+                        item,
+                        items - len(nested_items),
+                        depth + 1,
+                        nesting_depth,
+                    )
+                )
+        return nested_items
+
+    @staticmethod
+    def __find_location(
+        taken: List[List[bool]], size: Tuple[int, int]
+    ) -> Optional[ItemInventoryLocation]:
+        """
+        Finds first free location in container grid and marks it as taken
+        """
+        grid_width, grid_height = len(taken), len(taken[0])
+        width, height = size
+        for y in range(grid_height - height + 1):
+            for x in range(grid_width - width + 1):
+                cells = [
+                    (cell_x, cell_y)
+                    for cell_x in range(x, x + width)
+                    for cell_y in range(y, y + height)
+                ]
+                if any(taken[cell_x][cell_y] for cell_x, cell_y in cells):
+                    continue
+                for cell_x, cell_y in cells:
+                    taken[cell_x][cell_y] = True
+                return ItemInventoryLocation(x=x, y=y, r="Horizontal")
+        return None
+
+    def __create_item(self, depth: int, nesting_depth: int) -> Tuple[Item, List[Item]]:
+        if depth < nesting_depth and self.random.random() < self.container_chance:
+            template = self.random.choices(
+                self.containers, weights=self.containers_weights
+            )[0]
+        else:
+            template = self.random.choice(self.loot)
+        return self.item_factory.create_item(template)
+
+    def fill_mail(
+        self, profile: Profile, messages: int, items_per_message: int
+    ) -> None:
+        traders = list(TraderType)
+        now = time.time()
+        for _ in range(messages):
+            trader = self.random.choice(traders)
+            items: List[Item] = []
+            for template in self.random.choices(self.loot, k=items_per_message):
+                item, child_items = self.item_factory.create_item(template)
+                items.extend((item, *child_items))
+
+            message = MailDialogueMessage(
+                uid=trader.value,
+                type=MailMessageType.NpcTraderMessage.value,
+                dt=now - self.random.randint(0, 3 * 24 * 60 * 60),
+                templateId="5bdac0b686f7743e1665e09e",
+                hasRewards=bool(items),
+                items=MailMessageItems.from_items(items),
+            )
+            profile.mail.get_dialogue(trader.value).messages.append(message)
+
+    def fill_quests(self, profile: Profile, quests: int) -> None:
+        templates = self.quests_repository.quests
+        now = int(time.time())
+        profile.pmc.Quests = []
+        for template in self.random.sample(templates, k=min(quests, len(templates))):
+            status = self.random.choice(
+                [QuestStatus.Success, QuestStatus.Success, QuestStatus.Started]
+            )
+            conditions = [
+                condition.props["id"]
+                for condition in template.conditions.AvailableForFinish
+            ]
+            if status == QuestStatus.Started:
+                conditions = conditions[: len(conditions) // 2]
+
+            profile.pmc.Quests.append(
+                Quest(
+                    qid=template.id,
+                    startTime=now,
+                    completedConditions=conditions,
+                    statusTimers={status.value: now},
+                    status=status,
+                )
+            )
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generates big profile")
+    parser.add_argument("profile_dir", type=Path)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--mail", type=int, default=100)
+    parser.add_argument("--quests", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    setup_app()
+    from server.app import container  # pylint: disable=import-outside-toplevel
+
+    profile = WorkloadGenerator(container, seed=args.seed).make_profile(
+        args.profile_dir,
+        items=args.items,
+        nesting_depth=args.depth,
+        mail_messages=args.mail,
+        quests=args.quests,
+    )
+    print(
+        f"Profile with {len(profile.inventory.items)} items, "
+        f"{len(profile.pmc.Quests)} quests written to {args.profile_dir}"
+    )
+
+
+if __name__ == "__main__":
+    main()
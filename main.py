@@ -1,17 +1,27 @@
 import uvicorn
 
-import tarkov
-from server.app import app
-from server.certs import generate_ssl_certificate, is_ssl_certificate_expired
-from tarkov.bots.container import BotContainer
-from tarkov.containers import ConfigContainer
+from server.startup import import_timer, startup_report
+
+# Installed before anything else is imported so startup report includes all server modules
+import_timer.install()
+
+# pylint: disable=wrong-import-position
+import tarkov  # noqa: E402
+from server.app import app  # noqa: E402
+from server.certs import (  # noqa: E402
+    generate_ssl_certificate,
+    is_ssl_certificate_expired,
+)
+from tarkov.bots.container import BotContainer  # noqa: E402
+from tarkov.containers import ConfigContainer  # noqa: E402
 
 if __name__ == "__main__":
-    bot_container = BotContainer()
-    bot_container.wire(packages=[tarkov])  # pylint: disable=no-member
+    with startup_report.step("bot and config containers wiring"):
+        bot_container = BotContainer()
+        bot_container.wire(packages=[tarkov])  # pylint: disable=no-member
 
-    config_container = ConfigContainer()
-    config_container.wire(packages=[tarkov])  # pylint: disable=no-member
+        config_container = ConfigContainer()
+        config_container.wire(packages=[tarkov])  # pylint: disable=no-member
 
     try:
         if is_ssl_certificate_expired():
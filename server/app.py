@@ -1,27 +1,48 @@
 import time
 import traceback
-from typing import Callable
+from datetime import datetime
 
 import fastapi.exception_handlers
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.requests import Request
-from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 import tarkov
 import tests
-from server import logger, root_dir
+from server import db_dir, logger, root_dir
+from server.capture import RequestRecorder
 from server.container import AppContainer
+from server.mapped import MappedFiles
+from server.memory import (
+    allocation_tracer,
+    allocations_endpoint,
+    memory_endpoint,
+    memory_report,
+)
+from server.metrics import MetricsMiddleware, metrics_endpoint
+from server.profiling import ProfilingMiddleware
 from server.package_lib import PackageManager
+from server.reload import rebuild, reload_endpoint, reloader
+from server.requests import ZLibRequest, ZLibRoute
+from server.responses import response_cache
+from server.snapshot import snapshots_dir
+from server.startup import import_timer, ready_endpoint, startup_report, warmup
 from tarkov.bots.router import bots_router
 from tarkov.fleamarket.routes import flea_market_router
+from tarkov.hideout.repositories import (
+    areas_repository,
+    production_repository,
+    scavcase_production_repository,
+)
 from tarkov.launcher.router import launcher_router
 from tarkov.mail.routes import mail_router
 from tarkov.notifier.router import notifier_router
 from tarkov.offraid.router import offraid_router
 from tarkov.profile.routes import profile_router
+from tarkov.repositories.categories import category_repository
 from tarkov.routes.friend import friend_router
 from tarkov.routes.hideout import hideout_router
 from tarkov.routes.insurance import insurance_router
@@ -37,11 +58,28 @@ class FastAPIWithContainer(FastAPI):
 
 
 container = AppContainer()
-container.wire(packages=[tarkov, tests])  # pylint: disable=no-member
+with startup_report.step("container wiring"):
+    container.wire(packages=[tarkov, tests])  # pylint: disable=no-member
 container.offraid.config.from_yaml("./config/offraid.yaml")
 container.insurance_config.from_yaml("./config/insurance.yaml")
 container.profile.config.from_yaml("./config/profile.yaml")
 
+server_config = container.config.server()
+if server_config.tracemalloc_frames > 0:
+    allocation_tracer.start(server_config.tracemalloc_frames)
+ZLibRequest.max_body_size = server_config.max_request_body_size
+ZLibRequest.threadpool_threshold = server_config.request_threadpool_threshold
+ZLibRoute.validate_trusted_responses = server_config.validate_responses
+if server_config.mapped_response_threshold > 0:
+    response_cache.mapped_files = MappedFiles(snapshots_dir.joinpath("mapped"))
+    response_cache.mapped_threshold = server_config.mapped_response_threshold
+if server_config.capture_requests:
+    capture_name = datetime.now().strftime("%Y%m%d_%H%M%S.jsonl")
+    ZLibRoute.recorder = RequestRecorder(
+        root_dir.joinpath(server_config.captures_dir, capture_name)
+    )
+    logger.info(f"Capturing requests into {ZLibRoute.recorder.path}")
+
 app = FastAPIWithContainer()
 app.container = container
 
@@ -70,13 +108,41 @@ app.mount(
 )
 
 
-@app.middleware("http")
-async def log_response_time(request: Request, call_next: Callable) -> Response:
-    start_time = time.time()
-    response = await call_next(request)
-    response_time = round(time.time() - start_time, 3)
-    logger.debug(f"Response time: {response_time}s")
-    return response
+class LogResponseTimeMiddleware:
+    # Plain ASGI middleware, BaseHTTPMiddleware would re-stream every body
+    # and it can't pass memory-mapped bodies through
+    def __init__(self, app: ASGIApp) -> None:  # pylint: disable=redefined-outer-name
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start_time = time.time()
+        await self.app(scope, receive, send)
+        response_time = round(time.time() - start_time, 3)
+        logger.debug(f"Response time: {response_time}s")
+
+
+app.add_middleware(LogResponseTimeMiddleware)
+
+
+profiling_config = container.config.profiling()
+if profiling_config.enabled:
+    app.add_middleware(
+        ProfilingMiddleware,
+        routes=lambda: app.routes,
+        profiles_dir=root_dir.joinpath(profiling_config.profiles_dir),
+        sample_every=profiling_config.sample_every,
+        slow_threshold=profiling_config.slow_threshold,
+        header=profiling_config.header,
+        interval=profiling_config.interval,
+    )
+
+if server_config.metrics_enabled:
+    # Added last so it wraps every other middleware
+    app.add_middleware(MetricsMiddleware, routes=lambda: app.routes)
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
 
 
 @app.exception_handler(RequestValidationError)
@@ -90,5 +156,117 @@ async def request_validation_exc_handler(
     )
 
 
-package_manager = PackageManager(root_dir.joinpath("mods"))
-package_manager.load_packages()
+app.add_route("/ready", ready_endpoint, include_in_schema=False)
+
+warmup.add(
+    "category_repository",
+    lambda: (category_repository.categories, category_repository.item_categories),
+)
+warmup.add(
+    "hideout_repositories",
+    lambda: (
+        areas_repository.areas,
+        production_repository.production,
+        scavcase_production_repository.production,
+    ),
+)
+warmup.add("templates_repository", container.repos.templates)
+warmup.add("globals_repository", container.repos.globals)
+warmup.add("quests_repository", container.quests.repository)
+warmup.add("flea_market_generator", container.flea.generator)
+warmup.add("response_cache", response_cache.warmup)
+
+
+def _reload_flea_market() -> None:
+    rebuild(container.flea.generator)
+    # Offers are kept, new offers are generated by new generator
+    container.flea.market().generator = container.flea.generator()
+
+
+app.add_route(
+    "/admin/reload", reload_endpoint, methods=["POST"], include_in_schema=False
+)
+
+# Targets are reloaded in this order, every target goes after targets it depends on
+reloader.add(
+    "category_repository",
+    category_repository.reload,
+    sources=[db_dir.joinpath("templates")],
+)
+reloader.add(
+    "templates_repository",
+    lambda: rebuild(container.repos.templates),
+    sources=[db_dir.joinpath("items"), db_dir.joinpath("templates", "items.json")],
+)
+reloader.add(
+    "globals_repository",
+    lambda: rebuild(container.repos.globals),
+    sources=[db_dir.joinpath("base", "globals.json")],
+)
+reloader.add(
+    "quests_repository",
+    lambda: rebuild(container.quests.repository),
+    sources=[db_dir.joinpath("quests", "all.json")],
+)
+reloader.add(
+    "item_factory",
+    lambda: rebuild(container.items.factory),
+    depends_on=["templates_repository", "globals_repository"],
+)
+reloader.add(
+    "flea_market",
+    _reload_flea_market,
+    sources=[
+        db_dir.joinpath("flea_prices.json"),
+        db_dir.joinpath("traders", "ragfair"),
+    ],
+    depends_on=["category_repository", "templates_repository", "item_factory"],
+)
+reloader.add(
+    "traders",
+    lambda: container.trader.manager().reload(),
+    sources=[path for path in db_dir.joinpath("traders").iterdir() if path.is_dir()],
+    depends_on=["category_repository", "templates_repository"],
+)
+reloader.add(
+    "client_items_response",
+    lambda: response_cache.invalidate("/client/items"),
+    depends_on=["templates_repository"],
+)
+
+
+app.add_route("/debug/memory", memory_endpoint, include_in_schema=False)
+app.add_route(
+    "/debug/memory/allocations",
+    allocations_endpoint,
+    methods=["POST"],
+    include_in_schema=False,
+)
+
+# Structures are measured in this order, shared objects are counted towards the first one
+memory_report.add("templates_repository", container.repos.templates)
+memory_report.add("globals_repository", container.repos.globals)
+memory_report.add("quests_repository", container.quests.repository)
+memory_report.add("category_repository", lambda: category_repository)
+memory_report.add("flea_market_offers", lambda: container.flea.market().offers)
+memory_report.add("flea_market", container.flea.market)
+memory_report.add("traders", lambda: container.trader.manager().traders, split=True)
+memory_report.add("notifications", lambda: container.notifier.service().notifications)
+memory_report.add("response_cache", lambda: response_cache)
+memory_report.add("profiles", lambda: container.profile.manager().profiles, split=True)
+
+
+@app.on_event("startup")
+def start_warmup() -> None:
+    import_timer.uninstall()
+    if server_config.warmup:
+        warmup.start()
+    else:
+        warmup.ready.set()
+    if server_config.db_reload_interval > 0:
+        reloader.watch(server_config.db_reload_interval)
+
+
+with startup_report.step("packages loading"):
+    package_manager = PackageManager(root_dir.joinpath("mods"))
+    package_manager.load_packages()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import base64
+import time
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, Optional
+
+import orjson
+from starlette.requests import Request
+
+
+class CapturedRequest:
+    __slots__ = ("offset", "method", "path", "route", "cookies", "body")
+
+    def __init__(
+        self,
+        offset: float,
+        method: str,
+        path: str,
+        route: str,
+        cookies: Dict[str, str],
+        body: bytes,
+    ) -> None:
+        # Seconds since capture start
+        self.offset = offset
+        self.method = method
+        self.path = path
+        self.route = route
+        self.cookies = cookies
+        self.body = body
+
+    def dumps(self) -> bytes:
+        record = {
+            "offset": round(self.offset, 4),
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "cookies": self.cookies,
+        }
+        try:
+            record["body"] = self.body.decode("utf8")
+        except UnicodeDecodeError:
+            record["body_base64"] = base64.b64encode(self.body).decode("ascii")
+        return orjson.dumps(record)
+
+    @classmethod
+    def loads(cls, line: bytes) -> CapturedRequest:
+        record = orjson.loads(line)
+        if "body_base64" in record:
+            body = base64.b64decode(record["body_base64"])
+        else:
+            body = record["body"].encode("utf8")
+        return cls(
+            offset=record["offset"],
+            method=record["method"],
+            path=record["path"],
+            route=record["route"],
+            cookies=record["cookies"],
+            body=body,
+        )
+
+
+class RequestRecorder:
+    """
+    Writes every request handled by ZLibRoute (with decompressed body) into a json lines file,
+    requests can be replayed later with server.replay
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.started_at: float = time.monotonic()
+        self.__file: Optional[BinaryIO] = None
+
+    def record(self, request: Request, route: str, body: bytes) -> None:
+        path = request.url.path
+        if request.url.query:
+            path += f"?{request.url.query}"
+
+        captured = CapturedRequest(
+            offset=time.monotonic() - self.started_at,
+            method=request.method,
+            path=path,
+            route=route,
+            cookies=dict(request.cookies),
+            body=body,
+        )
+        if self.__file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.__file = self.path.open("ab")
+        self.__file.write(captured.dumps() + b"\n")
+        self.__file.flush()
+
+    def close(self) -> None:
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+
+def read_capture(path: Path) -> Iterator[CapturedRequest]:
+    with path.open("rb") as file:
+        for line in file:
+            if line.strip():
+                yield CapturedRequest.loads(line)
@@ -0,0 +1,72 @@
+"""
+Compiles database into snapshots, so server loads parsed templates and ready response bodies
+instead of parsing json files. Snapshots are keyed by content hash of their sources,
+server ignores (and rebuilds) snapshots of changed files.
+
+Usage:
+    python -m server.dbcompile            # Build missing and stale snapshots
+    python -m server.dbcompile --force    # Rebuild every snapshot
+    python -m server.dbcompile --check    # Exit with code 1 if any snapshot is missing or stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from server.snapshot import Snapshot, snapshots_dir
+
+
+def compile_targets() -> Dict[str, Tuple[Snapshot, Callable[[], Any]]]:
+    """
+    Returns snapshot and function that builds it for every compiled part of database
+    """
+    # pylint: disable=import-outside-toplevel
+    # Importing app registers every cached response
+    from server.app import response_cache
+    from tarkov.inventory.repositories import (
+        ItemTemplatesRepository,
+        templates_snapshot,
+    )
+
+    targets: Dict[str, Tuple[Snapshot, Callable[[], Any]]] = {
+        "templates": (templates_snapshot, ItemTemplatesRepository)
+    }
+    for key, snapshot in response_cache.snapshots().items():
+        targets[key] = (snapshot, lambda key=key: response_cache.render(key))
+    return targets
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compiles database into snapshots")
+    parser.add_argument(
+        "--force", action="store_true", help="Rebuild snapshots that are fresh"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Only report missing or stale snapshots"
+    )
+    args = parser.parse_args(argv)
+
+    targets = compile_targets()
+    stale = [name for name, (snapshot, _) in targets.items() if not snapshot.is_fresh()]
+    if args.check:
+        for name in stale:
+            print(f"Stale: {name}")
+        sys.exit(1 if stale else 0)
+
+    for name, (snapshot, build) in targets.items():
+        if name not in stale and not args.force:
+            continue
+        snapshot.path.unlink(missing_ok=True)
+        start_time = time.perf_counter()
+        build()
+        duration = time.perf_counter() - start_time
+        print(f"{name:<40} {duration * 1000:>8.1f} ms")
+
+    print(f"Compiled {len(targets)} snapshots into {snapshots_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Immutable blobs (response bodies) kept in memory-mapped files instead of python heap.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import threading
+from pathlib import Path
+
+from server import logger
+
+
+class MappedFiles:
+    """
+    Stores blobs in files named by their content hash and maps them into memory.
+    Mapped pages are backed by the file, so OS shares them between worker processes through page cache
+    and can drop them under memory pressure, unlike bodies held in heap of every process.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.__lock = threading.Lock()
+
+    def map(self, name: str, data: bytes) -> memoryview:
+        """
+        Returns read-only view of data mapped from file, file is written only if it doesn't exist yet.
+
+        :param name: Name of the blob, previous files of blob with the same name are removed
+        :param data: Content of the blob
+        """
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        path = self.directory.joinpath(f"{name}.{digest}.bin")
+        with self.__lock:
+            if not path.exists() or path.stat().st_size != len(data):
+                self.directory.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+            self.__remove_previous(name, path)
+
+        with path.open("rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(mapped)
+
+    def __remove_previous(self, name: str, path: Path) -> None:
+        for previous_path in self.directory.glob(f"{name}.*.bin"):
+            if previous_path == path:
+                continue
+            try:
+                previous_path.unlink()
+            except OSError:
+                # File could be mapped by other process on windows, it's removed next time
+                logger.debug(f"Can not remove {previous_path}")
@@ -0,0 +1,191 @@
+"""
+Memory diagnostics: approximate retained size of major structures and tracemalloc snapshot diffs.
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import threading
+import tracemalloc
+import types
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from dependency_injector import providers
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+
+from server.metrics import is_local_request
+
+# Objects of these types are shared by the whole server (or reference everything, like providers),
+# so they are not counted and traversal doesn't go through them
+_SHARED_TYPES: Tuple[type, ...] = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+    types.FrameType,
+    providers.Provider,
+)
+
+
+def retained_size(root: Any, seen: Set[int]) -> Tuple[int, int]:
+    """
+    Returns approximate size in bytes and amount of objects reachable from root.
+    Objects which ids are in seen are skipped, ids of visited objects are added to seen.
+    """
+    size = 0
+    count = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        count += 1
+        stack.extend(gc.get_referents(obj))
+    return size, count
+
+
+class MemoryReport:
+    """
+    Measures retained size of registered structures.
+    Object shared by several structures is counted towards the first registered one.
+    """
+
+    def __init__(self) -> None:
+        self.structures: List[Tuple[str, Callable[[], Any], bool]] = []
+        self.__lock = threading.Lock()
+
+    def add(self, name: str, getter: Callable[[], Any], *, split: bool = False) -> None:
+        """
+        :param name: Name of the structure
+        :param getter: Function that returns the structure
+        :param split: Structure is a mapping and each of it's values should be reported separately as well
+        """
+        self.structures.append((name, getter, split))
+
+    def measure(self) -> Dict[str, dict]:
+        with self.__lock:
+            # Keeps objects alive while report is built, so ids are not reused
+            visited: List[Any] = []
+            seen: Set[int] = set()
+            report: Dict[str, dict] = {}
+            for name, getter, split in self.structures:
+                structure = getter()
+                visited.append(structure)
+                if not split:
+                    report[name] = self.__entry(structure, seen)
+                    continue
+
+                assert isinstance(structure, Mapping)
+                items = {
+                    str(key): self.__entry(value, seen)
+                    for key, value in list(structure.items())
+                }
+                # Mapping itself with it's keys
+                entry = self.__entry(structure, seen)
+                entry["size"] += sum(item["size"] for item in items.values())
+                entry["objects"] += sum(item["objects"] for item in items.values())
+                entry["items"] = items
+                report[name] = entry
+            return report
+
+    @staticmethod
+    def __entry(structure: Any, seen: Set[int]) -> dict:
+        size, count = retained_size(structure, seen)
+        return {"size": size, "objects": count}
+
+
+class AllocationTracer:
+    """
+    Compares tracemalloc snapshots, each diff is taken against previous snapshot
+    """
+
+    def __init__(self) -> None:
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def start(frames: int) -> None:
+        tracemalloc.start(frames)
+
+    @staticmethod
+    def is_tracing() -> bool:
+        return tracemalloc.is_tracing()
+
+    def diff(self, limit: int = 20) -> List[dict]:
+        """
+        Takes new snapshot and returns lines which allocated the most since previous snapshot
+        (or since start of tracing on first call)
+        """
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            ]
+        )
+        with self.__lock:
+            previous, self.snapshot = self.snapshot, snapshot
+
+        statistics: Sequence[Union[tracemalloc.Statistic, tracemalloc.StatisticDiff]]
+        if previous is None:
+            statistics = snapshot.statistics("lineno")
+        else:
+            statistics = snapshot.compare_to(previous, "lineno")
+
+        return [
+            {
+                "location": str(stat.traceback),
+                "size": stat.size,
+                "size_diff": getattr(stat, "size_diff", stat.size),
+                "count": stat.count,
+                "count_diff": getattr(stat, "count_diff", stat.count),
+            }
+            for stat in statistics[:limit]
+        ]
+
+
+async def memory_endpoint(request: Request) -> Response:
+    """
+    Reports retained size of registered structures, runs in threadpool since it traverses every object
+    """
+    if not is_local_request(request):
+        return PlainTextResponse("Forbidden", status_code=403)
+    return JSONResponse(await run_in_threadpool(memory_report.measure))
+
+
+async def allocations_endpoint(request: Request) -> Response:
+    """
+    Reports lines which allocated the most memory since previous request
+    """
+    if not is_local_request(request):
+        return PlainTextResponse("Forbidden", status_code=403)
+    if not allocation_tracer.is_tracing():
+        return PlainTextResponse(
+            "Tracemalloc is not started, see tracemalloc_frames in config/server.yaml",
+            status_code=409,
+        )
+    limit = int(request.query_params.get("limit", 20))
+    return JSONResponse(await run_in_threadpool(allocation_tracer.diff, limit))
+
+
+memory_report = MemoryReport()
+allocation_tracer = AllocationTracer()
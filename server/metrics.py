@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import collections
+import contextvars
+import time
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class RequestRecord:
+    """
+    Sizes of a single request/response, filled while request is processed
+    """
+
+    __slots__ = (
+        "request_bytes",
+        "request_bytes_decompressed",
+        "response_bytes",
+        "response_bytes_uncompressed",
+        "response_compressed",
+    )
+
+    def __init__(self) -> None:
+        self.request_bytes: int = 0
+        self.request_bytes_decompressed: Optional[int] = None
+        self.response_bytes: int = 0
+        self.response_bytes_uncompressed: Optional[int] = None
+        self.response_compressed: bool = False
+
+
+_current_record: contextvars.ContextVar[
+    Optional[RequestRecord]
+] = contextvars.ContextVar("current_request_record", default=None)
+
+
+def record_request_body(size: int) -> None:
+    """
+    Records size of request body after decompression
+    """
+    record = _current_record.get()
+    if record is not None:
+        record.request_bytes_decompressed = size
+
+
+def record_response_body(size: int) -> None:
+    """
+    Records size of response body before compression
+    """
+    record = _current_record.get()
+    if record is not None:
+        record.response_bytes_uncompressed = (
+            record.response_bytes_uncompressed or 0
+        ) + size
+
+
+class RouteMetrics:
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, window_size: int) -> None:
+        self.requests: int = 0
+        self.errors: int = 0
+        self.in_flight: int = 0
+        self.duration_sum: float = 0
+        self.durations: Deque[float] = collections.deque(maxlen=window_size)
+
+        self.request_bytes: int = 0
+        self.request_bytes_decompressed: int = 0
+        self.response_bytes: int = 0
+        self.response_bytes_uncompressed: int = 0
+
+    def observe(self, duration: float, status_code: int, record: RequestRecord) -> None:
+        self.requests += 1
+        if status_code >= 400:
+            self.errors += 1
+        self.duration_sum += duration
+        self.durations.append(duration)
+
+        self.request_bytes += record.request_bytes
+        self.response_bytes += record.response_bytes
+        if record.request_bytes_decompressed is not None:
+            self.request_bytes_decompressed += record.request_bytes_decompressed
+        else:
+            self.request_bytes_decompressed += record.request_bytes
+
+        if record.response_bytes_uncompressed is not None:
+            self.response_bytes_uncompressed += record.response_bytes_uncompressed
+        elif not record.response_compressed:
+            self.response_bytes_uncompressed += record.response_bytes
+
+    def quantiles(self, quantiles: Iterable[float]) -> List[Tuple[float, float]]:
+        """
+        Returns latency quantiles over the last window_size requests
+        """
+        durations = sorted(self.durations)
+        if not durations:
+            return []
+        return [
+            (
+                quantile,
+                durations[min(int(len(durations) * quantile), len(durations) - 1)],
+            )
+            for quantile in quantiles
+        ]
+
+
+RouteKey = Tuple[str, str]
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    QUANTILES: Tuple[float, ...] = (0.5, 0.95, 0.99)
+    PREFIX: str = "jetpy"
+
+    def __init__(self, window_size: int = 1024) -> None:
+        self.window_size = window_size
+        self.routes: Dict[RouteKey, RouteMetrics] = {}
+
+    def route(self, method: str, route: str) -> RouteMetrics:
+        key = (method, route)
+        if key not in self.routes:
+            self.routes[key] = RouteMetrics(window_size=self.window_size)
+        return self.routes[key]
+
+    def reset(self) -> None:
+        self.routes.clear()
+
+    def render(self) -> str:
+        """
+        Renders metrics in prometheus text format
+        """
+        lines: List[str] = []
+        routes = sorted(self.routes.items())
+
+        def counter(
+            name: str, help_: str, value: Callable[[RouteMetrics], float]
+        ) -> None:
+            self.__header(lines, name, help_, "counter")
+            for (method, route), metrics in routes:
+                lines.append(f"{name}{self.__labels(method, route)} {value(metrics)}")
+
+        name = f"{self.PREFIX}_request_duration_seconds"
+        self.__header(lines, name, "Request latency", "summary")
+        for (method, route), metrics in routes:
+            for quantile, duration in metrics.quantiles(self.QUANTILES):
+                labels = self.__labels(method, route, quantile=str(quantile))
+                lines.append(f"{name}{labels} {duration:.6f}")
+            labels = self.__labels(method, route)
+            lines.append(f"{name}_sum{labels} {metrics.duration_sum:.6f}")
+            lines.append(f"{name}_count{labels} {metrics.requests}")
+
+        counter(
+            f"{self.PREFIX}_request_errors_total",
+            "Responses with status code >= 400",
+            lambda metrics: metrics.errors,
+        )
+        counter(
+            f"{self.PREFIX}_request_body_bytes_total",
+            "Request body bytes as received",
+            lambda metrics: metrics.request_bytes,
+        )
+        counter(
+            f"{self.PREFIX}_request_body_decompressed_bytes_total",
+            "Request body bytes after zlib decompression",
+            lambda metrics: metrics.request_bytes_decompressed,
+        )
+        counter(
+            f"{self.PREFIX}_response_body_bytes_total",
+            "Response body bytes as sent",
+            lambda metrics: metrics.response_bytes,
+        )
+        counter(
+            f"{self.PREFIX}_response_body_uncompressed_bytes_total",
+            "Response body bytes before zlib compression",
+            lambda metrics: metrics.response_bytes_uncompressed,
+        )
+
+        name = f"{self.PREFIX}_requests_in_flight"
+        self.__header(lines, name, "Requests being processed", "gauge")
+        for (method, route), metrics in routes:
+            lines.append(f"{name}{self.__labels(method, route)} {metrics.in_flight}")
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def __header(lines: List[str], name: str, help_: str, type_: str) -> None:
+        lines.append(f"# HELP {name} {help_}")
+        lines.append(f"# TYPE {name} {type_}")
+
+    @staticmethod
+    def __labels(method: str, route: str, **extra: str) -> str:
+        labels = {"method": method, "route": route, **extra}
+        return (
+            "{"
+            + ",".join(
+                f'{key}="{_escape_label(value)}"' for key, value in labels.items()
+            )
+            + "}"
+        )
+
+
+metrics_registry = MetricsRegistry()
+
+
+class RouteResolver:
+    """
+    Resolves path template of route that would handle the request (e.g. /client/locale/{locale_name}),
+    so requests to the same route are grouped together
+    """
+
+    UNMATCHED_ROUTE: str = "<unmatched>"
+    CACHE_SIZE: int = 4096
+
+    def __init__(self, routes: Callable[[], List[BaseRoute]]) -> None:
+        self.routes = routes
+        self.__cache: Dict[RouteKey, str] = {}
+
+    def __call__(self, scope: Scope) -> str:
+        key = (scope["method"], scope["path"])
+        if key in self.__cache:
+            return self.__cache[key]
+
+        route_path = self.UNMATCHED_ROUTE
+        for route in self.routes():
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                route_path = getattr(route, "path", self.UNMATCHED_ROUTE)
+                break
+
+        if len(self.__cache) >= self.CACHE_SIZE:
+            self.__cache.clear()
+        self.__cache[key] = route_path
+        return route_path
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware that collects per route metrics into MetricsRegistry.
+    Should be the outermost middleware so latency includes whole request processing.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        routes: Callable[[], List[BaseRoute]],
+        registry: MetricsRegistry = metrics_registry,
+    ) -> None:
+        self.app = app
+        self.registry = registry
+        self.resolve_route = RouteResolver(routes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route_metrics = self.registry.route(scope["method"], self.resolve_route(scope))
+        record = RequestRecord()
+        token = _current_record.set(record)
+        status_code = 500
+
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                record.request_bytes += len(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                record.response_compressed = any(
+                    name.lower() == b"content-encoding"
+                    for name, _ in message.get("headers", [])
+                )
+            elif message["type"] == "http.response.body":
+                record.response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        route_metrics.in_flight += 1
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            route_metrics.in_flight -= 1
+            route_metrics.observe(
+                duration=time.perf_counter() - start_time,
+                status_code=status_code,
+                record=record,
+            )
+            _current_record.reset(token)
+
+
+def is_local_request(request: Request) -> bool:
+    return request.client is not None and request.client.host in (
+        "127.0.0.1",
+        "::1",
+        "localhost",
+    )
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    if not is_local_request(request):
+        return PlainTextResponse("Forbidden", status_code=403)
+    return PlainTextResponse(
+        metrics_registry.render(),
+        media_type="text/plain; version=0.0.4",
+    )
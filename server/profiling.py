@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import collections
+import contextvars
+import itertools
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Callable, Counter, Dict, Iterator, List, Optional, Set
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from server import logger
+from server.metrics import RouteResolver
+
+
+class ProfiledRequest:
+    """
+    Request watched by the profiler, collapsed stacks are collected while "sampling" is set
+    """
+
+    __slots__ = ("method", "route", "reason", "tags", "deadline", "sampling", "stacks")
+
+    def __init__(self, method: str, route: str, reason: str) -> None:
+        self.method = method
+        self.route = route
+        self.reason = reason
+        self.tags: List[str] = []
+        # Time (perf_counter) after which request is considered slow and sampling starts
+        self.deadline: Optional[float] = None
+        self.sampling: bool = False
+        self.stacks: Counter[str] = collections.Counter()
+
+    def root_frame(self) -> str:
+        root = f"{self.method} {self.route}"
+        if self.tags:
+            root += f" [{','.join(self.tags)}]"
+        return root
+
+
+_current_request: contextvars.ContextVar[
+    Optional[ProfiledRequest]
+] = contextvars.ContextVar("current_profiled_request", default=None)
+
+
+def tag_request(*tags: str) -> None:
+    """
+    Adds tags (e.g. inventory actions) to profile of current request, does nothing if request isn't profiled
+    """
+    request = _current_request.get()
+    if request is not None:
+        request.tags.extend(tag for tag in tags if tag not in request.tags)
+
+
+class StackSampler:
+    """
+    Statistical profiler, periodically takes stacks of all busy threads
+    and adds them to every request that is being sampled at the moment.
+
+    Samples aren't separated by request, so requests running concurrently with a profiled one
+    show up in its profile too. Server mostly serves a single client so it's rarely an issue.
+    """
+
+    # Innermost frames of threads that are waiting for work (event loop and threadpool workers)
+    IDLE_FRAMES: Set[str] = {"select", "_worker"}
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.__requests: Set[ProfiledRequest] = set()
+        self.__condition = threading.Condition()
+        self.__thread: Optional[threading.Thread] = None
+        self.__labels: Dict[CodeType, str] = {}
+
+    def add(self, request: ProfiledRequest) -> None:
+        with self.__condition:
+            self.__requests.add(request)
+            if self.__thread is None:
+                self.__thread = threading.Thread(
+                    target=self.__run, name="StackSampler", daemon=True
+                )
+                self.__thread.start()
+            self.__condition.notify()
+
+    def remove(self, request: ProfiledRequest) -> None:
+        with self.__condition:
+            self.__requests.discard(request)
+
+    def __run(self) -> None:
+        while True:
+            with self.__condition:
+                requests = self.__wait_for_requests()
+            stacks = list(self.sample())
+            with self.__condition:
+                # Request could have finished while we were sampling
+                for request in self.__requests.intersection(requests):
+                    request.stacks.update(stacks)
+            time.sleep(self.interval)
+
+    def __wait_for_requests(self) -> List[ProfiledRequest]:
+        """
+        Blocks until at least one request should be sampled and returns these requests
+        """
+        while True:
+            now = time.perf_counter()
+            for request in self.__requests:
+                if request.deadline is not None and request.deadline <= now:
+                    request.sampling = True
+            sampled = [request for request in self.__requests if request.sampling]
+            if sampled:
+                return sampled
+
+            deadlines = [
+                request.deadline
+                for request in self.__requests
+                if request.deadline is not None
+            ]
+            self.__condition.wait(timeout=min(deadlines) - now if deadlines else None)
+
+    def sample(self) -> Iterator[str]:
+        sampler_thread_id = threading.get_ident()
+        frames = sys._current_frames()  # pylint: disable=protected-access
+        for thread_id, frame in frames.items():
+            if thread_id == sampler_thread_id:
+                continue
+            if frame.f_code.co_name in self.IDLE_FRAMES:
+                continue
+            yield self.__collapse(frame)
+
+    def __collapse(self, frame: Optional[FrameType]) -> str:
+        labels = []
+        while frame is not None:
+            labels.append(self.__label(frame.f_code))
+            frame = frame.f_back
+        return ";".join(reversed(labels))
+
+    def __label(self, code: CodeType) -> str:
+        if code not in self.__labels:
+            path = Path(code.co_filename)
+            filename = "/".join(path.parts[-2:])
+            self.__labels[code] = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+        return self.__labels[code]
+
+
+class ProfilingMiddleware:
+    # pylint: disable=too-many-instance-attributes
+    """
+    ASGI middleware that profiles selected requests and dumps them into profiles_dir
+    as collapsed stacks (one "frame;frame;frame count" line per stack) that flamegraph tools can read.
+
+    Request is profiled if:
+    - it has the profiling header (e.g. X-Jet-Profile: 1)
+    - it's every sample_every'th request
+    - it runs longer than slow_threshold seconds, only the part after the threshold is sampled
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        routes: Callable[[], List[BaseRoute]],
+        profiles_dir: Path,
+        sample_every: int = 0,
+        slow_threshold: float = 0,
+        header: str = "X-Jet-Profile",
+        interval: float = 0.005,
+    ) -> None:
+        self.app = app
+        self.resolve_route = RouteResolver(routes)
+        self.profiles_dir = profiles_dir
+        self.sample_every = sample_every
+        self.slow_threshold = slow_threshold
+        self.header = header
+        self.sampler = StackSampler(interval=interval)
+        self.__counter = itertools.count(1)
+
+    def select_reason(self, scope: Scope) -> Optional[str]:
+        if self.header in Headers(scope=scope):
+            return "header"
+        if self.sample_every and next(self.__counter) % self.sample_every == 0:
+            return "sampled"
+        if self.slow_threshold:
+            return "slow"
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        reason = self.select_reason(scope) if scope["type"] == "http" else None
+        if reason is None:
+            await self.app(scope, receive, send)
+            return
+
+        request = ProfiledRequest(
+            method=scope["method"], route=self.resolve_route(scope), reason=reason
+        )
+        start_time = time.perf_counter()
+        if reason == "slow":
+            request.deadline = start_time + self.slow_threshold
+        else:
+            request.sampling = True
+
+        token = _current_request.set(request)
+        self.sampler.add(request)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.sampler.remove(request)
+            _current_request.reset(token)
+            if request.stacks:
+                await run_in_threadpool(
+                    self.dump, request, time.perf_counter() - start_time
+                )
+
+    def dump(self, request: ProfiledRequest, duration: float) -> Path:
+        self.profiles_dir.mkdir(parents=True, exist_ok=True)
+        route = re.sub(r"[^\w]+", "_", request.route).strip("_")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        path = self.profiles_dir.joinpath(
+            f"{timestamp}_{request.method}_{route}_{request.reason}.collapsed"
+        )
+
+        root = request.root_frame()
+        with path.open("w", encoding="utf8") as file:
+            for stack, count in request.stacks.most_common():
+                file.write(f"{root};{stack} {count}\n")
+
+        logger.info(f"Profiled {root} ({duration:.3f}s): {path}")
+        return path
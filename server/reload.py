@@ -0,0 +1,177 @@
+"""
+Reloading of repositories built from database files without restarting the server.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from dependency_injector import providers
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+
+from server import logger
+from server.metrics import is_local_request
+from server.responses import SourcesFingerprint, sources_fingerprint
+
+
+def swap_instance(provider: providers.Provider, instance: Any) -> None:
+    """
+    Makes provider return given instance.
+    Swap is a single assignment, so concurrent requests get either old or new instance.
+    """
+    overriding = provider.last_overriding
+    if isinstance(overriding, providers.Object):
+        overriding.set_provides(instance)
+    else:
+        provider.override(providers.Object(instance))
+
+
+def rebuild(provider: providers.Provider) -> None:
+    """
+    Builds new instance of singleton with it's own arguments and swaps it in,
+    dependencies are resolved again, so it picks up instances that were swapped before.
+    """
+    if not isinstance(provider, providers.BaseSingleton):
+        raise TypeError(f"Only singletons can be rebuilt, got {provider!r}")
+    instance = providers.Factory(provider.cls, *provider.args, **provider.kwargs)()
+    swap_instance(provider, instance)
+    # Singleton itself would keep old instance otherwise
+    provider.reset()
+
+
+@dataclass
+class ReloadTarget:
+    name: str
+    reload: Callable[[], Any]
+    sources: Tuple[Path, ...]
+    depends_on: Tuple[str, ...]
+    fingerprint: SourcesFingerprint
+
+
+class DatabaseReloader:
+    """
+    Reloads targets (repositories, caches) which source files were changed and targets that depend on them.
+    Every target builds new data aside and swaps it in, so requests are served with old data meanwhile.
+    Objects that were already handed out (loaded profiles for example) keep referencing old data.
+    """
+
+    def __init__(self) -> None:
+        self.targets: Dict[str, ReloadTarget] = {}
+        self.__lock = threading.Lock()
+        self.__thread: Optional[threading.Thread] = None
+
+    def add(
+        self,
+        name: str,
+        reload: Callable[[], Any],
+        *,
+        sources: Iterable[Path] = (),
+        depends_on: Iterable[str] = (),
+    ) -> None:
+        """
+        Registers reload target, targets are reloaded in order they were added,
+        so target should be added after targets it depends on.
+
+        :param name: Name of the target
+        :param reload: Function that rebuilds target
+        :param sources: Files or directories (not recursively) target is built from
+        :param depends_on: Names of targets which reload requires reload of this target
+        """
+        for dependency in depends_on:
+            if dependency not in self.targets:
+                raise ValueError(f"Reload target {dependency} is not registered")
+
+        sources = tuple(sources)
+        self.targets[name] = ReloadTarget(
+            name=name,
+            reload=reload,
+            sources=sources,
+            depends_on=tuple(depends_on),
+            fingerprint=sources_fingerprint(sources),
+        )
+
+    def changed(self) -> List[str]:
+        """
+        Returns names of targets which source files were changed since last reload
+        """
+        return [
+            target.name
+            for target in self.targets.values()
+            if target.sources
+            and sources_fingerprint(target.sources) != target.fingerprint
+        ]
+
+    def reload(self, names: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Reloads given targets (or changed ones) and every target that depends on them.
+
+        :return: Names of reloaded targets
+        """
+        with self.__lock:
+            scheduled = set(self.changed() if names is None else names)
+            unknown = scheduled - self.targets.keys()
+            if unknown:
+                raise KeyError(f"Unknown reload targets: {', '.join(sorted(unknown))}")
+
+            reloaded: List[str] = []
+            for target in self.targets.values():
+                if target.name not in scheduled and scheduled.isdisjoint(
+                    target.depends_on
+                ):
+                    continue
+                scheduled.add(target.name)
+
+                start_time = time.perf_counter()
+                fingerprint = sources_fingerprint(target.sources)
+                try:
+                    target.reload()
+                except Exception:  # pylint: disable=broad-except
+                    # Old data is still in place, target would be reloaded again on next change
+                    logger.exception(f"Reload of {target.name} failed")
+                    continue
+                target.fingerprint = fingerprint
+                reloaded.append(target.name)
+                duration = time.perf_counter() - start_time
+                logger.info(f"Reloaded {target.name} in {duration * 1000:.1f} ms")
+            return reloaded
+
+    def watch(self, interval: float) -> None:
+        """
+        Starts background thread that checks source files every interval seconds and reloads changed targets
+        """
+        if self.__thread is not None:
+            return
+        self.__thread = threading.Thread(
+            target=self.__watch, args=(interval,), name="db-reload", daemon=True
+        )
+        self.__thread.start()
+
+    def __watch(self, interval: float) -> None:
+        while True:
+            time.sleep(interval)
+            if self.changed():
+                self.reload()
+
+
+async def reload_endpoint(request: Request) -> Response:
+    """
+    Reloads targets given in "target" query parameters or all changed targets
+    """
+    if not is_local_request(request):
+        return PlainTextResponse("Forbidden", status_code=403)
+
+    names = request.query_params.getlist("target") or None
+    try:
+        reloaded = await run_in_threadpool(reloader.reload, names)
+    except KeyError as error:
+        return JSONResponse({"error": error.args[0]}, status_code=400)
+    return JSONResponse({"reloaded": reloaded})
+
+
+reloader = DatabaseReloader()
@@ -0,0 +1,163 @@
+"""
+Replays requests captured by RequestRecorder against a running server and reports latency per route.
+
+Usage:
+    python -m server.replay captures/<capture>.jsonl --url https://127.0.0.1:443 --concurrency 4
+    python -m server.replay captures/<capture>.jsonl --fast
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, DefaultDict, Iterable, List, Optional
+
+import requests
+import urllib3
+
+from server.capture import CapturedRequest, read_capture
+
+SessionFactory = Callable[[], requests.Session]
+
+
+class RouteReport:
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self) -> None:
+        self.latencies: List[float] = []
+        self.errors: int = 0
+
+    def quantile(self, quantile: float) -> float:
+        latencies = sorted(self.latencies)
+        return latencies[min(int(len(latencies) * quantile), len(latencies) - 1)]
+
+
+class ReplayReport:
+    def __init__(self) -> None:
+        self.routes: DefaultDict[str, RouteReport] = collections.defaultdict(
+            RouteReport
+        )
+        self.duration: float = 0
+        self.__lock = threading.Lock()
+
+    def add(self, route: str, latency: float, error: bool) -> None:
+        with self.__lock:
+            report = self.routes[route]
+            report.latencies.append(latency)
+            report.errors += error
+
+    def format(self) -> str:
+        header = f"{'route':<60} {'count':>6} {'errors':>6} {'req/s':>8}"
+        header += "".join(f" {f'p{int(q * 100)} ms':>9}" for q in RouteReport.QUANTILES)
+        lines = [header]
+
+        total = RouteReport()
+        for route, report in sorted(self.routes.items()):
+            total.latencies.extend(report.latencies)
+            total.errors += report.errors
+            lines.append(self.__format_row(route, report))
+        if total.latencies:
+            lines.append(self.__format_row("total", total))
+        return "\n".join(lines)
+
+    def __format_row(self, route: str, report: RouteReport) -> str:
+        throughput = len(report.latencies) / self.duration if self.duration else 0
+        row = f"{route:<60} {len(report.latencies):>6} {report.errors:>6} {throughput:>8.1f}"
+        row += "".join(
+            f" {report.quantile(q) * 1000:>9.1f}" for q in RouteReport.QUANTILES
+        )
+        return row
+
+
+def _make_session() -> requests.Session:
+    # Server uses self-signed certificate
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    session = requests.Session()
+    session.verify = False
+    return session
+
+
+def replay(
+    captured_requests: Iterable[CapturedRequest],
+    url: str,
+    concurrency: int = 1,
+    speed: Optional[float] = 1.0,
+    session_factory: SessionFactory = _make_session,
+) -> ReplayReport:
+    """
+    Sends captured requests to the server.
+
+    :param url: Server root url
+    :param concurrency: Maximum amount of requests sent at the same time
+    :param speed: Pacing relative to the capture (2.0 - twice as fast), None sends requests as fast as possible
+    :param session_factory: Creates http session for every worker thread
+    """
+    report = ReplayReport()
+    local = threading.local()
+    url = url.rstrip("/")
+
+    def send(request: CapturedRequest) -> None:
+        if not hasattr(local, "session"):
+            local.session = session_factory()
+        # Game client always compresses request bodies
+        body = zlib.compress(request.body) if request.body else None
+
+        start_time = time.perf_counter()
+        try:
+            response = local.session.request(
+                request.method,
+                url + request.path,
+                data=body,
+                cookies=request.cookies,
+            )
+            error = response.status_code >= 400
+        except requests.RequestException:
+            error = True
+        report.add(request.route, time.perf_counter() - start_time, error)
+
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for request in captured_requests:
+            if speed is not None:
+                delay = start_time + request.offset / speed - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            executor.submit(send, request)
+    report.duration = time.perf_counter() - start_time
+    return report
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Replays captured client requests")
+    parser.add_argument("capture", type=Path, help="Capture file written by server")
+    parser.add_argument("--url", default="https://127.0.0.1:443")
+    parser.add_argument("--concurrency", type=int, default=1)
+    pacing = parser.add_mutually_exclusive_group()
+    pacing.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Pacing relative to the capture, 2.0 replays twice as fast",
+    )
+    pacing.add_argument(
+        "--fast", action="store_true", help="Send requests as fast as possible"
+    )
+    args = parser.parse_args(argv)
+
+    report = replay(
+        read_capture(args.capture),
+        url=args.url,
+        concurrency=args.concurrency,
+        speed=None if args.fast else args.speed,
+    )
+    print(report.format())
+    print(f"Replayed in {report.duration:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,176 @@
+import asyncio
+import functools
 import zlib
-from typing import Callable
+from typing import Any, AsyncIterator, Callable, List, Optional, Type
 
-from fastapi import Request, Response
+import orjson
+from fastapi import HTTPException, Request, Response
+from fastapi.datastructures import DefaultPlaceholder
 from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
 from starlette.datastructures import MutableHeaders
 
+from server.capture import RequestRecorder
+from server.metrics import record_request_body
+from server.responses import ZLibTrustedResponse
+
+
+def _is_zlib_header(data: bytes) -> bool:
+    """
+    Checks if data starts with zlib header (deflate compression method and valid header checksum)
+    """
+    return len(data) >= 2 and data[0] & 0x0F == 8 and (data[0] << 8 | data[1]) % 31 == 0
+
 
 class ZLibRequest(Request):
     # pylint: disable=too-many-ancestors, attribute-defined-outside-init
+
+    # Requests with decompressed body bigger than that are rejected
+    max_body_size: int = 64 * 1024 * 1024
+    # Bodies bigger than that (by Content-Length) are decompressed in threadpool
+    threadpool_threshold: int = 256 * 1024
+
     async def body(self) -> bytes:
         if not hasattr(self, "_body"):
-            body = await super().body()
-            try:
-                self._body = zlib.decompress(body)
-                headers = MutableHeaders(raw=self.scope["headers"])
-                headers["Content-Length"] = str(len(self._body))
-            except zlib.error:
-                self._body = body
+            self._body = await self.__read_body()
+            headers = MutableHeaders(raw=self.scope["headers"])
+            headers["Content-Length"] = str(len(self._body))
+            record_request_body(len(self._body))
         return self._body
 
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+    def __in_threadpool(self) -> bool:
+        try:
+            content_length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            return False
+        return content_length >= self.threadpool_threshold
+
+    async def __read_body(self) -> bytes:
+        """
+        Reads body chunk by chunk decompressing it on the fly,
+        if body is not compressed it's returned as is
+        """
+        decompressor = zlib.decompressobj()
+        in_threadpool = self.__in_threadpool()
+        chunks: List[bytes] = []
+        body_size = 0
+        # None until first chunk (with whole zlib header) is received
+        compressed: Optional[bool] = None
+
+        async for chunk in self.__stream_with_head():
+            if compressed is None:
+                compressed = _is_zlib_header(chunk)
+
+            if compressed:
+                # Decompress one byte more than allowed, so we know that limit is exceeded
+                max_length = self.max_body_size - body_size + 1
+                try:
+                    if in_threadpool:
+                        chunk = await run_in_threadpool(
+                            decompressor.decompress, chunk, max_length
+                        )
+                    else:
+                        chunk = decompressor.decompress(chunk, max_length)
+                except zlib.error as error:
+                    raise HTTPException(
+                        status_code=400, detail="Malformed zlib body"
+                    ) from error
+
+            body_size += len(chunk)
+            if body_size > self.max_body_size or decompressor.unconsumed_tail:
+                raise HTTPException(status_code=413, detail="Request body is too large")
+            chunks.append(chunk)
+
+        if compressed and not decompressor.eof:
+            raise HTTPException(status_code=400, detail="Incomplete zlib body")
+
+        return b"".join(chunks)
+
+    async def __stream_with_head(self) -> AsyncIterator[bytes]:
+        """
+        Yields non-empty body chunks, first chunk is long enough to contain zlib header
+        (small chunks are joined) unless whole body is shorter than that
+        """
+        head: Optional[bytes] = b""
+        async for chunk in self.stream():
+            if not chunk:
+                continue
+            if head is not None:
+                head += chunk
+                if len(head) < 2:
+                    continue
+                chunk, head = head, None
+            yield chunk
+
+        if head:
+            yield head
+
 
 class ZLibRoute(APIRoute):
+    # Validate responses of routes with ZLibTrustedResponse against response_model anyway, for debugging
+    validate_trusted_responses: bool = False
+    # Records every request when set (capture mode)
+    recorder: Optional[RequestRecorder] = None
+
     def get_route_handler(self) -> Callable:
+        response_class: Type[Response]
+        if isinstance(self.response_class, DefaultPlaceholder):
+            response_class = self.response_class.value
+        else:
+            response_class = self.response_class
+        if issubclass(response_class, ZLibTrustedResponse):
+            call = self.dependant.call
+            assert call is not None
+            self.dependant.call = self.__trusted_call(call, response_class)
+
         original_route_handler = super().get_route_handler()
 
         async def custom_route_handler(request: Request) -> Response:
             request = ZLibRequest(request.scope, request.receive)
+            if self.recorder is not None:
+                self.recorder.record(
+                    request, route=self.path, body=await request.body()
+                )
             return await original_route_handler(request)
 
         return custom_route_handler
+
+    def __trusted_call(
+        self, call: Callable, response_class: Type[ZLibTrustedResponse]
+    ) -> Callable:
+        """
+        Wraps endpoint so it returns ZLibTrustedResponse,
+        fastapi sends Response instances as is, skipping response_model validation and serialization
+        """
+
+        def make_response(content: Any) -> Any:
+            if isinstance(content, Response) or self.validate_trusted_responses:
+                return content
+            return response_class(
+                content,
+                status_code=self.status_code or 200,
+                include=self.response_model_include,
+                exclude=self.response_model_exclude,
+                exclude_unset=self.response_model_exclude_unset,
+                exclude_defaults=self.response_model_exclude_defaults,
+                exclude_none=self.response_model_exclude_none,
+            )
+
+        if asyncio.iscoroutinefunction(call):
+
+            @functools.wraps(call)
+            async def async_trusted_call(*args: Any, **kwargs: Any) -> Any:
+                return make_response(await call(*args, **kwargs))
+
+            return async_trusted_call
+
+        @functools.wraps(call)
+        def trusted_call(*args: Any, **kwargs: Any) -> Any:
+            return make_response(call(*args, **kwargs))
+
+        return trusted_call
@@ -1,7 +1,21 @@
+import inspect
+import os
+import threading
+import time
 import typing
 import zlib
+from pathlib import Path, PurePath
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
 
+import orjson
+import pydantic
 from fastapi.responses import ORJSONResponse
+from starlette.background import BackgroundTask
+from starlette.responses import Response, StreamingResponse
+
+from server.mapped import MappedFiles
+from server.metrics import record_response_body
+from server.snapshot import Snapshot, snapshots_dir
 
 
 class ZLibORJSONResponse(ORJSONResponse):
@@ -15,4 +29,415 @@ class ZLibORJSONResponse(ORJSONResponse):
 
     def render(self, content: dict) -> bytes:
         self.init_headers({"Content-Encoding": "deflate"})
-        return zlib.compress(super().render(content))
+        body = super().render(content)
+        record_response_body(len(body))
+        return zlib.compress(body)
+
+
+class ZLibTrustedResponse(ZLibORJSONResponse):
+    """
+    Response for routes that return already built (and validated) models or plain dicts.
+    Content is dumped with orjson as is, without validating it against response_model again,
+    response_model is still used for the docs.
+    ZLibRoute creates it with route's response_model_* options, see ZLibRoute.validate_trusted_responses.
+    """
+
+    def __init__(
+        self,
+        content: Any = None,
+        status_code: int = 200,
+        headers: dict = None,
+        media_type: str = None,
+        background: BackgroundTask = None,
+        *,
+        include: Any = None,
+        exclude: Any = None,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+    ) -> None:
+        self.dict_options = dict(
+            include=include,
+            exclude=exclude,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+        )
+        super().__init__(
+            content=content,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            background=background,
+        )
+
+    def render(self, content: Any) -> bytes:
+        self.init_headers({"Content-Encoding": "deflate"})
+        if isinstance(content, pydantic.BaseModel):
+            content = content.dict(by_alias=True, **self.dict_options)
+            if "__root__" in content:
+                content = content["__root__"]
+        body = orjson.dumps(content, default=orjson_default)
+        record_response_body(len(body))
+        return zlib.compress(body)
+
+
+# Response body, memoryview is used for bodies mapped from files
+Body = Union[bytes, memoryview]
+
+
+class ZLibPreparedResponse(Response):
+    """
+    Response with a body that is already deflated, sent as is
+    """
+
+    media_type = "application/json"
+
+    def init_headers(self, headers: typing.Mapping[str, str] = None) -> None:
+        headers = {**(headers or {}), "Content-Encoding": "deflate"}
+        super().init_headers(headers)
+
+    def render(self, content: Body) -> Body:  # type: ignore
+        return content
+
+
+def orjson_default(obj: Any) -> Any:
+    """
+    Fallback for objects orjson can't serialize by itself, mirrors what fastapi's jsonable_encoder does
+    """
+    if isinstance(obj, pydantic.BaseModel):
+        obj_dict = obj.dict(by_alias=True)
+        if "__root__" in obj_dict:
+            return obj_dict["__root__"]
+        return obj_dict
+    if isinstance(obj, PurePath):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def iter_json_chunks(content: Any, split_depth: int = 2) -> Iterator[bytes]:
+    """
+    Serializes content into json piece by piece,
+    dicts, lists and models up to split_depth levels deep are serialized item by item.
+    Concatenated chunks are the same as orjson.dumps(content) output.
+    """
+    if split_depth > 0:
+        if (
+            isinstance(content, pydantic.BaseModel)
+            and "__root__" not in content.__fields__
+        ):
+            fields = content.__fields__
+            content = {
+                fields[name].alias if name in fields else name: value
+                for name, value in content
+            }
+
+        if isinstance(content, dict) and content:
+            separator = b"{"
+            for key, value in content.items():
+                if not isinstance(key, str):
+                    raise TypeError(f"Dict key must be str, not {type(key).__name__}")
+                yield separator + orjson.dumps(key) + b":"
+                yield from iter_json_chunks(value, split_depth - 1)
+                separator = b","
+            yield b"}"
+            return
+
+        if isinstance(content, (list, tuple)) and content:
+            separator = b"["
+            for value in content:
+                yield separator
+                yield from iter_json_chunks(value, split_depth - 1)
+                separator = b","
+            yield b"]"
+            return
+
+    yield orjson.dumps(content, default=orjson_default)
+
+
+class ZLibORJSONStreamingResponse(StreamingResponse):
+    """
+    Streaming counterpart of ZLibORJSONResponse for big responses (locations, bots).
+    Json is serialized in chunks and fed into single zlib compressor,
+    so whole json document never sits in memory and first bytes are sent before serialization ends.
+    Resulting zlib stream is the same as ZLibORJSONResponse would produce.
+    """
+
+    media_type = "application/json"
+    chunk_size: int = 64 * 1024
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: dict = None,
+        media_type: str = None,
+        background: BackgroundTask = None,
+    ) -> None:
+        super().__init__(
+            content=self.iter_deflated(content),
+            status_code=status_code,
+            headers={**(headers or {}), "Content-Encoding": "deflate"},
+            media_type=media_type,
+            background=background,
+        )
+
+    def iter_deflated(self, content: Any) -> Iterator[bytes]:
+        compressor = zlib.compressobj()
+        buffer = bytearray()
+        size = 0
+        for chunk in iter_json_chunks(content):
+            size += len(chunk)
+            buffer += compressor.compress(chunk)
+            if len(buffer) >= self.chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+
+        buffer += compressor.flush()
+        record_response_body(size)
+        yield bytes(buffer)
+
+
+class DeflatedDocument:
+    """
+    zlib stream of a json document that is left open at the end.
+    Static head is compressed once, small tail (per request fields) is compressed on every finish call
+    and spliced to the head, adler32 checksum is continued from the head so the result is a regular zlib stream.
+    """
+
+    def __init__(self, head: bytes) -> None:
+        compressor = zlib.compressobj()
+        self.head: bytes = compressor.compress(head) + compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+        self.checksum: int = zlib.adler32(head)
+        self.size: int = len(head)
+
+    def finish(self, tail: bytes = b"") -> bytes:
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        deflated_tail = compressor.compress(tail) + compressor.flush()
+        checksum = zlib.adler32(tail, self.checksum)
+        return b"".join((self.head, deflated_tail, checksum.to_bytes(4, "big")))
+
+
+SourcesFingerprint = Tuple[Tuple[str, int, int], ...]
+
+
+def sources_fingerprint(sources: Iterable[Path]) -> SourcesFingerprint:
+    """
+    Returns (path, mtime, size) of every source file,
+    directories are expanded (not recursively) so added/removed/changed files are noticed too
+    """
+    fingerprint = []
+    for source in sources:
+        paths = [source]
+        if source.is_dir():
+            paths.extend(sorted(Path(entry.path) for entry in os.scandir(source)))
+        for path in paths:
+            try:
+                stat = path.stat()
+                fingerprint.append((str(path), stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                fingerprint.append((str(path), 0, 0))
+    return tuple(fingerprint)
+
+
+class CachedResponse:
+    # pylint: disable=too-many-instance-attributes
+    _SUCCESS_HEAD: bytes = b'{"err":0,"errmsg":null,"data":'
+
+    def __init__(
+        self,
+        builder: Callable[[], Any],
+        sources: Iterable[Path],
+        dynamic_fields: Optional[Callable[[], dict]],
+        check_interval: float,
+        snapshot: Optional[Snapshot] = None,
+        store_body: Callable[[bytes], Body] = None,
+    ) -> None:
+        self.builder = builder
+        self.sources = tuple(sources)
+        self.dynamic_fields = dynamic_fields
+        self.check_interval = check_interval
+        self.snapshot = snapshot
+        self.store_body = store_body
+
+        self.lock = threading.Lock()
+        self.document: Optional[DeflatedDocument] = None
+        self.body: Optional[Body] = None
+        self.fingerprint: SourcesFingerprint = ()
+        self.checked_at: float = 0
+
+    def invalidate(self) -> None:
+        with self.lock:
+            self.document = None
+            self.body = None
+
+    def is_stale(self) -> bool:
+        now = time.monotonic()
+        if now - self.checked_at < self.check_interval:
+            return False
+        self.checked_at = now
+        return sources_fingerprint(self.sources) != self.fingerprint
+
+    def build(self) -> Tuple[DeflatedDocument, Optional[Body]]:
+        fingerprint = sources_fingerprint(self.sources)
+        body: Optional[Body]
+        if self.snapshot is not None:
+            document, body = self.snapshot.get_or_build(self.build_document)
+        else:
+            document, body = self.build_document()
+        if body is not None and self.store_body is not None:
+            body = self.store_body(body)
+
+        self.document, self.body = document, body
+        self.fingerprint = fingerprint
+        self.checked_at = time.monotonic()
+        return document, body
+
+    def build_document(self) -> Tuple[DeflatedDocument, Optional[bytes]]:
+        data = self.builder()
+
+        body: Optional[bytes] = None
+        if self.dynamic_fields is None:
+            document = DeflatedDocument(self._SUCCESS_HEAD + self._dumps(data) + b"}")
+            body = document.finish()
+            # Only size of the document is used when body is ready, head would take as much memory as body
+            document.head = b""
+        else:
+            if not isinstance(data, dict):
+                raise TypeError("Response with dynamic fields should be a dict")
+            # Dynamic fields are always placed at the end of "data" object
+            for key in self.dynamic_fields():
+                data.pop(key, None)
+            # Leave "data" object open, closing bracket will be sent with dynamic fields
+            document = DeflatedDocument(self._SUCCESS_HEAD + self._dumps(data)[:-1])
+        return document, body
+
+    def render(self) -> Body:
+        document, body = self.document, self.body
+        if document is None or self.is_stale():
+            with self.lock:
+                # Other thread could have rebuilt the response while we were waiting
+                document, body = self.document, self.body
+                if (
+                    document is None
+                    or sources_fingerprint(self.sources) != self.fingerprint
+                ):
+                    document, body = self.build()
+
+        if body is not None:
+            record_response_body(document.size)
+            return body
+
+        assert self.dynamic_fields is not None
+        fields = self.dynamic_fields()
+        separator = b"," if document.size > len(self._SUCCESS_HEAD) + 1 else b""
+        tail = (separator + self._dumps(fields)[1:] if fields else b"}") + b"}"
+        record_response_body(document.size + len(tail))
+        return document.finish(tail)
+
+    @staticmethod
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, default=orjson_default)
+
+
+class ResponseCache:
+    """
+    Cache of final (serialized and deflated) response bodies.
+    Used by routes which data rarely changes, but is big and requested by every client (items, globals, locales).
+    Bodies of responses built from source files are saved into snapshots_dir (if given)
+    and reused until sources change, see "python -m server.dbcompile".
+    Bodies bigger than mapped_threshold are kept in mapped_files instead of heap (if set).
+    """
+
+    def __init__(self, check_interval: float = 2.0, snapshots_dir: Path = None) -> None:
+        self.check_interval = check_interval
+        self.snapshots_dir = snapshots_dir
+        self.mapped_files: Optional[MappedFiles] = None
+        self.mapped_threshold: int = 0
+        self.__responses: Dict[str, CachedResponse] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__responses
+
+    def register(
+        self,
+        key: str,
+        builder: Callable[[], Any],
+        *,
+        sources: Iterable[Path] = (),
+        dynamic_fields: Callable[[], dict] = None,
+        code: Iterable[Path] = (),
+    ) -> None:
+        """
+        Registers response that would be built on first use.
+
+        :param key: Name of the response, usually a route path
+        :param builder: Function that returns response data
+        :param sources: Files or directories response is built from (including configs builder reads),
+            response is rebuilt when they change
+        :param dynamic_fields: Function that returns per request fields of response data
+        :param code: Source files of functions builder calls, module of the builder itself is always included
+        """
+        sources = tuple(sources)
+        snapshot: Optional[Snapshot] = None
+        if self.snapshots_dir is not None and sources:
+            snapshot = Snapshot(
+                path=self.snapshots_dir.joinpath(
+                    f"{key.strip('/').replace('/', '.')}.pickle"
+                ),
+                sources=sources,
+                # Builder could be wrapped (by @inject for example), snapshot should depend on it's own module
+                code=[
+                    Path(__file__),
+                    Path(inspect.getfile(inspect.unwrap(builder))),
+                    *code,
+                ],
+            )
+        self.__responses[key] = CachedResponse(
+            builder=builder,
+            sources=sources,
+            dynamic_fields=dynamic_fields,
+            check_interval=self.check_interval,
+            snapshot=snapshot,
+            store_body=lambda body: self.__store_body(key, body),
+        )
+
+    def __store_body(self, key: str, body: bytes) -> Body:
+        if self.mapped_files is None or len(body) < self.mapped_threshold:
+            return body
+        return self.mapped_files.map(key.strip("/").replace("/", "."), body)
+
+    def render(self, key: str) -> Body:
+        return self.__responses[key].render()
+
+    def response(self, key: str) -> ZLibPreparedResponse:
+        return ZLibPreparedResponse(content=self.render(key))
+
+    def invalidate(self, key: str = None) -> None:
+        """
+        Drops cached body of response with given key or of every response if key is None
+        """
+        keys = [key] if key is not None else list(self.__responses)
+        for response_key in keys:
+            self.__responses[response_key].invalidate()
+
+    def snapshots(self) -> Dict[str, Snapshot]:
+        return {
+            key: response.snapshot
+            for key, response in self.__responses.items()
+            if response.snapshot is not None
+        }
+
+    def warmup(self) -> None:
+        """
+        Builds every registered response that wasn't built yet
+        """
+        for response_key in list(self.__responses):
+            self.render(response_key)
+
+
+response_cache = ResponseCache(snapshots_dir=snapshots_dir.joinpath("responses"))
@@ -0,0 +1,119 @@
+"""
+Binary snapshots of data that is expensive to build (parsed and validated templates).
+"""
+
+from __future__ import annotations
+
+import gc
+import hashlib
+import os
+import pickle
+import platform
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+import pydantic
+
+from server import logger, root_dir
+
+T = TypeVar("T")
+
+snapshots_dir = root_dir.joinpath("cache")
+
+
+class Snapshot:
+    """
+    Pickled data with key in the header, key is a hash of source files and code files data is built with.
+    Snapshot with different key is ignored, so it's rebuilt after any change in database or models.
+    """
+
+    KEY_SIZE = 32
+
+    def __init__(
+        self,
+        path: Path,
+        sources: Iterable[Path],
+        code: Iterable[Path],
+    ) -> None:
+        """
+        :param path: Path of snapshot file
+        :param sources: Files or directories (not recursively) data is built from
+        :param code: Source files of models that are pickled
+        """
+        self.path = path
+        self.sources = list(sources)
+        self.code = list(code)
+
+    def key(self) -> bytes:
+        digest = hashlib.blake2b(digest_size=self.KEY_SIZE)
+        # Pickled models could be incompatible with other interpreter and pydantic versions
+        digest.update(platform.python_version().encode())
+        digest.update(pydantic.VERSION.encode())
+        for path in self.__files():
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+        return digest.digest()
+
+    def __files(self) -> Iterable[Path]:
+        for source in [*self.sources, *self.code]:
+            if source.is_dir():
+                yield from sorted(path for path in source.iterdir() if path.is_file())
+            else:
+                yield source
+
+    def is_fresh(self) -> bool:
+        """
+        Returns True if snapshot exists and was built from current sources and code
+        """
+        try:
+            with self.path.open("rb") as file:
+                return file.read(self.KEY_SIZE) == self.key()
+        except FileNotFoundError:
+            return False
+
+    def load(self, key: bytes) -> Optional[Any]:
+        """
+        Returns snapshot data or None if snapshot doesn't exist or it's key doesn't match
+        """
+        try:
+            with self.path.open("rb") as file:
+                if file.read(self.KEY_SIZE) != key:
+                    return None
+                data = file.read()
+        except FileNotFoundError:
+            return None
+
+        # Collector would run many times while unpickling thousands of objects, for nothing
+        gc.disable()
+        try:
+            return pickle.loads(data)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception(f"Snapshot {self.path} is broken")
+            return None
+        finally:
+            gc.enable()
+
+    def dump(self, key: bytes, data: Any) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Written into temporary file first, so other process won't read partially written snapshot
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("wb") as file:
+            file.write(key)
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+
+    def get_or_build(self, builder: Callable[[], T]) -> T:
+        """
+        Loads data from snapshot or builds it and saves new snapshot
+        """
+        key = self.key()
+        data = self.load(key)
+        if data is not None:
+            return data
+
+        data = builder()
+        try:
+            self.dump(key, data)
+        except OSError:
+            logger.exception(f"Can not write snapshot {self.path}")
+        return data
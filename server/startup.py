@@ -0,0 +1,178 @@
+"""
+Startup report (import time of server modules, time of initialization steps) and background warm-up.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.abc
+import sys
+import threading
+import time
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from server import logger, root_dir
+
+
+class StartupReport:
+    def __init__(self) -> None:
+        # Module name to import time, excluding time of nested timed imports
+        self.imports: Dict[str, float] = {}
+        # Initialization step name to it's duration
+        self.steps: Dict[str, float] = {}
+        self.__lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self.__lock:
+                self.steps[name] = time.perf_counter() - start_time
+
+    def add_import(self, module_name: str, duration: float) -> None:
+        with self.__lock:
+            self.imports[module_name] = duration
+
+    def format(self, limit: int = 10) -> str:
+        lines = [f"Imports: {sum(self.imports.values()):.2f}s, slowest modules:"]
+        slowest = sorted(self.imports.items(), key=lambda pair: pair[1], reverse=True)
+        lines.extend(
+            f"    {module_name:<50} {duration * 1000:>8.1f} ms"
+            for module_name, duration in slowest[:limit]
+        )
+        lines.append("Initialization steps:")
+        lines.extend(
+            f"    {name:<50} {duration * 1000:>8.1f} ms"
+            for name, duration in self.steps.items()
+        )
+        return "\n".join(lines)
+
+
+class _TimedLoader(importlib.abc.Loader):
+    def __init__(self, loader: Any, timer: ImportTimer) -> None:
+        self.loader = loader
+        self.timer = timer
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        with self.timer.measure(module.__name__):
+            self.loader.exec_module(module)
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self.loader, item)
+
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    """
+    Measures execution time of modules located in given directory (server, tarkov, mods).
+    Time of third party modules is counted towards the module that imported them.
+    """
+
+    def __init__(self, report: StartupReport, directory: Path) -> None:
+        self.report = report
+        self.directory = str(directory)
+        self.__local = threading.local()
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[ModuleType] = None,
+    ) -> Optional[ModuleSpec]:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if (
+                spec.origin
+                and spec.origin.startswith(self.directory)
+                and hasattr(spec.loader, "exec_module")
+            ):
+                spec.loader = _TimedLoader(spec.loader, self)
+            return spec
+        return None
+
+    @contextlib.contextmanager
+    def measure(self, module_name: str) -> Iterator[None]:
+        # Stack of [start time, time of nested imports]
+        stack: List[List[float]] = self.__local.__dict__.setdefault("stack", [])
+        stack.append([time.perf_counter(), 0.0])
+        try:
+            yield
+        finally:
+            start_time, nested_time = stack.pop()
+            duration = time.perf_counter() - start_time
+            if stack:
+                stack[-1][1] += duration
+            self.report.add_import(module_name, duration - nested_time)
+
+
+class Warmup:
+    """
+    Runs initialization tasks (building repositories, caches) in a background thread
+    so server can start accepting connections right away.
+    """
+
+    def __init__(self, report: StartupReport) -> None:
+        self.report = report
+        self.tasks: List[Tuple[str, Callable[[], Any]]] = []
+        self.ready = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    def add(self, name: str, task: Callable[[], Any]) -> None:
+        self.tasks.append((name, task))
+
+    def start(self) -> None:
+        if self.__thread is not None:
+            return
+        self.__thread = threading.Thread(target=self.run, name="warmup", daemon=True)
+        self.__thread.start()
+
+    def run(self) -> None:
+        for name, task in self.tasks:
+            with self.report.step(name):
+                try:
+                    task()
+                except Exception:  # pylint: disable=broad-except
+                    # Task would be done on first use anyway, it shouldn't stop other ones
+                    logger.exception(f"Warm-up task {name} failed")
+        self.ready.set()
+        logger.info(f"Server is ready\n{self.report.format()}")
+
+
+startup_report = StartupReport()
+import_timer = ImportTimer(startup_report, root_dir)
+warmup = Warmup(startup_report)
+
+
+async def ready_endpoint(
+    request: Request,
+) -> Response:  # pylint: disable=unused-argument
+    """
+    Readiness probe, responds with 503 until warm-up is done
+    """
+    is_ready = warmup.ready.is_set()
+    return JSONResponse(
+        {"ready": is_ready, "steps": dict(startup_report.steps)},
+        status_code=200 if is_ready else 503,
+    )
@@ -1,10 +1,11 @@
 import random
 import string
 from pathlib import Path
-from typing import Any
+from typing import Any, Type
 
 from fastapi import APIRouter
 from fastapi.requests import Request
+from starlette.responses import Response
 
 from server.requests import ZLibRoute
 from server.responses import ZLibORJSONResponse
@@ -30,8 +31,10 @@ def get_request_url_root(request: Request) -> str:
     return f'{str(request.base_url).rstrip("/")}:443'
 
 
-def make_router(**kwargs: Any) -> APIRouter:
+def make_router(
+    default_response_class: Type[Response] = ZLibORJSONResponse, **kwargs: Any
+) -> APIRouter:
     router = APIRouter(**kwargs)
-    router.default_response_class = ZLibORJSONResponse
+    router.default_response_class = default_response_class
     router.route_class = ZLibRoute
     return router
@@ -9,7 +9,7 @@ from tarkov.inventory.helpers import (
     generate_item_id,
     regenerate_items_ids,
 )
-from tarkov.inventory.inventory import MutableInventory
+from tarkov.inventory.inventory import InventoryItems, MutableInventory
 from tarkov.inventory.models import InventoryModel, Item
 from tarkov.inventory.types import ItemId, TemplateId
 
@@ -18,7 +18,7 @@ class BotInventory(MutableInventory):
     def __init__(self, bot_inventory: dict):
         super().__init__()
         self.inventory: InventoryModel = parse_obj_as(InventoryModel, bot_inventory)
-        self.__items: Dict[ItemId, Item] = {i.id: i for i in self.inventory.items}
+        self.__items: InventoryItems = InventoryItems(self, self.inventory.items)
 
     @staticmethod
     def make_empty() -> BotInventory:
@@ -59,7 +59,11 @@ class BotInventory(MutableInventory):
         return self.__items
 
     def regenerate_ids(self) -> None:
-        regenerate_items_ids(list(self.items.values()))
+        items = list(self.items.values())
+        # Ids are changed in place, items are removed first and indexed again by their new ids
+        self.__items = InventoryItems(self)
+        regenerate_items_ids(items)
+        self.__items = InventoryItems(self, items)
 
         equipment_item = self.get_by_template(TemplateId("55d7217a4bdc2d86028b456d"))
         self.inventory.equipment = equipment_item.id
@@ -8,6 +8,7 @@ from tarkov.exceptions import NoSpaceError
 from tarkov.inventory.factories import ItemFactory
 from tarkov.inventory.models import Item, ItemTemplate
 from tarkov.inventory.prop_models import StackableItemProps
+from tarkov.inventory.types import TemplateId
 from ._base import BaseLootGenerator
 
 
@@ -35,12 +36,13 @@ class LooseLootGenerator(BaseLootGenerator):
         slot_id: str,
         item_factory: ItemFactory = Provide[AppContainer.items.factory],
     ) -> Tuple[Item, List[Item]]:
-        templates: List[ItemTemplate] = [
-            self.templates_repository.get_template(tpl)
-            for tpl in self.preset.inventory["items"][slot_id]
-        ]
-        templates_chances: List[float] = [t.props.SpawnChance for t in templates]
-        template: ItemTemplate = random.choices(templates, templates_chances, k=1)[0]
+        templates: List[TemplateId] = self.preset.inventory["items"][slot_id]
+        templates_chances: List[
+            float
+        ] = self.templates_repository.columns.spawn_chances(templates)
+        template: ItemTemplate = self.templates_repository.get_template(
+            random.choices(templates, templates_chances, k=1)[0]
+        )
 
         # If item is stackable then we have to generate count for it
         if isinstance(template.props, StackableItemProps):
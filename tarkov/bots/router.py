@@ -6,12 +6,16 @@ from fastapi.params import Depends
 from fastapi.requests import Request
 
 from server import db_dir, logger
+from server.responses import ZLibORJSONStreamingResponse
 from server.utils import make_router
 from tarkov.bots.container import BotContainer
 from tarkov.bots.generator import BotGenerator
 from tarkov.models import TarkovSuccessResponse
 
-bots_router = make_router(tags=["Bots"])
+bots_router = make_router(
+    tags=["Bots"],
+    default_response_class=ZLibORJSONStreamingResponse,
+)
 
 
 @bots_router.get("/singleplayer/settings/bot/difficulty/{bot_type}/{difficulty}")
@@ -36,7 +40,7 @@ def settings_bot_limit(bot_type: str) -> int:  # pylint: disable=unused-argument
 async def generate_bots(
     request: Request,
     bot_generator: BotGenerator = Depends(Provide[BotContainer.bot_generator]),
-) -> TarkovSuccessResponse[List[dict]]:
+) -> ZLibORJSONStreamingResponse:
     bots: List[dict] = []
     request_data: dict = await request.json()
 
@@ -48,4 +52,5 @@ async def generate_bots(
             bot = bot_generator.generate(bot_role="assault")
             bots.append(bot)
 
-    return TarkovSuccessResponse(data=bots)
+    # Return response directly, so it's not copied by fastapi's jsonable_encoder
+    return ZLibORJSONStreamingResponse(TarkovSuccessResponse(data=bots))
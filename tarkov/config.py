@@ -31,3 +31,53 @@ class TradersConfig(BaseConfig):
 
     fence_assort_size: int = 200
     assort_refresh_time_sec: int = int(timedelta(minutes=30).total_seconds())
+
+
+class ServerConfig(BaseConfig):
+    __config_path__: ClassVar[Path] = config_dir.joinpath("server.yaml")
+
+    # Requests with decompressed body bigger than that are rejected
+    max_request_body_size: int = 64 * 1024 * 1024
+    # Request bodies bigger than that are decompressed in threadpool, not in event loop
+    request_threadpool_threshold: int = 256 * 1024
+
+    # Collect per route metrics and serve them on /metrics (only to local clients)
+    metrics_enabled: bool = True
+
+    # Validate responses of routes with trusted responses against their response_model, for debugging
+    validate_responses: bool = False
+
+    # Record all requests into captures_dir, they can be replayed with "python -m server.replay"
+    capture_requests: bool = False
+    captures_dir: str = "captures"
+
+    # Build repositories and cached responses in background after start, readiness is reported on /ready
+    warmup: bool = True
+
+    # Check database files every that many seconds and reload repositories built from changed files, 0 disables it.
+    # Reload can be requested on POST /admin/reload as well (only from local clients)
+    db_reload_interval: float = 0
+
+    # Start tracemalloc with that many frames per traceback, 0 disables it.
+    # Retained size of repositories and caches is reported on GET /debug/memory,
+    # POST /debug/memory/allocations reports allocations since previous request (only to local clients)
+    tracemalloc_frames: int = 0
+
+    # Cached response bodies bigger than that are kept in memory-mapped files (cache/mapped) instead of heap,
+    # so their memory is shared between server processes by OS page cache, 0 disables it
+    mapped_response_threshold: int = 256 * 1024
+
+
+class ProfilingConfig(BaseConfig):
+    __config_path__: ClassVar[Path] = config_dir.joinpath("profiling.yaml")
+
+    enabled: bool = False
+    profiles_dir: str = "profiles"
+    # Profile every N-th request, 0 disables sampling
+    sample_every: int = 0
+    # Profile requests that run longer than that (in seconds), 0 disables
+    slow_threshold: float = 0
+    # Requests with this header are always profiled
+    header: str = "X-Jet-Profile"
+    # Interval between stack samples in seconds
+    interval: float = 0.005
@@ -14,18 +14,20 @@ class ConfigContainer(containers.DeclarativeContainer):
 
     bot_generation = providers.Singleton(config.BotGenerationConfig.load)
     traders = providers.Singleton(config.TradersConfig.load)
+    server = providers.Singleton(config.ServerConfig.load)
+    profiling = providers.Singleton(config.ProfilingConfig.load)
 
 
 class RepositoriesContainer(containers.DeclarativeContainer):
-    templates = providers.Singleton(ItemTemplatesRepository)
-    globals = providers.Singleton(GlobalsRepository)
+    templates = providers.ThreadSafeSingleton(ItemTemplatesRepository)
+    globals = providers.ThreadSafeSingleton(GlobalsRepository)
 
 
 class ItemsContainer(containers.DeclarativeContainer):
     templates_repository: Dependency[ItemTemplatesRepository] = providers.Dependency()
     globals_repository: Dependency[GlobalsRepository] = providers.Dependency()
 
-    factory = providers.Singleton(
+    factory = providers.ThreadSafeSingleton(
         ItemFactory,
         templates_repository=templates_repository,
         globals_repository=globals_repository,
@@ -25,7 +25,7 @@ class FleaMarketContainer(containers.DeclarativeContainer):
     globals_repository: Dependency[GlobalsRepository] = providers.Dependency()
     item_factory: Dependency[ItemFactory] = providers.Dependency()
 
-    generator: providers.Provider[OfferGenerator] = providers.Singleton(
+    generator: providers.Provider[OfferGenerator] = providers.ThreadSafeSingleton(
         OfferGenerator,
         config=flea_config,
         templates_repository=templates_repository,
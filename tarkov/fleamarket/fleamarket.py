@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import collections
+import itertools
 import math
 import random
 import statistics
 from datetime import datetime, timedelta
-from typing import Callable, Dict, List
+from typing import Callable, DefaultDict, Dict, List
 
 from server import logger
 from tarkov.config import FleaMarketConfig
@@ -30,6 +32,13 @@ class FleaMarket:
         self.generator: OfferGenerator = offer_generator
         self._view_factory: Callable[..., FleaMarketView] = flea_view_factory
         self.offers: Dict[OfferId, Offer] = {}
+        # Offers grouped by template of their root item
+        self.offers_by_template: DefaultDict[
+            TemplateId, Dict[OfferId, Offer]
+        ] = collections.defaultdict(dict)
+        # Position of every offer in self.offers, offers found through the index are ordered by it
+        self.offer_positions: Dict[OfferId, int] = {}
+        self.__offers_added = itertools.count()
 
     def get_offer(self, offer_id: OfferId) -> Offer:
         """
@@ -40,21 +49,31 @@ class FleaMarket:
         except KeyError as error:
             raise NotFoundError from error
 
+    def add_offers(self, offers: Dict[OfferId, Offer]) -> None:
+        self.offers.update(offers)
+        for offer in offers.values():
+            self.offers_by_template[offer.root_item.tpl][offer.id] = offer
+            # Offer that is replaced keeps it's position, same as in self.offers
+            if offer.id not in self.offer_positions:
+                self.offer_positions[offer.id] = next(self.__offers_added)
+
     def remove_offer(self, offer: Offer) -> None:
         """
         Simply deletes offer
         """
         del self.offers[offer.id]
+        del self.offer_positions[offer.id]
+        template_id = offer.root_item.tpl
+        template_offers = self.offers_by_template[template_id]
+        del template_offers[offer.id]
+        if not template_offers:
+            del self.offers_by_template[template_id]
 
     def item_price_view(self, template_id: TemplateId) -> dict:
         """
         Calculates min, max and average price of item on flea. Used by client when selling items.
         """
-        offers = [
-            offer
-            for offer in self.offers.values()
-            if offer.root_item.tpl == template_id
-        ]
+        offers = list(self.offers_by_template.get(template_id, {}).values())
         if not offers:
             return {
                 "min": 0,
@@ -129,7 +148,7 @@ class FleaMarket:
         ]
 
         for key in expired_offers_keys:
-            del self.offers[key]
+            self.remove_offer(self.offers[key])
 
     def __update_offers(self) -> None:
         """
@@ -149,12 +168,12 @@ class FleaMarket:
             keys_to_delete = []
 
         for key in keys_to_delete:
-            del self.offers[key]
+            self.remove_offer(self.offers[key])
 
         new_offers_amount: int = self.offers_amount - len(self.offers)
         new_offers = self.generator.generate_offers(new_offers_amount)
         logger.debug(f"Generated {len(new_offers)} items!")
-        self.offers.update(new_offers)
+        self.add_offers(new_offers)
 
     @property
     def view(self) -> FleaMarketView:
@@ -3,6 +3,7 @@ from fastapi import Request
 from fastapi.params import Body, Depends
 
 from server.container import AppContainer
+from server.responses import ZLibTrustedResponse
 from server.utils import make_router
 from tarkov.fleamarket.fleamarket import FleaMarket
 from tarkov.fleamarket.models import FleaMarketRequest, FleaMarketResponse
@@ -17,6 +18,7 @@ flea_market_router = make_router(tags=["FleaMarket"])
     response_model_exclude_none=True,
     response_model_exclude_unset=False,
     response_model=TarkovSuccessResponse[FleaMarketResponse],
+    response_class=ZLibTrustedResponse,
 )
 @inject
 async def find(
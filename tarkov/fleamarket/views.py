@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import collections
-from typing import Dict, List, TYPE_CHECKING, Union
+from typing import AbstractSet, Dict, List, TYPE_CHECKING, Union
 
 from tarkov.fleamarket.models import (
     FleaMarketRequest,
@@ -38,24 +38,15 @@ class FleaMarketView:
 
         # Apply linked search filter
         if request.linkedSearchId:
-            linked_search_template = self.templates_repository.get_template(
-                request.linkedSearchId
+            offers = self.__offers_of_templates(
+                self.templates_repository.compatible_templates(request.linkedSearchId)
             )
-            offers = [
-                offer
-                for offer in offers
-                if linked_search_template.has_in_slots(offer.root_item.tpl)
-            ]
 
         # Else apply required search filter
         elif request.neededSearchId:
-            offers = [
-                offer
-                for offer in offers
-                if self.templates_repository.get_template(offer.root_item).has_in_slots(
-                    request.neededSearchId
-                )
-            ]
+            offers = self.__offers_of_templates(
+                self.templates_repository.accepting_templates(request.neededSearchId)
+            )
 
         categories: Dict[Union[TemplateId, CategoryId], int]
         if not request.linkedSearchId and not request.neededSearchId:
@@ -85,6 +76,21 @@ class FleaMarketView:
             selectedCategory=request.handbookId,
         )
 
+    def __offers_of_templates(
+        self, template_ids: AbstractSet[TemplateId]
+    ) -> List[Offer]:
+        offers_by_template = self.flea_market.offers_by_template
+        offers = [
+            offer
+            for template_id in template_ids & offers_by_template.keys()
+            for offer in offers_by_template[template_id].values()
+        ]
+        # Order of set iteration depends on string hashing (differs between processes),
+        # offers are ordered as they were added, so offers with equal sort keys are paginated the same way
+        offer_positions = self.flea_market.offer_positions
+        offers.sort(key=lambda offer: offer_positions[offer.id])
+        return offers
+
     @staticmethod
     def __filter_category_search(
         offers: List[Offer], request: FleaMarketRequest
@@ -92,10 +98,8 @@ class FleaMarketView:
         return [
             offer
             for offer in offers
-            if category_repository.has_parent_category(
-                category_repository.get_category(offer.root_item.tpl),
-                request.handbookId,
-            )
+            if request.handbookId
+            in category_repository.template_categories(offer.root_item.tpl)
             or offer.root_item.tpl == request.handbookId
         ]
 
@@ -1,3 +1,5 @@
+from functools import cached_property
+from pathlib import Path
 from types import SimpleNamespace
 from typing import Dict, List, Literal, Optional, Union
 
@@ -111,15 +113,15 @@ class HideoutAreaTemplate(Base):
 
 
 class HideoutAreasRepository:
-    areas: List[HideoutAreaTemplate]
+    def __init__(self, areas_dir: Path) -> None:
+        self.areas_dir = areas_dir
 
-    def __init__(self, areas: List[dict]):
-        self.areas = pydantic.parse_obj_as(List[HideoutAreaTemplate], areas)
+    @cached_property
+    def areas(self) -> List[HideoutAreaTemplate]:
+        return pydantic.parse_obj_as(
+            List[HideoutAreaTemplate],
+            [ujson.load(path.open()) for path in self.areas_dir.glob("*.json")],
+        )
 
 
-areas_repository = HideoutAreasRepository(
-    areas=[
-        ujson.load(path.open())
-        for path in db_dir.joinpath("hideout", "areas").glob("*.json")
-    ]
-)
+areas_repository = HideoutAreasRepository(areas_dir=db_dir.joinpath("hideout", "areas"))
@@ -1,3 +1,5 @@
+from functools import cached_property
+from pathlib import Path
 from typing import List
 
 import pydantic
@@ -22,17 +24,17 @@ class HideoutProductionModel(Base):
 
 
 class HideoutProductionRepository:
-    production: List[HideoutProductionModel]
-
-    def __init__(self, production: List[dict]):
-        self.production = pydantic.parse_obj_as(
-            List[HideoutProductionModel], production
+    def __init__(self, production_dir: Path) -> None:
+        self.production_dir = production_dir
+
+    @cached_property
+    def production(self) -> List[HideoutProductionModel]:
+        return pydantic.parse_obj_as(
+            List[HideoutProductionModel],
+            [ujson.load(path.open()) for path in self.production_dir.glob("*.json")],
         )
 
 
 production_repository = HideoutProductionRepository(
-    production=[
-        ujson.load(path.open())
-        for path in db_dir.joinpath("hideout", "production").glob("*.json")
-    ]
+    production_dir=db_dir.joinpath("hideout", "production")
 )
@@ -1,3 +1,5 @@
+from functools import cached_property
+from pathlib import Path
 from typing import List
 
 import pydantic
@@ -16,17 +18,17 @@ class ScavcaseProductionModel(Base):
 
 
 class ScavcaseProductionRepository:
-    production: List[ScavcaseProductionModel]
-
-    def __init__(self, production: List[dict]):
-        self.production = pydantic.parse_obj_as(
-            List[ScavcaseProductionModel], production
+    def __init__(self, production_dir: Path) -> None:
+        self.production_dir = production_dir
+
+    @cached_property
+    def production(self) -> List[ScavcaseProductionModel]:
+        return pydantic.parse_obj_as(
+            List[ScavcaseProductionModel],
+            [ujson.load(path.open()) for path in self.production_dir.glob("*.json")],
         )
 
 
 scavcase_production_repository = ScavcaseProductionRepository(
-    production=[
-        ujson.load(path.open())
-        for path in db_dir.joinpath("hideout", "scavcase").glob("*.json")
-    ]
+    production_dir=db_dir.joinpath("hideout", "scavcase")
 )
@@ -0,0 +1,98 @@
+from array import array
+from typing import Dict, Iterable, List, Sequence, Tuple, TypeVar
+
+from tarkov.exceptions import NotFoundError
+from .models import ItemTemplate
+from .types import TemplateId
+
+T = TypeVar("T")
+
+
+class TemplateColumns:
+    """
+    Frequently used properties of item templates stored in typed arrays (columns).
+    Template is a row at it's dense index, so properties of many templates are gathered
+    without touching pydantic models.
+    """
+
+    def __init__(self, templates: Iterable[ItemTemplate]) -> None:
+        self.index: Dict[TemplateId, int] = {}
+
+        self.width = array("i")
+        self.height = array("i")
+        self.extra_size_left = array("i")
+        self.extra_size_right = array("i")
+        self.extra_size_up = array("i")
+        self.extra_size_down = array("i")
+        self.extra_size_force_add = array("b")
+        self.credits_price = array("q")
+        self.spawn_chance = array("d")
+
+        for index, template in enumerate(templates):
+            props = template.props
+            self.index[template.id] = index
+            self.width.append(props.Width)
+            self.height.append(props.Height)
+            self.extra_size_left.append(props.ExtraSizeLeft)
+            self.extra_size_right.append(props.ExtraSizeRight)
+            self.extra_size_up.append(props.ExtraSizeUp)
+            self.extra_size_down.append(props.ExtraSizeDown)
+            self.extra_size_force_add.append(props.ExtraSizeForceAdd)
+            self.credits_price.append(props.CreditsPrice)
+            self.spawn_chance.append(props.SpawnChance)
+
+    def indices(self, template_ids: Iterable[TemplateId]) -> List[int]:
+        try:
+            return list(map(self.index.__getitem__, template_ids))
+        except KeyError as error:
+            raise NotFoundError(
+                f"Can not found ItemTemplate with id {error}"
+            ) from error
+
+    @staticmethod
+    def gather(column: Sequence[T], indices: Iterable[int]) -> List[T]:
+        """
+        Returns values of column at given indices
+        """
+        return list(map(column.__getitem__, indices))
+
+    def total_price(self, template_ids: Iterable[TemplateId]) -> int:
+        """
+        Returns sum of CreditsPrice of given templates, duplicates are counted
+        """
+        return sum(self.gather(self.credits_price, self.indices(template_ids)))
+
+    def spawn_chances(self, template_ids: Iterable[TemplateId]) -> List[float]:
+        return self.gather(self.spawn_chance, self.indices(template_ids))
+
+    def sizes(self, template_ids: Iterable[TemplateId]) -> List[Tuple[int, int]]:
+        """
+        Returns (width, height) of given templates, attachments aren't taken into account
+        """
+        indices = self.indices(template_ids)
+        return list(
+            zip(self.gather(self.width, indices), self.gather(self.height, indices))
+        )
+
+    def extra_size(self, template_ids: Iterable[TemplateId]) -> Tuple[int, int]:
+        """
+        Returns (width, height) that attachments with given templates add to weapon or mod size.
+        Sizes of attachments with ExtraSizeForceAdd are summed, others only extend size to the biggest one.
+        """
+        indices = self.indices(template_ids)
+        forced = [index for index in indices if self.extra_size_force_add[index]]
+        other = [index for index in indices if not self.extra_size_force_add[index]]
+
+        width = sum(self.gather(self.extra_size_left, forced))
+        width += sum(self.gather(self.extra_size_right, forced))
+        height = sum(self.gather(self.extra_size_up, forced))
+        height += sum(self.gather(self.extra_size_down, forced))
+        width += _max_or_zero(self.gather(self.extra_size_left, other))
+        width += _max_or_zero(self.gather(self.extra_size_right, other))
+        height += _max_or_zero(self.gather(self.extra_size_up, other))
+        height += _max_or_zero(self.gather(self.extra_size_down, other))
+        return width, height
+
+
+def _max_or_zero(values: List[int]) -> int:
+    return max([0, *values])
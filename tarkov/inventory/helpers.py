@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-import uuid
-from typing import Dict, List, TYPE_CHECKING, cast
+import os
+import threading
+import time
+from typing import Any, Dict, List, TYPE_CHECKING, Tuple, cast
 
 if TYPE_CHECKING:
     # pylint: disable=cyclic-import
@@ -9,35 +11,104 @@ if TYPE_CHECKING:
     from tarkov.inventory.types import ItemId
 
 
+class ItemIdGenerator:
+    """
+    Generates ids in the same format as MongoDB ObjectId (24 hex characters):
+    4 bytes of timestamp, 5 random bytes (chosen once per generator) and 3 bytes of counter.
+    """
+
+    COUNTER_LIMIT = 0xFFFFFF
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__random: str = ""
+        self.__counter: int = 0
+        self.__reset()
+
+    def __reset(self) -> None:
+        self.__random = os.urandom(5).hex()
+        self.__counter = int.from_bytes(os.urandom(3), "big") // 2
+
+    def __reserve(self, amount: int) -> Tuple[str, int]:
+        with self.__lock:
+            if self.__counter + amount > self.COUNTER_LIMIT:
+                # Ids are still unique since random part is changed too
+                self.__reset()
+                self.__counter = 0
+            start = self.__counter
+            self.__counter += amount
+            return f"{int(time.time()):08x}{self.__random}", start
+
+    def generate(self) -> ItemId:
+        prefix, counter = self.__reserve(1)
+        return cast("ItemId", f"{prefix}{counter:06x}")
+
+    def generate_many(self, amount: int) -> List[ItemId]:
+        """
+        Generates given amount of ids at once, faster than calling generate in a loop
+        """
+        prefix, start = self.__reserve(amount)
+        return [
+            cast("ItemId", f"{prefix}{counter:06x}")
+            for counter in range(start, start + amount)
+        ]
+
+
+item_id_generator = ItemIdGenerator()
+
+
 def generate_item_id() -> ItemId:
     """
     Generates new item id.
 
     :return: Generated item id
     """
-    unique_id = str(uuid.uuid4())
-    unique_id = "".join(unique_id.split("-")[1:])
-
-    return cast("ItemId", unique_id)
+    return item_id_generator.generate()
 
 
 def regenerate_items_ids(items: List[Item]) -> None:
     """
     Generates new ids for all items in list (mutates the list).
+    Ids are set without validation and without updating inventory indexes,
+    so items should not be stored in an inventory, caller has to add them (again) after ids are changed.
 
     :param items: The list of items to edit.
+    :raises ValueError: If some of the items is stored in an inventory.
     """
-    id_map: Dict[ItemId, ItemId] = {item.id: generate_item_id() for item in items}
+    for item in items:
+        inventory = item.__inventory__
+        if inventory is not None and inventory.items.get(item.id) is item:
+            raise ValueError(
+                f"Item {item.id} is stored in {inventory.__class__.__name__}, ids of it can not be regenerated"
+            )
+
+    id_map: Dict[ItemId, ItemId] = dict(
+        zip(
+            (item.id for item in items),
+            item_id_generator.generate_many(len(items)),
+        )
+    )
 
     for item in items:
-        item.id = id_map[item.id]
+        _set_generated_id(item, "id", id_map[item.id])
 
         if item.parent_id in id_map:
-            item.parent_id = id_map[item.parent_id]
+            _set_generated_id(item, "parent_id", id_map[item.parent_id])
+
+
+def _set_generated_id(item: Item, field: str, value: Any) -> None:
+    # Skips assignment validation (generated ids are always valid) and Item.__setattr__ hooks
+    item.__dict__[field] = value
+    item.__fields_set__.add(field)
 
 
 def regenerate_item_ids_dict(items: List[Dict]) -> None:
-    id_map: Dict[ItemId, ItemId] = {item["_id"]: generate_item_id() for item in items}
+    id_map: Dict[ItemId, ItemId] = dict(
+        zip(
+            (item["_id"] for item in items),
+            item_id_generator.generate_many(len(items)),
+        )
+    )
 
     for item in items:
         item["_id"] = id_map[item["_id"]]
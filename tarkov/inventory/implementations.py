@@ -9,7 +9,7 @@ import server.app  # pylint: disable=cyclic-import
 from tarkov.exceptions import NoSpaceError
 from tarkov.inventory.inventory import (
     GridInventory,
-    GridInventoryStashMap,
+    InventoryItems,
     MutableInventory,
 )
 from tarkov.inventory.models import (
@@ -30,10 +30,7 @@ if TYPE_CHECKING:
 class SimpleInventory(MutableInventory):
     def __init__(self, items: List[Item]):
         super().__init__()
-        self.__items: Dict[ItemId, Item] = {i.id: i for i in items}
-
-        for item in self.__items.values():
-            item.__inventory__ = self
+        self.__items: InventoryItems = InventoryItems(self, items)
 
     @property
     def items(self) -> Dict[ItemId, Item]:
@@ -46,9 +43,7 @@ class MultiGridSubInventory(GridInventory):
         self._root_id = root_id
         self._slot_id = grid.name
         self._grid = grid
-        self._items: Dict[ItemId, Item] = {}
-
-        self.stash_map = GridInventoryStashMap(self)
+        self._items: InventoryItems = InventoryItems(self)
 
     @property
     def root_id(self) -> ItemId:
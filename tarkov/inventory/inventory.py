@@ -2,11 +2,21 @@ from __future__ import annotations
 
 import abc
 import itertools
-from typing import Dict, Iterable, Iterator, List, Optional, TYPE_CHECKING, Tuple
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+)
 
 import server.app  # pylint: disable=cyclic-import
 from tarkov.exceptions import NoSpaceError, NotFoundError
-from tarkov.models import Base
 from .helpers import generate_item_id
 from .models import (
     AnyItemLocation,
@@ -29,6 +39,103 @@ if TYPE_CHECKING:
     from .repositories import ItemTemplatesRepository
 
 
+# Memoized item sizes are dropped when there are more of them, different weapon builds are not that many
+_ITEM_SIZES_LIMIT = 10000
+
+
+def _item_size_key(item: Item, child_items: List[Item]) -> Hashable:
+    """
+    Returns everything size of the item depends on: templates, slots and folded state of the item and it's children
+    """
+    return (
+        item.tpl,
+        item.upd.folded(),
+        tuple(
+            sorted(
+                (child.tpl, child.slot_id or "", child.upd.folded())
+                for child in child_items
+            )
+        ),
+    )
+
+
+class InventoryItems(Dict[ItemId, Item]):
+    """
+    Items of an inventory by their id with index of children by parent id.
+    Every stored item is linked to the inventory (Item.__inventory__),
+    so index is updated when items are added or removed and when parent_id of item is changed (see Item.__setattr__)
+    """
+
+    def __init__(
+        self, inventory: ImmutableInventory, items: Iterable[Item] = ()
+    ) -> None:
+        super().__init__()
+        self.inventory = inventory
+        self.children: Dict[Optional[ItemId], Dict[ItemId, Item]] = {}
+        # Parent id every item is indexed under
+        self.__parents: Dict[ItemId, Optional[ItemId]] = {}
+        for item in items:
+            self[item.id] = item
+
+    def __setitem__(self, item_id: ItemId, item: Item) -> None:
+        if item_id in self:
+            self.__unlink(item_id)
+        super().__setitem__(item_id, item)
+        item.__inventory__ = self.inventory
+        self.__link(item_id, item.parent_id)
+
+    def __delitem__(self, item_id: ItemId) -> None:
+        super().__delitem__(item_id)
+        self.__unlink(item_id)
+
+    def pop(self, item_id: ItemId, *default: Any) -> Any:
+        if item_id not in self:
+            return super().pop(item_id, *default)
+        item = self[item_id]
+        del self[item_id]
+        return item
+
+    def popitem(self) -> Tuple[ItemId, Item]:
+        item_id, item = super().popitem()
+        self.__unlink(item_id)
+        return item_id, item
+
+    def setdefault(self, item_id: ItemId, default: Item = None) -> Item:  # type: ignore
+        if item_id not in self:
+            assert default is not None
+            self[item_id] = default
+        return self[item_id]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for item_id, item in dict(*args, **kwargs).items():
+            self[item_id] = item
+
+    def clear(self) -> None:
+        super().clear()
+        self.children.clear()
+        self.__parents.clear()
+
+    def reparent(self, item: Item) -> None:
+        """
+        Moves item in the index under it's current parent_id
+        """
+        if self.get(item.id) is not item:
+            return
+        self.__unlink(item.id)
+        self.__link(item.id, item.parent_id)
+
+    def __link(self, item_id: ItemId, parent_id: Optional[ItemId]) -> None:
+        self.__parents[item_id] = parent_id
+        self.children.setdefault(parent_id, {})[item_id] = self[item_id]
+
+    def __unlink(self, item_id: ItemId) -> None:
+        parent_id = self.__parents.pop(item_id)
+        siblings = self.children[parent_id]
+        del siblings[item_id]
+        if not siblings:
+            del self.children[parent_id]
+
+
 class ImmutableInventory(metaclass=abc.ABCMeta):
     """
     Implements inventory_manager access methods like searching for item, getting it's children without mutating state
@@ -74,46 +181,47 @@ class ImmutableInventory(metaclass=abc.ABCMeta):
         if not isinstance(item_template.props, (WeaponProps, ModProps)):
             return item_template.props.Width, item_template.props.Height
 
-        size_left: int = 0
-        size_right: int = 0
-        size_up: int = 0
-        size_down: int = 0
-
-        width = item_template.props.Width
-        height = item_template.props.Height
-
-        for child in child_items:
-            child_template = self._templates_repository.get_template(child)
-            if child_template.props.ExtraSizeForceAdd:
-                width += (
-                    child_template.props.ExtraSizeLeft
-                    + child_template.props.ExtraSizeRight
-                )
-                height += (
-                    child_template.props.ExtraSizeUp
-                    + child_template.props.ExtraSizeDown
-                )
-            else:
-                size_left = max(size_left, child_template.props.ExtraSizeLeft)
-                size_right = max(size_right, child_template.props.ExtraSizeRight)
-                size_up = max(size_up, child_template.props.ExtraSizeUp)
-                size_down = max(size_down, child_template.props.ExtraSizeDown)
-
-        width += size_left + size_right
-        height += size_up + size_down
+        extra_width, extra_height = self._templates_repository.columns.extra_size(
+            child.tpl for child in child_items
+        )
+        width = item_template.props.Width + extra_width
+        height = item_template.props.Height + extra_height
 
         return width, height
 
-    def get_item_size(  # noqa: C901 - Guess there's nothing i can do about this function complexity
+    def get_item_size(
         self, item: Item, child_items: List[Item] = None
     ) -> Tuple[int, int]:
         """
         Return size of the item according to it's attachments, etc.
+        Sizes of weapons and mods are memoized by their structure,
+        so they don't have to be invalidated when inventory changes.
 
         :return: Tuple[width, height]
         """
         item_template = self._templates_repository.get_template(item)
+        if not isinstance(item_template.props, (WeaponProps, ModProps)):
+            # Attachments and folding don't change size of other items
+            return item_template.props.Width, item_template.props.Height
+
         child_items = child_items or []
+        key = _item_size_key(item, child_items)
+        item_sizes = self._templates_repository.item_sizes
+        try:
+            return item_sizes[key]
+        except KeyError:
+            pass
+
+        size = self.__calculate_item_size(item, child_items)
+        if len(item_sizes) >= _ITEM_SIZES_LIMIT:
+            item_sizes.clear()
+        item_sizes[key] = size
+        return size
+
+    def __calculate_item_size(  # noqa: C901 - Guess there's nothing i can do about this function complexity
+        self, item: Item, child_items: List[Item]
+    ) -> Tuple[int, int]:
+        item_template = self._templates_repository.get_template(item)
         width, height = self.__get_item_size_without_folding(item, child_items)
 
         if isinstance(item_template.props, StockProps) and item.upd.folded():
@@ -159,9 +267,15 @@ class ImmutableInventory(metaclass=abc.ABCMeta):
         """
         Iterates over item's children
         """
-        for children in self.items.values():
-            if children.parent_id == item.id:
-                yield children
+        items = self.items
+        if not isinstance(items, InventoryItems):
+            return [child for child in items.values() if child.parent_id == item.id]
+        # Copied, so inventory can be changed while iterating
+        return [
+            child
+            for child in items.children.get(item.id, {}).values()
+            if child.parent_id == item.id
+        ]
 
     def iter_item_children_recursively(self, item: Item) -> Iterable[Item]:
         """
@@ -315,7 +429,7 @@ class MutableInventory(ImmutableInventory, metaclass=abc.ABCMeta):
         return item.upd.StackObjectsCount > 1
 
 
-class StashMapItemFootprint(Base):
+class StashMapItemFootprint(NamedTuple):
     """Basically a rectangle"""
 
     x: int
@@ -389,9 +503,8 @@ class GridInventoryStashMap:
     def __init__(self, inventory: GridInventory):
         self.inventory = inventory
         self.width, self.height = inventory.grid_size
-        self.map: List[List[bool]] = [
-            [False for y in range(self.height)] for x in range(self.width)
-        ]
+        # Occupancy bitmask of every row, bit x of rows[y] is set if cell (x, y) is taken
+        self.rows: List[int] = [0] * self.height
 
         try:
             inventory_root = inventory.get(inventory.root_id)
@@ -469,13 +582,71 @@ class GridInventoryStashMap:
         if not 0 <= y < self.height:
             raise IndexError
 
-        return self.map[x][y]
+        return bool(self.rows[y] >> x & 1)
 
     def set(self, x: int, y: int, state: bool) -> None:
-        if self.map[x][y] == state:
-            raise self.InvalidCellStateError(f"Cell {x} {y} already has {state} state")
+        self.fill(StashMapItemFootprint(x=x, y=y, width=1, height=1), state)
+
+    def is_free(self, footprint: StashMapItemFootprint) -> bool:
+        """
+        Checks if every cell of footprint is inside of the map and not taken
+        """
+        if footprint.is_out_of_bounds(self.width, self.height):
+            return False
+
+        mask = ((1 << footprint.width) - 1) << footprint.x
+        return not any(row & mask for row in self.rows[footprint.y : footprint.y_high])
+
+    def fill(self, footprint: StashMapItemFootprint, state: bool) -> None:
+        """
+        Sets state of every cell of footprint, cells should have opposite state
+        """
+        if footprint.is_out_of_bounds(self.width, self.height):
+            raise self.OutOfBoundsError(f"{footprint} is out of stash map bounds")
+
+        mask = ((1 << footprint.width) - 1) << footprint.x
+        expected = 0 if state else mask
+        for y in range(footprint.y, footprint.y_high):
+            if self.rows[y] & mask != expected:
+                raise self.InvalidCellStateError(
+                    f"Some of cells in row {y} from {footprint.x} to {footprint.x_high} already have {state} state"
+                )
+
+        for y in range(footprint.y, footprint.y_high):
+            self.rows[y] ^= mask
+
+    def find_free(self, width: int, height: int) -> Optional[Tuple[int, int]]:
+        """
+        Returns first (in row-major order) top-left position of free width x height rectangle.
 
-        self.map[x][y] = state
+        :param width: Width of the rectangle.
+        :param height: Height of the rectangle.
+        :returns: (x, y) of the position or None if there is no such free rectangle.
+        """
+        if not 0 < width <= self.width or not 0 < height <= self.height:
+            return None
+
+        full = (1 << self.width) - 1
+        # Bit x of fits[y] is set if width cells starting from (x, y) are free
+        fits = []
+        for row in self.rows:
+            free = ~row & full
+            run = free
+            for shift in range(1, width):
+                run &= free >> shift
+            fits.append(run)
+
+        for y in range(self.height - height + 1):
+            columns = fits[y]
+            for row_fits in fits[y + 1 : y + height]:
+                if not columns:
+                    break
+                columns &= row_fits
+            if columns:
+                # Lowest set bit is the leftmost fitting column
+                return (columns & -columns).bit_length() - 1, y
+
+        return None
 
     def _get_parent_item_in_inventory_root(self, item: Item) -> Item:
         """
@@ -518,8 +689,7 @@ class GridInventoryStashMap:
                 parent_item.location,
             )
 
-            for x, y in parent_footprint.iter_cells():
-                self.set(x, y, False)
+            self.fill(parent_footprint, False)
 
             parent_footprint = self._calculate_item_footprint(
                 parent_item,
@@ -527,8 +697,7 @@ class GridInventoryStashMap:
                 list(parent_children_set.difference({item, *child_items})),
                 parent_item.location,
             )
-            for x, y in parent_footprint.iter_cells():
-                self.set(x, y, True)
+            self.fill(parent_footprint, True)
 
         elif item.parent_id == self.inventory.root_id:
             assert isinstance(item.location, ItemInventoryLocation)
@@ -536,8 +705,7 @@ class GridInventoryStashMap:
                 item, child_items, location=item.location
             )
 
-            for x, y in footprint.iter_cells():
-                self.set(x, y, False)
+            self.fill(footprint, False)
 
     def add(self, item: Item, child_items: List[Item]) -> None:
         """
@@ -561,16 +729,14 @@ class GridInventoryStashMap:
                 parent_item.location,
             )
 
-            for x, y in parent_footprint.iter_cells():
-                self.set(x, y, False)
+            self.fill(parent_footprint, False)
 
             parent_footprint = self._calculate_item_footprint(
                 parent_item,
                 list(parent_children_set.union({item, *child_items})),
                 parent_item.location,
             )
-            for x, y in parent_footprint.iter_cells():
-                self.set(x, y, True)
+            self.fill(parent_footprint, True)
 
         elif item.parent_id == self.inventory.root_id:
             assert isinstance(item.location, ItemInventoryLocation)
@@ -578,8 +744,7 @@ class GridInventoryStashMap:
                 raise self.OutOfBoundsError
 
             footprint = self._calculate_item_footprint(item, child_items, item.location)
-            for x, y in footprint.iter_cells():
-                self.set(x, y, True)
+            self.fill(footprint, True)
 
     def can_place(
         self, item: Item, child_items: List[Item], location: ItemInventoryLocation
@@ -593,15 +758,7 @@ class GridInventoryStashMap:
         :returns: If the item can be place into the location.
         """
         item_footprint = self._calculate_item_footprint(item, child_items, location)
-
-        for x, y in item_footprint.iter_cells():
-            try:
-                if self.get(x, y):
-                    return False
-            except IndexError:
-                return False
-
-        return True
+        return self.is_free(item_footprint)
 
     def find_location_for_item(
         self,
@@ -617,21 +774,21 @@ class GridInventoryStashMap:
         :returns: The found location.
         """
         child_items = child_items or []
-        item_width, item_height = self.inventory.get_item_size(item, child_items)
-
-        for x, y in self.iter_cells():
-            for orientation in ItemOrientationEnum:
-                location = ItemInventoryLocation(x=x, y=y, r=orientation.value)
-                width, height = item_width, item_height
-
-                if location.r == ItemOrientationEnum.Vertical.value:
-                    width, height = height, width
+        width, height = self.inventory.get_item_size(item, child_items)
 
-                if x + width > self.width or y + height > self.height:
-                    continue
+        locations = []
+        for orientation, (rect_width, rect_height) in (
+            (ItemOrientationEnum.Horizontal, (width, height)),
+            (ItemOrientationEnum.Vertical, (height, width)),
+        ):
+            position = self.find_free(rect_width, rect_height)
+            if position is not None:
+                x, y = position
+                locations.append(ItemInventoryLocation(x=x, y=y, r=orientation.value))
 
-                if self.can_place(item, child_items, location):
-                    return location
+        if locations:
+            # Cells are checked row by row, horizontal orientation goes first in the same cell
+            return min(locations, key=lambda location: (location.y, location.x))
 
         raise NoSpaceError("Cannot place item into inventory")
 
@@ -640,7 +797,19 @@ class GridInventory(MutableInventory):
     class InvalidItemLocation(Exception):
         pass
 
-    stash_map: GridInventoryStashMap
+    _stash_map: Optional[GridInventoryStashMap] = None
+
+    @property
+    def stash_map(self) -> GridInventoryStashMap:
+        """
+        Stash map is built on first use, so inventories that are only read don't calculate item footprints
+        """
+        if self._stash_map is None:
+            self._stash_map = self._create_stash_map()
+        return self._stash_map
+
+    def _create_stash_map(self) -> GridInventoryStashMap:
+        return GridInventoryStashMap(self)
 
     @property
     @abc.abstractmethod
@@ -662,7 +831,11 @@ class GridInventory(MutableInventory):
         :param item: The item to remove.
         :param remove_children: If the item's children should be removed too.
         """
-        self.stash_map.remove(item, list(self.iter_item_children_recursively(item)))
+        # Stash map that isn't built yet will be built from remaining items
+        if self._stash_map is not None:
+            self._stash_map.remove(
+                item, list(self.iter_item_children_recursively(item))
+            )
         super().remove_item(item, remove_children=remove_children)
 
     def add_item(self, item: Item, child_items: List[Item] = None) -> None:
@@ -918,7 +1091,7 @@ class PlayerInventory(GridInventory):
         self.profile: "Profile" = profile
         self.inventory = profile.pmc.Inventory
 
-        self.__items: Dict[ItemId, Item] = {}
+        self.__items: InventoryItems = InventoryItems(self)
 
     @property
     def grid_size(self) -> Tuple[int, int]:
@@ -950,9 +1123,11 @@ class PlayerInventory(GridInventory):
 
     def read(self) -> None:
         for item in self.inventory.items:
-            item.__inventory__ = self
             self.__items[item.id] = item
-        self.stash_map = PlayerInventoryStashMap(inventory=self)
+        self._stash_map = None
+
+    def _create_stash_map(self) -> GridInventoryStashMap:
+        return PlayerInventoryStashMap(inventory=self)
 
     def write(self) -> None:
         self.inventory.items = list(self.items.values())
@@ -2,7 +2,18 @@ from __future__ import annotations
 
 import datetime
 import enum
-from typing import Any, Dict, List, Literal, NewType, Optional, TYPE_CHECKING, Union
+import sys
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    NewType,
+    Optional,
+    TYPE_CHECKING,
+    Union,
+)
 
 from pydantic import (
     Extra,
@@ -27,7 +38,7 @@ from tarkov.models import Base
 
 if TYPE_CHECKING:
     # pylint: disable=cyclic-import
-    from tarkov.inventory.inventory import MutableInventory
+    from tarkov.inventory.inventory import ImmutableInventory, MutableInventory
 
 
 class NodeTemplateBase(Base):
@@ -98,6 +109,19 @@ class ItemTemplate(NodeTemplateBase):
                         return True
         return False
 
+    def slots_filter(self) -> FrozenSet[TemplateId]:
+        """
+        Returns every template id from filters of template slots (same ones has_in_slots checks)
+        """
+        props = self.props
+        template_ids = set()
+        for slot_filter in ("Cartridges", "Chambers", "Slots"):
+            filters: List[FilterProperty] = getattr(props, slot_filter, [])
+            for slot in filters:
+                for filter_group in slot.props.filters:
+                    template_ids.update(filter_group.Filter)
+        return frozenset(template_ids)
+
 
 class ItemUpdDogtag(Base):
     AccountId: str
@@ -222,7 +246,7 @@ class Item(Base):
     class Config:
         extra = Extra.forbid
 
-    __inventory__: Optional["MutableInventory"] = PrivateAttr(
+    __inventory__: Optional["ImmutableInventory"] = PrivateAttr(
         default=None
     )  # Link to the inventory
 
@@ -233,8 +257,19 @@ class Item(Base):
     location: Optional[AnyItemLocation] = None
     upd: ItemUpd = Field(default_factory=ItemUpd)
 
+    @validator("tpl")
+    def intern_template_id(  # pylint: disable=no-self-argument,no-self-use
+        cls, value: TemplateId
+    ) -> TemplateId:
+        # Thousands of items share same template ids, interned id is stored only once
+        return sys.intern(value)  # type: ignore
+
     def get_inventory(self) -> "MutableInventory":
-        if self.__inventory__ is None:
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from tarkov.inventory.inventory import MutableInventory
+
+        # Items of immutable inventories (trader assort) can't be moved or removed
+        if not isinstance(self.__inventory__, MutableInventory):
             raise ValueError("Item does not have inventory")
         return self.__inventory__
 
@@ -267,6 +302,14 @@ class Item(Base):
     #
     #     return values
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "parent_id" and self.__inventory__ is not None:
+            # Keeps children index of the inventory up to date
+            inventory_items = self.__inventory__.items
+            if hasattr(inventory_items, "reparent"):
+                inventory_items.reparent(self)
+
     def copy(self: Item, **kwargs: Any) -> Item:
         item_inventory = self.__inventory__
         # Avoid copying inventory
@@ -1,22 +1,76 @@
-from typing import Dict, Iterable, List, Tuple, Union
+import collections
+import sys
+from pathlib import Path
+from typing import (
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import pydantic
 import ujson
 
+import tarkov.models
 from server import db_dir
+from server.snapshot import Snapshot, snapshots_dir
 from tarkov.exceptions import NotFoundError
+from . import models, prop_models
+from .columns import TemplateColumns
 from .models import Item, ItemTemplate, NodeTemplate
 from .types import TemplateId
 
 AnyTemplate = Union[ItemTemplate, NodeTemplate]
 
+templates_snapshot = Snapshot(
+    path=snapshots_dir.joinpath("templates.pickle"),
+    sources=[db_dir.joinpath("items"), db_dir.joinpath("templates", "items.json")],
+    code=[
+        Path(__file__),
+        Path(models.__file__),
+        Path(prop_models.__file__),
+        Path(tarkov.models.__file__),
+    ],
+)
+
 
 class ItemTemplatesRepository:
-    def __init__(self) -> None:
-        items, nodes = self.__read_templates()
-        self._item_templates: Dict[TemplateId, ItemTemplate] = items
-        self._node_templates: Dict[TemplateId, NodeTemplate] = nodes
-        self._item_categories: dict = self.__read_item_categories()
+    def __init__(self, snapshot: Snapshot = templates_snapshot) -> None:
+        items, nodes, item_categories = snapshot.get_or_build(
+            lambda: (*self.__read_templates(), self.__read_item_categories())
+        )
+        # Template ids of items are interned too, so lookups compare ids by identity
+        self._item_templates: Dict[TemplateId, ItemTemplate] = {
+            sys.intern(template_id): template  # type: ignore
+            for template_id, template in items.items()
+        }
+        self._node_templates: Dict[TemplateId, NodeTemplate] = {
+            sys.intern(template_id): template  # type: ignore
+            for template_id, template in nodes.items()
+        }
+        self._item_categories: dict = item_categories
+
+        self._children: Dict[TemplateId, List[AnyTemplate]] = {}
+        templates: Tuple[AnyTemplate, ...] = (*items.values(), *nodes.values())
+        for template in templates:
+            self._children.setdefault(template.parent, []).append(template)
+        self._template_items: Dict[TemplateId, Tuple[ItemTemplate, ...]] = {}
+        self.columns = TemplateColumns(items.values())
+
+        # Slots compatibility indexes, built on first use
+        self._compatible_templates: Dict[TemplateId, FrozenSet[TemplateId]] = {}
+        self._accepting_templates: Optional[
+            Dict[TemplateId, FrozenSet[TemplateId]]
+        ] = None
+        # Sizes of items by their structure, filled by ImmutableInventory.get_item_size
+        self.item_sizes: Dict[Hashable, Tuple[int, int]] = {}
 
     @staticmethod
     def __read_templates() -> Tuple[
@@ -102,27 +156,45 @@ class ItemTemplatesRepository:
         while templates:
             template = templates.pop()
             yield template
+            templates.extend(self._children.get(template.id, ()))
 
-            for child_node in self._item_templates.values():
-                if child_node.parent == template.id:
-                    templates.append(child_node)
-
-            for child_item in self._node_templates.values():
-                if child_item.parent == template.id:
-                    templates.append(child_item)
-
-    def get_template_items(self, template_id: TemplateId) -> List[ItemTemplate]:
+    def get_template_items(self, template_id: TemplateId) -> Sequence[ItemTemplate]:
         """
         Returns all items of given category (all barter items for example)
 
         :param template_id:
-        :return: All items of a category
+        :return: All items of a category, result is cached so it shouldn't be modified
         """
-        template = self.get_any_template(template_id)
-        if isinstance(template, ItemTemplate):
-            return [template]
-        return [
-            tpl
-            for tpl in self.iter_template_children(template_id)
-            if isinstance(tpl, ItemTemplate)
-        ]
+        if template_id not in self._template_items:
+            self._template_items[template_id] = tuple(
+                tpl
+                for tpl in self.iter_template_children(template_id)
+                if isinstance(tpl, ItemTemplate)
+            )
+        return self._template_items[template_id]
+
+    def compatible_templates(self, template_id: TemplateId) -> FrozenSet[TemplateId]:
+        """
+        Returns templates that can be put into slots, magazine or chambers of given template
+        """
+        if template_id not in self._compatible_templates:
+            self._compatible_templates[template_id] = self.get_template(
+                template_id
+            ).slots_filter()
+        return self._compatible_templates[template_id]
+
+    def accepting_templates(self, template_id: TemplateId) -> FrozenSet[TemplateId]:
+        """
+        Returns templates that have given template in their slots, magazine or chambers
+        """
+        if self._accepting_templates is None:
+            accepting_templates: DefaultDict[
+                TemplateId, Set[TemplateId]
+            ] = collections.defaultdict(set)
+            for template in self._item_templates.values():
+                for compatible_id in self.compatible_templates(template.id):
+                    accepting_templates[compatible_id].add(template.id)
+            self._accepting_templates = {
+                key: frozenset(value) for key, value in accepting_templates.items()
+            }
+        return self._accepting_templates.get(template_id, frozenset())
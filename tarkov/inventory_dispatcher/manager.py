@@ -3,6 +3,7 @@ from typing import Dict, Iterable, List, TYPE_CHECKING
 from pydantic import Field
 
 from server import logger
+from server.profiling import tag_request
 from tarkov.inventory.inventory import PlayerInventory
 from tarkov.inventory.models import Item
 from tarkov.inventory_dispatcher.fleamarket import FleaMarketDispatcher
@@ -70,6 +71,7 @@ class DispatcherManager:
 
         actions: List[dict] = request_data
 
+        tag_request(*(action["Action"] for action in actions))
         for action in actions:
             logger.debug(action)
             for dispatcher in self.dispatchers:
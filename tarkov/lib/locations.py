@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import collections
 import random
-from typing import Any, DefaultDict, Dict, Final, List, Tuple, Union
+from typing import Any, DefaultDict, Dict, Final, List, Sequence, Tuple, Union
 
 import ujson
 from dependency_injector.wiring import Provide, inject
@@ -12,7 +12,7 @@ from server.container import AppContainer
 from tarkov.exceptions import NoSpaceError
 from tarkov.inventory.factories import ItemFactory
 from tarkov.inventory.helpers import regenerate_item_ids_dict
-from tarkov.inventory.inventory import GridInventory, GridInventoryStashMap
+from tarkov.inventory.inventory import GridInventory, InventoryItems
 from tarkov.inventory.models import Item, ItemTemplate
 from tarkov.inventory.prop_models import (
     CompoundProps,
@@ -50,11 +50,10 @@ class ContainerInventory(GridInventory):
     ):
         super().__init__()
         self.container = container
-        self._items = {i.id: i for i in self.container.Items}
+        self._items = InventoryItems(self, self.container.Items)
 
         root_item = self.get(self.container.Root)
         self.template = templates_repository.get_template(root_item.tpl)
-        self.stash_map = GridInventoryStashMap(self)
 
     @property
     def items_list_view(self) -> List[dict]:
@@ -176,10 +175,6 @@ class LocationGenerator:
         self.__base: dict = self.__location["base"]
         self.__loot: dict = self.__location["loot"]
 
-        # Cache to store pairs of categories and it's items
-        # for example - Medkits category and all it's medkits
-        self.__category_cache: Dict[str, List[ItemTemplate]] = {}
-
     def generate_location(self) -> dict:
         self._generate_containers_loot()
         self._generate_dynamic_loot()
@@ -218,13 +213,9 @@ class LocationGenerator:
 
             self.__base["Loot"].append(loot_point)
 
-    def get_category_items(self, template_id: TemplateId) -> List[ItemTemplate]:
-        if template_id not in self.__category_cache:
-            self.__category_cache[template_id] = list(
-                tpl for tpl in self.templates_repository.get_template_items(template_id)
-            )
-
-        return self.__category_cache[template_id]
+    def get_category_items(self, template_id: TemplateId) -> Sequence[ItemTemplate]:
+        # Items of categories are cached by repository
+        return self.templates_repository.get_template_items(template_id)
 
     def template_weight(self, template: ItemTemplate) -> Union[int, float]:
         if (
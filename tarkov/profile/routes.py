@@ -6,6 +6,7 @@ from fastapi.requests import Request
 
 from server import logger
 from server.container import AppContainer
+from server.responses import ZLibTrustedResponse
 from server.utils import get_request_url_root, make_router
 from tarkov.inventory_dispatcher import DispatcherManager
 from tarkov.inventory_dispatcher.manager import DispatcherResponse
@@ -24,6 +25,7 @@ profile_router = make_router(tags=["Profile"])
     response_model=TarkovSuccessResponse[DispatcherResponse],
     response_model_exclude_none=True,
     response_model_exclude_unset=False,
+    response_class=ZLibTrustedResponse,
 )
 @inject
 def client_game_profile_item_move(
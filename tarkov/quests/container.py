@@ -5,6 +5,6 @@ from tarkov.quests.repositories import QuestsRepository
 
 
 class QuestsContainer(containers.DeclarativeContainer):
-    repository: providers.Provider[QuestsRepository] = providers.Singleton(
+    repository: providers.Provider[QuestsRepository] = providers.ThreadSafeSingleton(
         QuestsRepository, quests_path=db_dir.joinpath("quests", "all.json")
     )
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 
 import ujson
 
@@ -16,6 +16,10 @@ class QuestsRepository:
             quest.id: quest for quest in map(QuestTemplate.parse_obj, quests)
         }
 
+    @property
+    def quests(self) -> List[QuestTemplate]:
+        return list(self.__quests.values())
+
     def get_quest_template(self, quest_id: str) -> QuestTemplate:
         try:
             return self.__quests[quest_id]
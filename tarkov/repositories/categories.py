@@ -1,4 +1,5 @@
-from typing import Dict, Iterable, List, NewType, Optional, Union
+from functools import cached_property
+from typing import Dict, FrozenSet, Iterable, List, NewType, Optional, Tuple, Union
 
 import pydantic
 
@@ -24,22 +25,20 @@ class ItemTemplateCategoryModel(Base):
 
 
 class CategoryRepository:
-    def __init__(self) -> None:
-        self.categories: Dict[CategoryId, CategoryModel] = self._read_categories()
-        self.item_categories: Dict[
-            TemplateId, ItemTemplateCategoryModel
-        ] = self._read_item_template_categories()
-
-    @staticmethod
-    def _read_categories() -> Dict[CategoryId, CategoryModel]:
+    """
+    Handbook categories, files are read on first use
+    """
+
+    @cached_property
+    def categories(self) -> Dict[CategoryId, CategoryModel]:
         categories: List[CategoryModel] = pydantic.parse_file_as(
             List[CategoryModel],
             db_dir.joinpath("templates", "categories.json"),
         )
         return {category.Id: category for category in categories}
 
-    @staticmethod
-    def _read_item_template_categories() -> Dict[TemplateId, ItemTemplateCategoryModel]:
+    @cached_property
+    def item_categories(self) -> Dict[TemplateId, ItemTemplateCategoryModel]:
         template_categories: List[ItemTemplateCategoryModel] = pydantic.parse_file_as(
             List[ItemTemplateCategoryModel],
             db_dir.joinpath("templates", "items.json"),
@@ -52,10 +51,36 @@ class CategoryRepository:
         tpl_category = self.item_categories[template_id]
         return self.categories[tpl_category.ParentId]
 
+    @cached_property
+    def _parents(self) -> Dict[CategoryId, Tuple[CategoryModel, ...]]:
+        """
+        Parent categories of every category, closest parent goes first
+
+        :raises KeyError: If parent of some category doesn't exist
+        """
+        parents: Dict[CategoryId, Tuple[CategoryModel, ...]] = {}
+
+        def resolve(category: CategoryModel) -> Tuple[CategoryModel, ...]:
+            if category.Id not in parents:
+                parents[category.Id] = ()
+                if category.ParentId is not None:
+                    parent = self.categories[category.ParentId]
+                    parents[category.Id] = (parent, *resolve(parent))
+            return parents[category.Id]
+
+        for category in self.categories.values():
+            resolve(category)
+        return parents
+
+    @cached_property
+    def _ancestors(self) -> Dict[CategoryId, FrozenSet[CategoryId]]:
+        return {
+            category_id: frozenset(parent.Id for parent in parents)
+            for category_id, parents in self._parents.items()
+        }
+
     def parent_categories(self, category: CategoryModel) -> Iterable[CategoryModel]:
-        while category.ParentId is not None:
-            category = self.categories[category.ParentId]
-            yield category
+        return self._parents[category.Id]
 
     def has_parent_category(
         self,
@@ -63,15 +88,41 @@ class CategoryRepository:
         category_id: Union[TemplateId, CategoryId],
         including_self: bool = True,
     ) -> bool:
-        child_category = category
-        if including_self and child_category.Id == category_id:
+        if including_self and category.Id == category_id:
             return True
-
-        while child_category.ParentId in self.categories:
-            child_category = self.categories[child_category.ParentId]
-            if child_category.Id == category_id:
-                return True
-        return False
+        return category_id in self._ancestors[category.Id]
+
+    @cached_property
+    def _template_categories(self) -> Dict[TemplateId, FrozenSet[CategoryId]]:
+        return {
+            template_id: self._ancestors[tpl_category.ParentId]
+            | {tpl_category.ParentId}
+            for template_id, tpl_category in self.item_categories.items()
+            if tpl_category.ParentId in self.categories
+        }
+
+    def template_categories(self, template_id: TemplateId) -> FrozenSet[CategoryId]:
+        """
+        Returns category of item template and all it's parent categories
+
+        :raises KeyError: If template has no category
+        """
+        return self._template_categories[template_id]
+
+    def reload(self) -> None:
+        """
+        Re-reads files, data of new repository replaces current one at once
+        so readers never see categories mixed from old and new files
+        """
+        repository = CategoryRepository()
+        # Builds every cached property of new repository
+        # pylint: disable=pointless-statement
+        repository.categories
+        repository.item_categories
+        repository._parents
+        repository._ancestors
+        repository._template_categories
+        self.__dict__ = repository.__dict__
 
 
 category_repository = CategoryRepository()
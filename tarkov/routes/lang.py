@@ -1,42 +1,77 @@
-from functools import lru_cache
+from pathlib import Path
+from typing import Union
 
 import ujson
+from starlette.responses import Response
 
 from server import db_dir
+from server.responses import response_cache
 from server.utils import make_router
+import tarkov.library
 from tarkov.library import load_locale
 from tarkov.models import TarkovSuccessResponse
 
 lang_router = make_router(tags=["Locale"])
 
 
-@lru_cache(8)
 def _client_menu_locale(locale_type: str) -> dict:
     locale_path = db_dir / "locales" / locale_type / "menu.json"
     return ujson.load(locale_path.open("r", encoding="utf8"))["data"]
 
 
+for _locale_dir in sorted(
+    path for path in (db_dir / "locales").iterdir() if path.is_dir()
+):
+    response_cache.register(
+        f"/client/menu/locale/{_locale_dir.name}",
+        lambda name=_locale_dir.name: _client_menu_locale(name),
+        sources=[_locale_dir / "menu.json"],
+    )
+    response_cache.register(
+        f"/client/locale/{_locale_dir.name}",
+        lambda name=_locale_dir.name: load_locale(name),
+        sources=[_locale_dir],
+        code=[Path(tarkov.library.__file__)],
+    )
+
+
 @lang_router.post("/client/menu/locale/{locale_type}")
-def client_menu_locale(locale_type: str) -> TarkovSuccessResponse[dict]:
-    return TarkovSuccessResponse(data=_client_menu_locale(locale_type))
+def client_menu_locale(
+    locale_type: str,
+) -> Union[Response, TarkovSuccessResponse[dict]]:
+    key = f"/client/menu/locale/{locale_type}"
+    if key not in response_cache:
+        return TarkovSuccessResponse(data={})
+    return response_cache.response(key)
 
 
-@lang_router.post("/client/languages")
-def client_languages() -> TarkovSuccessResponse[list]:
+def _client_languages() -> list:
     languages_data_list = []
     languages_dir = db_dir / "locales"
     for dir_ in languages_dir.glob("*"):
         language_file = dir_ / f"{dir_.stem}.json"
         languages_data_list.append(ujson.load(language_file.open("r", encoding="utf8")))
+    return languages_data_list
 
-    return TarkovSuccessResponse(data=languages_data_list)
 
+response_cache.register(
+    "/client/languages",
+    _client_languages,
+    sources=[
+        db_dir / "locales",
+        *(dir_ / f"{dir_.stem}.json" for dir_ in (db_dir / "locales").glob("*")),
+    ],
+)
 
-@lru_cache(8)
-def _client_locale(locale_name: str) -> dict:
-    return load_locale(locale_name)
+
+@lang_router.post("/client/languages")
+def client_languages() -> Response:
+    return response_cache.response("/client/languages")
 
 
 @lang_router.post("/client/locale/{locale_name}")
-def client_locale(locale_name: str) -> TarkovSuccessResponse[dict]:
-    return TarkovSuccessResponse(data=_client_locale(locale_name))
+def client_locale(locale_name: str) -> Union[Response, TarkovSuccessResponse[dict]]:
+    key = f"/client/locale/{locale_name}"
+    if key not in response_cache:
+        return TarkovSuccessResponse(data={})
+    return response_cache.response(key)
@@ -4,11 +4,13 @@ from typing import Dict, Optional, Type, Union
 
 import ujson
 from dependency_injector.wiring import Provide, inject
-from fastapi.params import Cookie, Depends
+from fastapi.params import Cookie
 from fastapi.requests import Request
+from starlette.responses import Response
 
 from server import db_dir, start_time
 from server.container import AppContainer
+from server.responses import response_cache
 from server.utils import get_request_url_root, make_router
 from tarkov.config import FleaMarketConfig
 from tarkov.inventory.repositories import AnyTemplate, ItemTemplatesRepository
@@ -18,8 +20,7 @@ from tarkov.models import TarkovErrorResponse, TarkovSuccessResponse
 misc_router = make_router(tags=["Misc/Bootstrap"])
 
 
-@misc_router.post("/client/locations")
-def client_locations() -> TarkovSuccessResponse[dict]:
+def _client_locations() -> dict:
     locations_base_path = db_dir.joinpath("base", "locations.json")
     locations_base: dict = ujson.load(locations_base_path.open())
 
@@ -28,7 +29,20 @@ def client_locations() -> TarkovSuccessResponse[dict]:
         map_id = map_data["base"]["_Id"]
         locations_base["locations"][map_id] = map_data["base"]
 
-    return TarkovSuccessResponse(data=locations_base)
+    return locations_base
+
+
+# Location files contain loot as well, only their bases are sent
+response_cache.register(
+    "/client/locations",
+    _client_locations,
+    sources=[db_dir.joinpath("base", "locations.json"), db_dir.joinpath("locations")],
+)
+
+
+@misc_router.post("/client/locations")
+def client_locations() -> Response:
+    return response_cache.response("/client/locations")
 
 
 @misc_router.post("/client/game/start")
@@ -85,22 +99,30 @@ def client_game_keepalive(
     return TarkovSuccessResponse(data={"msg": "ok"})
 
 
+@inject
+def _client_items(
+    templates_repository: ItemTemplatesRepository = Provide[
+        AppContainer.repos.templates
+    ],
+) -> Dict[TemplateId, Union[AnyTemplate]]:
+    return templates_repository.client_items_view
+
+
+# Templates are read once by ItemTemplatesRepository,
+# so this response should be invalidated explicitly when repository changes
+response_cache.register("/client/items", _client_items)
+
+
 @misc_router.post(
     "/client/items",
     # response_model=TarkovSuccessResponse[Dict[TemplateId, AnyTemplate]]
     # Disable response_model since validating Templates via pydantic is really expensive
 )
-@inject
-def client_items(
-    templates_repository: ItemTemplatesRepository = Depends(
-        Provide[AppContainer.repos.templates]
-    ),
-) -> TarkovSuccessResponse[Dict[TemplateId, Union[AnyTemplate]]]:
-    return TarkovSuccessResponse(data=templates_repository.client_items_view)
+def client_items() -> Response:
+    return response_cache.response("/client/items")
 
 
-@misc_router.post("/client/customization")
-def client_customization() -> TarkovSuccessResponse[dict]:
+def _client_customization() -> dict:
     customization = {}
     for customization_file_path in (db_dir / "customization").glob("*"):
         customization_data = ujson.load(
@@ -108,20 +130,46 @@ def client_customization() -> TarkovSuccessResponse[dict]:
         )
         customization_id = customization_data["_id"]
         customization[customization_id] = customization_data
+    return customization
+
 
-    return TarkovSuccessResponse(data=customization)
+response_cache.register(
+    "/client/customization",
+    _client_customization,
+    sources=[db_dir.joinpath("customization")],
+)
+
+
+@misc_router.post("/client/customization")
+def client_customization() -> Response:
+    return response_cache.response("/client/customization")
 
 
-@misc_router.post("/client/globals")
 @inject
-def client_globals(
-    flea_config: FleaMarketConfig = Depends(Provide[AppContainer.config.flea_market]),
-) -> TarkovSuccessResponse[dict]:
+def _client_globals(
+    flea_config: FleaMarketConfig = Provide[AppContainer.config.flea_market],
+) -> dict:
     globals_path = db_dir.joinpath("base", "globals.json")
     globals_base = ujson.load(globals_path.open(encoding="utf8"))
-    globals_base["time"] = int(datetime.datetime.now().timestamp())
     globals_base["config"]["RagFair"]["minUserLevel"] = flea_config.level_required
-    return TarkovSuccessResponse(data=globals_base)
+    return globals_base
+
+
+def _client_globals_dynamic_fields() -> dict:
+    return {"time": int(datetime.datetime.now().timestamp())}
+
+
+response_cache.register(
+    "/client/globals",
+    _client_globals,
+    sources=[db_dir.joinpath("base", "globals.json"), FleaMarketConfig.__config_path__],
+    dynamic_fields=_client_globals_dynamic_fields,
+)
+
+
+@misc_router.post("/client/globals")
+def client_globals() -> Response:
+    return response_cache.response("/client/globals")
 
 
 @misc_router.post("/client/weather")
@@ -149,13 +197,23 @@ def client_weather() -> TarkovSuccessResponse[dict]:
     return TarkovSuccessResponse(data=weather_data)
 
 
-@misc_router.post("/client/handbook/templates")
-def client_handbook_templates() -> TarkovSuccessResponse[dict]:
+def _client_handbook_templates() -> dict:
     data: dict = {}
     for template_path in db_dir.joinpath("templates").glob("*.json"):
         data[template_path.stem] = ujson.load(template_path.open("r", encoding="utf8"))
+    return data
+
+
+response_cache.register(
+    "/client/handbook/templates",
+    _client_handbook_templates,
+    sources=[db_dir.joinpath("templates")],
+)
 
-    return TarkovSuccessResponse(data=data)
+
+@misc_router.post("/client/handbook/templates")
+def client_handbook_templates() -> Response:
+    return response_cache.response("/client/handbook/templates")
 
 
 @misc_router.post("/client/handbook/builds/my/list")
@@ -163,12 +221,20 @@ def client_handbook_builds_my_list() -> TarkovSuccessResponse:
     return TarkovSuccessResponse(data=[])  # TODO load user builds
 
 
+def _client_quest_list() -> list:
+    return ujson.load(db_dir.joinpath("quests", "all.json").open("r", encoding="utf8"))
+
+
+response_cache.register(
+    "/client/quest/list",
+    _client_quest_list,
+    sources=[db_dir.joinpath("quests", "all.json")],
+)
+
+
 @misc_router.post("/client/quest/list")
-def client_quest_list() -> TarkovSuccessResponse[list]:
-    all_quests: list = ujson.load(
-        db_dir.joinpath("quests", "all.json").open("r", encoding="utf8")
-    )
-    return TarkovSuccessResponse(data=all_quests)
+def client_quest_list() -> Response:
+    return response_cache.response("/client/quest/list")
 
 
 @misc_router.post("/client/server/list")
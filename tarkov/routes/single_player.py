@@ -4,6 +4,7 @@ from fastapi import Request
 from fastapi.params import Depends
 from pydantic import BaseModel
 
+from server.responses import ZLibORJSONStreamingResponse
 from server.utils import make_router
 from tarkov.profile.dependencies import with_profile
 from tarkov.lib import locations
@@ -31,13 +32,16 @@ def singleplayer_settings_raid_menu() -> dict:
     }
 
 
-@singleplayer_router.get("/api/location/{location_name}")
-def location(location_name: str) -> dict:
+@singleplayer_router.get(
+    "/api/location/{location_name}",
+    response_class=ZLibORJSONStreamingResponse,
+)
+def location(location_name: str) -> ZLibORJSONStreamingResponse:
     location_name = location_name.lower()
 
     location_generator = locations.LocationGenerator(location_name)
 
-    return location_generator.generate_location()
+    return ZLibORJSONStreamingResponse(location_generator.generate_location())
 
 
 @singleplayer_router.get("/mode/offline")
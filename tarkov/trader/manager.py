@@ -13,8 +13,24 @@ class TraderManager:
         self.__trader_factory = trader_factory
         self.__traders: Dict[TraderType, Trader] = {}
 
+    @property
+    def traders(self) -> Dict[TraderType, Trader]:
+        """
+        Traders that were loaded already
+        """
+        return self.__traders
+
     def get_trader(self, trader_type: TraderType) -> Trader:
         if trader_type not in self.__traders:
             self.__traders[trader_type] = self.__trader_factory(trader_type)
 
         return self.__traders[trader_type]
+
+    def reload(self) -> None:
+        """
+        Recreates loaded traders from their files (assorts are generated again)
+        """
+        self.__traders = {
+            trader_type: self.__trader_factory(trader_type)
+            for trader_type in list(self.__traders)
+        }
@@ -4,6 +4,7 @@ from dependency_injector.wiring import Provide, inject
 from fastapi.params import Cookie, Depends
 
 from server.container import AppContainer
+from server.responses import ZLibTrustedResponse
 from server.utils import make_router
 from tarkov.profile.dependencies import with_profile, with_profile_readonly
 from tarkov.inventory.models import Item
@@ -104,6 +105,7 @@ class TraderAssortResponse(Base):
     "/client/trading/api/getTraderAssort/{trader_id}",
     response_model=TarkovSuccessResponse[TraderAssortResponse],
     response_model_exclude_none=True,
+    response_class=ZLibTrustedResponse,
 )
 @inject
 async def get_trader_assort(
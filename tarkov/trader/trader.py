@@ -92,13 +92,11 @@ class Trader:
 
     def can_sell(self, item: Item) -> bool:
         try:
-            category = category_repository.get_category(item.tpl)
-            return category.Id in self.base.sell_category or any(
-                c.Id in self.base.sell_category
-                for c in category_repository.parent_categories(category)
-            )
+            categories = category_repository.template_categories(item.tpl)
         except KeyError:
             return False
+        # Trader base isn't copied here, sell categories never change
+        return not categories.isdisjoint(self._base.sell_category)
 
     def get_sell_price(self, item: Item, children_items: Iterable[Item]) -> Price:
         """
@@ -109,12 +107,9 @@ class Trader:
 
         tpl = self.__templates_repository.get_template(item)
         price_rub = tpl.props.CreditsPrice
-
-        for child in children_items:
-            child_tpl = self.__templates_repository.get_template(child)
-            child_price = child_tpl.props.CreditsPrice
-            if self.can_sell(child):
-                price_rub += child_price
+        price_rub += self.__templates_repository.columns.total_price(
+            child.tpl for child in children_items if self.can_sell(child)
+        )
 
         currency_template_id: TemplateId = TemplateId(
             CurrencyEnum[self.base.currency].value
@@ -57,9 +57,8 @@ class TraderView(BaseTraderView):
         """
         Calculates insurance price of given items based on their total price, current standing and insurance config.
         """
-        total_price: float = sum(
-            self.__templates_repository.get_template(item).props.CreditsPrice
-            for item in items
+        total_price: float = self.__templates_repository.columns.total_price(
+            item.tpl for item in items
         )
         total_price *= self.__insurance_price_multiplier
         total_price -= total_price * min(self.standing.current_standing, 0.5)
@@ -0,0 +1,52 @@
+import re
+
+import pytest
+
+from tarkov.bots.bots import BotInventory
+from tarkov.inventory.helpers import item_id_generator, regenerate_items_ids
+from tarkov.inventory.implementations import SimpleInventory
+from tarkov.inventory.models import Item
+
+
+def test_generated_ids_are_unique():
+    ids = [item_id_generator.generate(), *item_id_generator.generate_many(1000)]
+
+    assert len(set(ids)) == len(ids)
+    assert all(re.fullmatch("[0-9a-f]{24}", item_id) for item_id in ids)
+
+
+def test_regenerate_items_ids():
+    parent = Item(id="parent", tpl="5449016a4bdc2d6f028b456f")
+    child = Item(id="child", tpl="5449016a4bdc2d6f028b456f", parent_id="parent")
+    outside = Item(id="other", tpl="5449016a4bdc2d6f028b456f", parent_id="hideout")
+
+    regenerate_items_ids([parent, child, outside])
+
+    assert parent.id not in {"parent", "child", "other"}
+    assert child.parent_id == parent.id
+    assert outside.parent_id == "hideout"
+
+
+def test_regenerate_items_ids_of_stored_items():
+    item = Item(id="item", tpl="5449016a4bdc2d6f028b456f")
+    inventory = SimpleInventory([item])
+
+    with pytest.raises(ValueError):
+        regenerate_items_ids([item])
+
+    inventory.remove_item(item)
+    regenerate_items_ids([item])
+    assert item.id != "item"
+
+
+def test_bot_inventory_regenerate_ids():
+    inventory = BotInventory.make_empty()
+    equipment = inventory.get(inventory.inventory.equipment)
+    inventory.add_item(
+        Item(tpl="5449016a4bdc2d6f028b456f", parent_id=equipment.id, slot_id="main")
+    )
+
+    inventory.regenerate_ids()
+    assert all(item_id == item.id for item_id, item in inventory.items.items())
+    assert inventory.get(inventory.inventory.equipment) is equipment
+    assert len(list(inventory.iter_item_children(equipment))) == 1
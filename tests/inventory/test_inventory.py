@@ -0,0 +1,223 @@
+from typing import Callable
+
+import pytest
+
+import server.app
+from tarkov.bots.bots import BotInventory
+from tarkov.inventory.implementations import MultiGridSubInventory, SimpleInventory
+from tarkov.inventory.inventory import (
+    GridInventoryStashMap,
+    ImmutableInventory,
+    InventoryItems,
+    PlayerInventoryStashMap,
+    StashMapItemFootprint,
+)
+from tarkov.inventory.models import Item, ItemUpdFoldable
+from tarkov.inventory.prop_models import Grid
+from tarkov.lib.locations import ContainerInventory, ContainerModel
+from tarkov.profile.profile import Profile
+from tarkov.trader.inventory import TraderInventory
+from tarkov.trader.models import TraderType
+
+TEMPLATE_ID = "5449016a4bdc2d6f028b456f"
+
+
+def _item(item_id: str, parent_id: str = None) -> Item:
+    return Item(id=item_id, tpl=TEMPLATE_ID, parent_id=parent_id)
+
+
+def _children_ids(inventory: ImmutableInventory, item: Item) -> set:
+    return {child.id for child in inventory.iter_item_children(item)}
+
+
+def test_children_index():
+    root, first, second = _item("root"), _item("first", "root"), _item("second")
+    nested = _item("nested", "first")
+    inventory = SimpleInventory([root, first, second])
+    inventory.add_item(nested)
+
+    assert _children_ids(inventory, root) == {"first"}
+    assert [i.id for i in inventory.iter_item_children_recursively(root)] == [
+        "first",
+        "nested",
+    ]
+
+    # Direct reassignment of parent_id
+    second.parent_id = "root"
+    nested.parent_id = "second"
+    assert _children_ids(inventory, root) == {"first", "second"}
+    assert _children_ids(inventory, first) == set()
+    assert _children_ids(inventory, second) == {"nested"}
+
+    inventory.remove_item(second)
+    assert _children_ids(inventory, root) == {"first"}
+    assert set(inventory.items) == {"root", "first"}
+    assert set(inventory.items.children) == {None, "root"}
+
+
+def test_inventory_items_dict_methods():
+    inventory = SimpleInventory([])
+    items = InventoryItems(inventory, [_item("a"), _item("b", "a")])
+    items.update({"c": _item("c", "a")})
+    items.setdefault("d", _item("d", "c"))
+    assert set(items.children["a"]) == {"b", "c"}
+
+    items.pop("c")
+    items["b"] = _item("b", "d")
+    assert "a" not in items.children
+    assert set(items.children["d"]) == {"b"}
+
+    assert all(item.__inventory__ is inventory for item in items.values())
+
+    items.clear()
+    assert not items.children
+
+
+def _grid_inventory(width: int, height: int) -> MultiGridSubInventory:
+    grid = Grid(
+        _name="main",
+        _id="grid",
+        _parent="grid",
+        _proto="grid",
+        _props={
+            "filters": [],
+            "cellsH": width,
+            "cellsV": height,
+            "minCount": 0,
+            "maxCount": 0,
+            "maxWeight": 0,
+        },
+    )
+    return MultiGridSubInventory("root", grid)
+
+
+def _multi_grid_inventory(profile: Profile) -> ImmutableInventory:
+    inventory = _grid_inventory(width=2, height=2)
+    for item in (_item("root"), _item("first", "root"), _item("second", "root")):
+        inventory.items[item.id] = item
+    return inventory
+
+
+def _container_inventory(profile: Profile) -> ImmutableInventory:
+    items = [_item("root"), _item("first", "root"), _item("second", "root")]
+    return ContainerInventory(
+        ContainerModel(
+            Id="container",
+            IsStatic=True,
+            useGravity=False,
+            randomRotation=False,
+            IsGroupPosition=False,
+            Root="root",
+            Position={},
+            Rotation={},
+            GroupPositions=[],
+            Items=items,
+        )
+    )
+
+
+def _trader_inventory(profile: Profile) -> ImmutableInventory:
+    trader = server.app.container.trader.manager().get_trader(TraderType.Mechanic)
+    return TraderInventory(trader)
+
+
+@pytest.mark.parametrize(
+    "make_inventory",
+    [
+        lambda profile: SimpleInventory(
+            [_item("root"), _item("first", "root"), _item("second", "root")]
+        ),
+        lambda profile: profile.inventory,
+        _multi_grid_inventory,
+        _container_inventory,
+        lambda profile: BotInventory.make_empty(),
+        _trader_inventory,
+    ],
+    ids=["simple", "player", "multi_grid", "container", "bot", "trader"],
+)
+def test_reparent_in_every_inventory_type(
+    make_inventory: Callable[[Profile], ImmutableInventory], profile: Profile
+):
+    inventory = make_inventory(profile)
+    items = list(inventory.items.values())
+    item = next(i for i in items if not _children_ids(inventory, i))
+    new_parent = next(i for i in items if i is not item and i.id != item.parent_id)
+    old_parent_id = item.parent_id
+
+    item.parent_id = new_parent.id
+    assert item.id in _children_ids(inventory, new_parent)
+    if old_parent_id in inventory.items:
+        old_parent = inventory.get(old_parent_id)
+        assert item.id not in _children_ids(inventory, old_parent)
+
+
+def _stash_map(width: int, height: int) -> GridInventoryStashMap:
+    return _grid_inventory(width, height).stash_map
+
+
+def test_stash_map_fill():
+    stash_map = _stash_map(width=5, height=4)
+    footprint = StashMapItemFootprint(x=1, y=1, width=3, height=2)
+
+    stash_map.fill(footprint, True)
+    assert {(x, y) for x, y in stash_map.iter_cells() if stash_map.get(x, y)} == {
+        (x, y) for x in range(1, 4) for y in range(1, 3)
+    }
+    assert not stash_map.is_free(StashMapItemFootprint(x=3, y=2, width=2, height=2))
+    assert stash_map.is_free(StashMapItemFootprint(x=4, y=0, width=1, height=4))
+    assert not stash_map.is_free(StashMapItemFootprint(x=4, y=0, width=2, height=1))
+
+    with pytest.raises(GridInventoryStashMap.InvalidCellStateError):
+        stash_map.fill(StashMapItemFootprint(x=0, y=2, width=2, height=1), True)
+    with pytest.raises(GridInventoryStashMap.OutOfBoundsError):
+        stash_map.fill(StashMapItemFootprint(x=0, y=3, width=1, height=2), True)
+
+    stash_map.fill(footprint, False)
+    assert not any(stash_map.get(x, y) for x, y in stash_map.iter_cells())
+    with pytest.raises(GridInventoryStashMap.InvalidCellStateError):
+        stash_map.fill(footprint, False)
+
+
+def test_stash_map_find_free():
+    stash_map = _stash_map(width=4, height=4)
+    stash_map.fill(StashMapItemFootprint(x=0, y=0, width=3, height=1), True)
+    stash_map.fill(StashMapItemFootprint(x=1, y=1, width=1, height=3), True)
+
+    assert stash_map.find_free(1, 1) == (3, 0)
+    assert stash_map.find_free(1, 2) == (3, 0)
+    assert stash_map.find_free(2, 1) == (2, 1)
+    assert stash_map.find_free(2, 2) == (2, 1)
+    assert stash_map.find_free(2, 4) is None
+    assert stash_map.find_free(5, 1) is None
+
+
+def test_item_size_follows_folding():
+    # PP-91 "Kedr", foldable weapon without stock slot
+    weapon = Item(id="weapon", tpl="57d14d2524597714373db789")
+    inventory = SimpleInventory([weapon])
+    assert inventory.get_item_size(weapon) == (3, 1)
+
+    weapon.upd.Foldable = ItemUpdFoldable(Folded=True)
+    assert inventory.get_item_size(weapon) == (2, 1)
+    weapon.upd.Foldable.Folded = False
+    assert inventory.get_item_size(weapon) == (3, 1)
+
+
+def test_stash_map_is_built_lazily(profile: Profile):
+    inventory = profile.inventory
+    assert inventory._stash_map is None
+
+    # Removing items doesn't need the stash map, it's built later from remaining items
+    item = next(
+        i for i in inventory.iter_item_children(inventory.get(inventory.root_id))
+    )
+    inventory.remove_item(item)
+    assert inventory._stash_map is None
+
+    inventory.place_item(item)
+    assert isinstance(inventory._stash_map, PlayerInventoryStashMap)
+    assert not inventory.stash_map.is_free(
+        inventory.stash_map._calculate_item_footprint(
+            item, list(inventory.iter_item_children_recursively(item)), item.location
+        )
+    )
@@ -0,0 +1,115 @@
+from typing import Set
+
+import pytest
+from dependency_injector.wiring import Provide, inject
+
+from server.container import AppContainer
+from tarkov.exceptions import NotFoundError
+from tarkov.inventory.models import ItemTemplate, NodeTemplate
+from tarkov.inventory.repositories import ItemTemplatesRepository
+
+
+@pytest.fixture()
+@inject
+def templates_repository(
+    templates_repository: ItemTemplatesRepository = Provide[
+        AppContainer.repos.templates
+    ],
+) -> ItemTemplatesRepository:
+    return templates_repository
+
+
+def test_columns_match_templates(templates_repository: ItemTemplatesRepository):
+    columns = templates_repository.columns
+    templates = list(templates_repository.templates.values())[:100]
+    template_ids = [template.id for template in templates]
+
+    assert columns.sizes(template_ids) == [
+        (template.props.Width, template.props.Height) for template in templates
+    ]
+    assert columns.spawn_chances(template_ids) == [
+        template.props.SpawnChance for template in templates
+    ]
+    assert columns.total_price(template_ids * 2) == 2 * sum(
+        template.props.CreditsPrice for template in templates
+    )
+
+    with pytest.raises(NotFoundError):
+        columns.total_price(["Unknown template"])
+
+
+def test_slots_compatibility(templates_repository: ItemTemplatesRepository):
+    templates = [
+        template
+        for template in templates_repository.templates.values()
+        if template.slots_filter()
+    ]
+    all_template_ids = list(templates_repository.templates)
+    for template in templates[:20]:
+        compatible = templates_repository.compatible_templates(template.id)
+        assert all(template.has_in_slots(template_id) for template_id in compatible)
+        for template_id in compatible:
+            assert template.id in templates_repository.accepting_templates(template_id)
+        # Index doesn't miss any template that fits into slots
+        assert compatible == {
+            template_id
+            for template_id in all_template_ids
+            if template.has_in_slots(template_id)
+        }
+
+    for template_id in list(compatible)[:5]:
+        assert templates_repository.accepting_templates(template_id) == {
+            template.id
+            for template in templates_repository.templates.values()
+            if template.has_in_slots(template_id)
+        }
+
+
+def _scan_template_children(
+    templates_repository: ItemTemplatesRepository, template_id: str
+) -> Set[str]:
+    """Ids of template and it's descendants found by scanning every template (as it was done before the index)"""
+    templates = list(templates_repository.client_items_view.values())
+    found = set()
+    stack = [templates_repository.get_any_template(template_id)]
+    while stack:
+        template = stack.pop()
+        found.add(template.id)
+        stack.extend(t for t in templates if t.parent == template.id)
+    return found
+
+
+def test_template_children_match_full_scan(
+    templates_repository: ItemTemplatesRepository,
+):
+    templates = list(templates_repository.client_items_view.values())
+    nodes = [t for t in templates if isinstance(t, NodeTemplate)]
+    leaves = [t for t in templates if isinstance(t, ItemTemplate)]
+    for template in [*nodes[:30], *leaves[:10]]:
+        expected = _scan_template_children(templates_repository, template.id)
+        children = templates_repository.iter_template_children(template.id)
+        assert {t.id for t in children} == expected
+
+        template_items = templates_repository.get_template_items(template.id)
+        assert {t.id for t in template_items} == {
+            template_id
+            for template_id in expected
+            if template_id in templates_repository.templates
+        }
+
+    with pytest.raises(NotFoundError):
+        templates_repository.get_template_items("unknown")
+    with pytest.raises(NotFoundError):
+        list(templates_repository.iter_template_children("unknown"))
+
+
+def test_template_items_are_immutable(templates_repository: ItemTemplatesRepository):
+    category_id = "5447e1d04bdc2dff2f8b4567"  # Knives
+    template_items = templates_repository.get_template_items(category_id)
+
+    # Result is memoized, so it's a tuple that callers copy instead of modifying
+    assert isinstance(template_items, tuple)
+    assert templates_repository.get_template_items(category_id) is template_items
+    items_copy = list(template_items)
+    items_copy.clear()
+    assert templates_repository.get_template_items(category_id)
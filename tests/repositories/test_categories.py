@@ -0,0 +1,64 @@
+from typing import Set
+
+import pytest
+
+from tarkov.inventory.types import TemplateId
+from tarkov.repositories.categories import (
+    CategoryId,
+    CategoryModel,
+    CategoryRepository,
+)
+
+
+def _walk_template_categories(
+    repository: CategoryRepository, template_id: TemplateId
+) -> Set[CategoryId]:
+    """Categories of template found by walking parents (as it was done before they were precomputed)"""
+    category = repository.get_category(template_id)
+    categories = {category.Id}
+    while category.ParentId is not None:
+        category = repository.categories[category.ParentId]
+        categories.add(category.Id)
+    return categories
+
+
+def test_template_categories_match_parent_walk():
+    repository = CategoryRepository()
+    for template_id in repository.item_categories:
+        assert repository.template_categories(template_id) == _walk_template_categories(
+            repository, template_id
+        )
+
+        category = repository.get_category(template_id)
+        assert {c.Id for c in repository.parent_categories(category)} == (
+            _walk_template_categories(repository, template_id) - {category.Id}
+        )
+
+
+def test_template_categories_of_unknown_template():
+    repository = CategoryRepository()
+    # Trader.can_sell relies on KeyError for templates without category
+    with pytest.raises(KeyError):
+        repository.template_categories(TemplateId("unknown"))
+
+
+def test_missing_parent_category():
+    repository = CategoryRepository()
+    orphan = CategoryModel(
+        Id=CategoryId("orphan"), ParentId=CategoryId("missing"), Icon="", Order=""
+    )
+    repository.categories[orphan.Id] = orphan
+    with pytest.raises(KeyError):
+        repository.parent_categories(orphan)
+
+
+def test_reload_drops_cached_properties():
+    repository = CategoryRepository()
+    template_id = next(iter(repository.item_categories))
+    categories = repository.template_categories(template_id)
+    repository.categories[CategoryId("removed")] = repository.get_category(template_id)
+
+    repository.reload()
+    assert CategoryId("removed") not in repository.categories
+    assert repository.template_categories(template_id) == categories
+    assert repository.template_categories(template_id) is not categories
@@ -0,0 +1,57 @@
+import zlib
+from pathlib import Path
+
+from fastapi import FastAPI, Request
+from starlette.testclient import TestClient
+
+from server.capture import RequestRecorder, read_capture
+from server.replay import replay
+from server.requests import ZLibRoute
+from server.utils import make_router
+
+router = make_router()
+
+
+@router.post("/echo/{name}")
+async def echo(name: str, request: Request) -> dict:
+    return {"name": name, "body": await request.json()}
+
+
+capture_app = FastAPI()
+capture_app.include_router(router)
+
+
+def test_capture_and_replay(tmp_path: Path, monkeypatch):
+    recorder = RequestRecorder(tmp_path.joinpath("capture.jsonl"))
+    monkeypatch.setattr(ZLibRoute, "recorder", recorder)
+
+    client = TestClient(capture_app)
+    client.post(
+        "/echo/first?query=1",
+        data=zlib.compress(b'{"key": "value"}'),
+        cookies={"PHPSESSID": "profile_id"},
+    )
+    client.post("/echo/second", data=b'{"key": "value"}')
+    recorder.close()
+
+    first, second = read_capture(recorder.path)
+    assert first.method == "POST"
+    assert first.path == "/echo/first?query=1"
+    assert first.route == "/echo/{name}"
+    assert first.cookies == {"PHPSESSID": "profile_id"}
+    assert first.body == b'{"key": "value"}'
+    assert second.body == b'{"key": "value"}'
+    assert second.offset >= first.offset
+
+    monkeypatch.setattr(ZLibRoute, "recorder", None)
+    report = replay(
+        read_capture(recorder.path),
+        url="http://testserver",
+        concurrency=2,
+        speed=None,
+        session_factory=lambda: TestClient(capture_app),
+    )
+    assert list(report.routes) == ["/echo/{name}"]
+    assert len(report.routes["/echo/{name}"].latencies) == 2
+    assert report.routes["/echo/{name}"].errors == 0
+    assert "/echo/{name}" in report.format()
@@ -0,0 +1,32 @@
+import zlib
+from pathlib import Path
+
+import orjson
+
+from server.mapped import MappedFiles
+from server.responses import ResponseCache
+
+
+def test_mapped_files(tmp_path: Path):
+    mapped_files = MappedFiles(tmp_path)
+
+    assert mapped_files.map("blob", b"first") == b"first"
+    assert mapped_files.map("blob", b"first") == b"first"
+    assert len(list(tmp_path.glob("blob.*.bin"))) == 1
+
+    # Previous content of the blob is removed
+    assert mapped_files.map("blob", b"second") == b"second"
+    assert len(list(tmp_path.glob("blob.*.bin"))) == 1
+
+
+def test_response_cache_maps_big_bodies(tmp_path: Path):
+    cache = ResponseCache()
+    cache.mapped_files = MappedFiles(tmp_path)
+    cache.mapped_threshold = 1000
+    cache.register("/small", lambda: [1])
+    cache.register("/big", lambda: [str(number) for number in range(1000)])
+
+    assert isinstance(cache.render("/small"), bytes)
+    body = cache.render("/big")
+    assert isinstance(body, memoryview)
+    assert orjson.loads(zlib.decompress(body))["data"][-1] == "999"
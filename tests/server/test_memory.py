@@ -0,0 +1,34 @@
+import tracemalloc
+
+from server.memory import AllocationTracer, MemoryReport
+
+
+def test_memory_report():
+    shared = ["shared" * 100]
+    report = MemoryReport()
+    report.add("shared", lambda: shared)
+    report.add("mapping", lambda: {"a": [shared, "a" * 1000], "b": []}, split=True)
+
+    sizes = report.measure()
+    # Shared object is counted only towards the first structure
+    assert sizes["shared"]["objects"] == 2
+    assert sizes["mapping"]["items"]["a"]["size"] > 1000
+    assert sizes["mapping"]["items"]["a"]["objects"] == 2
+    assert sizes["mapping"]["size"] > sum(
+        item["size"] for item in sizes["mapping"]["items"].values()
+    )
+
+
+def test_allocation_tracer():
+    tracer = AllocationTracer()
+    tracer.start(1)
+    try:
+        tracer.diff()
+        allocated = [str(number) for number in range(10000)]
+        top = tracer.diff(limit=1)[0]
+    finally:
+        tracemalloc.stop()
+
+    assert __file__ in top["location"]
+    assert top["size_diff"] >= 10000 * 40
+    assert len(allocated) == 10000
@@ -0,0 +1,70 @@
+import zlib
+
+from fastapi import FastAPI, Request
+from starlette.testclient import TestClient
+
+import server.metrics
+from server.metrics import (
+    MetricsMiddleware,
+    MetricsRegistry,
+    RouteResolver,
+    metrics_endpoint,
+)
+from server.utils import make_router
+
+
+def _make_client(registry: MetricsRegistry) -> TestClient:
+    router = make_router()
+
+    @router.post("/echo/{name}")
+    async def echo(
+        name: str, request: Request
+    ) -> dict:  # pylint: disable=unused-variable
+        return {"name": name, **await request.json()}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(MetricsMiddleware, routes=lambda: app.routes, registry=registry)
+    return TestClient(app)
+
+
+def test_metrics_are_collected_per_route_template() -> None:
+    registry = MetricsRegistry()
+    client = _make_client(registry)
+
+    body = b'{"value": "' + b"a" * 1000 + b'"}'
+    for name in ("first", "second"):
+        response = client.post(f"/echo/{name}", data=zlib.compress(body))
+        assert response.status_code == 200
+    client.get("/missing")
+
+    metrics = registry.routes[("POST", "/echo/{name}")]
+    assert metrics.requests == 2
+    assert metrics.errors == 0
+    assert metrics.in_flight == 0
+    assert metrics.request_bytes == 2 * len(zlib.compress(body))
+    assert metrics.request_bytes_decompressed == 2 * len(body)
+    assert metrics.response_bytes_uncompressed > metrics.response_bytes
+
+    assert registry.routes[("GET", RouteResolver.UNMATCHED_ROUTE)].errors == 1
+
+    rendered = registry.render()
+    assert (
+        'jetpy_request_duration_seconds_count{method="POST",route="/echo/{name}"} 2'
+        in rendered
+    )
+    assert 'jetpy_request_errors_total{method="GET",route="<unmatched>"} 1' in rendered
+
+
+def test_metrics_endpoint_is_local_only(monkeypatch) -> None:
+    app = FastAPI()
+    app.add_route("/metrics", metrics_endpoint)
+    client = TestClient(app)
+
+    # Test client connects from "testclient" host
+    assert client.get("/metrics").status_code == 403
+
+    monkeypatch.setattr(server.metrics, "is_local_request", lambda request: True)
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert "jetpy_" in response.text
@@ -0,0 +1,54 @@
+import time
+from pathlib import Path
+
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from server.profiling import ProfilingMiddleware, tag_request
+from server.utils import make_router
+
+
+def _make_client(profiles_dir: Path, **kwargs) -> TestClient:
+    router = make_router()
+
+    @router.post("/slow/{name}")
+    def slow(name: str) -> dict:  # pylint: disable=unused-variable
+        tag_request("Move", "Split")
+        time.sleep(0.1)
+        return {"name": name}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(
+        ProfilingMiddleware,
+        routes=lambda: app.routes,
+        profiles_dir=profiles_dir,
+        interval=0.001,
+        **kwargs,
+    )
+    return TestClient(app)
+
+
+def test_profile_requested_by_header(tmp_path: Path):
+    client = _make_client(tmp_path)
+    client.post("/slow/first")
+    assert not list(tmp_path.iterdir())
+
+    client.post("/slow/second", headers={"X-Jet-Profile": "1"})
+    (profile,) = tmp_path.iterdir()
+    assert profile.name.endswith("_POST_slow_name_header.collapsed")
+
+    lines = profile.read_text(encoding="utf8").splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert stack.startswith("POST /slow/{name} [Move,Split];")
+        assert int(count) > 0
+    assert any("sleep" in line or "slow (" in line for line in lines)
+
+
+def test_slow_requests_are_profiled(tmp_path: Path):
+    client = _make_client(tmp_path, slow_threshold=0.05)
+    client.post("/slow/first")
+    (profile,) = tmp_path.iterdir()
+    assert profile.name.endswith("_slow.collapsed")
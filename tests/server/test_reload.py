@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import pytest
+from dependency_injector import providers
+
+from server.reload import DatabaseReloader, rebuild
+
+
+def test_reloader(tmp_path: Path):
+    source = tmp_path.joinpath("source.json")
+    source.write_text("{}")
+    calls = []
+
+    def fail() -> None:
+        raise ValueError
+
+    reloader = DatabaseReloader()
+    reloader.add("repository", lambda: calls.append("repository"), sources=[source])
+    reloader.add("other", lambda: calls.append("other"), sources=[tmp_path])
+    reloader.add("failing", fail, depends_on=["repository"])
+    reloader.add("cache", lambda: calls.append("cache"), depends_on=["failing"])
+
+    assert not reloader.changed()
+    assert not reloader.reload()
+
+    source.write_text('{"changed": true}')
+    assert reloader.changed() == ["repository", "other"]
+    # Dependent targets are reloaded too, even if target between them failed
+    assert reloader.reload(["repository"]) == ["repository", "cache"]
+    assert calls == ["repository", "cache"]
+    assert reloader.changed() == ["other"]
+
+    with pytest.raises(KeyError):
+        reloader.reload(["unknown"])
+    with pytest.raises(ValueError):
+        reloader.add("orphan", lambda: None, depends_on=["unknown"])
+
+
+def test_rebuild():
+    repository = providers.ThreadSafeSingleton(list)
+    dependent = providers.ThreadSafeSingleton(dict, repository=repository)
+    old_repository, old_dependent = repository(), dependent()
+
+    rebuild(repository)
+    assert repository() is not old_repository
+    assert dependent() is old_dependent
+
+    rebuild(dependent)
+    assert dependent()["repository"] is repository()
+    # Same overriding provider is reused by later swaps
+    rebuild(repository)
+    assert len(repository.overridden) == 1
+
+    # Singleton doesn't hold on to the instance it was built with
+    repository.reset_override()
+    assert repository() is not old_repository
+
+    with pytest.raises(TypeError):
+        rebuild(providers.Factory(list))
@@ -0,0 +1,109 @@
+import asyncio
+import zlib
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI, Request
+from pydantic import BaseModel, Field, ValidationError
+from starlette.testclient import TestClient
+
+from server.requests import ZLibRequest, ZLibRoute
+from server.responses import ZLibTrustedResponse
+from server.utils import make_router
+
+router = make_router()
+
+
+@router.post("/echo")
+async def echo(request: Request) -> dict:
+    return {"body": await request.json()}
+
+
+class TrustedModel(BaseModel):
+    value: int
+    optional: Optional[str] = None
+    aliased: str = Field("alias", alias="Aliased")
+
+
+@router.post(
+    "/trusted",
+    response_model=TrustedModel,
+    response_model_exclude_none=True,
+    response_class=ZLibTrustedResponse,
+)
+def trusted() -> TrustedModel:
+    # Wouldn't pass the validation
+    return TrustedModel.construct(value="not validated", aliased="value")
+
+
+test_app = FastAPI()
+test_app.include_router(router)
+
+
+@pytest.fixture()
+def client() -> TestClient:
+    return TestClient(test_app)
+
+
+def test_compressed_body(client: TestClient):
+    response = client.post("/echo", data=zlib.compress(b'{"key": "value"}'))
+    assert response.json() == {"body": {"key": "value"}}
+
+
+def test_uncompressed_body(client: TestClient):
+    response = client.post("/echo", data=b'{"key": "value"}')
+    assert response.json() == {"body": {"key": "value"}}
+
+
+def test_body_over_limit_is_rejected(client: TestClient, monkeypatch):
+    monkeypatch.setattr(ZLibRequest, "max_body_size", 1024)
+    response = client.post(
+        "/echo", data=zlib.compress(b'{"key": "%s"}' % (b"a" * 2048))
+    )
+    assert response.status_code == 413
+
+
+def test_body_decompressed_in_threadpool(client: TestClient, monkeypatch):
+    monkeypatch.setattr(ZLibRequest, "threadpool_threshold", 0)
+    response = client.post("/echo", data=zlib.compress(b'{"key": "value"}'))
+    assert response.json() == {"body": {"key": "value"}}
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        (zlib.compress(b'{"key": "value"}'), {"key": "value"}),
+        (b'{"key": "value"}', {"key": "value"}),
+        (b"1", 1),
+    ],
+)
+def test_body_received_byte_by_byte(body: bytes, expected):
+    # First chunk is shorter than zlib header
+    messages = [
+        {"type": "http.request", "body": body[i : i + 1], "more_body": True}
+        for i in range(len(body))
+    ]
+    messages.append({"type": "http.request", "body": b"", "more_body": False})
+
+    async def receive() -> dict:
+        return messages.pop(0)
+
+    request = ZLibRequest({"type": "http", "method": "POST", "headers": []}, receive)
+    assert asyncio.run(request.json()) == expected
+
+
+def test_incomplete_body(client: TestClient):
+    response = client.post("/echo", data=zlib.compress(b'{"key": "value"}')[:-6])
+    assert response.status_code == 400
+
+
+def test_trusted_response_is_not_validated(client: TestClient):
+    response = client.post("/trusted")
+    assert response.headers["Content-Encoding"] == "deflate"
+    assert response.json() == {"value": "not validated", "Aliased": "value"}
+
+
+def test_trusted_response_validated_in_debug_mode(client: TestClient, monkeypatch):
+    monkeypatch.setattr(ZLibRoute, "validate_trusted_responses", True)
+    with pytest.raises(ValidationError):
+        client.post("/trusted")
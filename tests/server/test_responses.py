@@ -0,0 +1,127 @@
+import asyncio
+import zlib
+from pathlib import Path
+
+import orjson
+from dependency_injector.wiring import inject
+
+from server.responses import (
+    DeflatedDocument,
+    ResponseCache,
+    ZLibORJSONResponse,
+    ZLibORJSONStreamingResponse,
+    response_cache,
+)
+import tarkov.routes.misc
+from tarkov.config import FleaMarketConfig
+from tarkov.inventory.models import Item
+from tarkov.models import TarkovSuccessResponse
+
+
+def test_deflated_document_is_valid_zlib_stream():
+    document = DeflatedDocument(b'{"data":{"a":1')
+    assert (
+        zlib.decompress(document.finish(b',"time":2}}')) == b'{"data":{"a":1,"time":2}}'
+    )
+
+
+def test_cached_response_with_dynamic_fields():
+    cache = ResponseCache()
+    counter = iter(range(10))
+    cache.register(
+        "key",
+        lambda: {"a": 1, "time": 0},
+        dynamic_fields=lambda: {"time": next(counter)},
+    )
+
+    for expected_time in range(1, 3):
+        body = orjson.loads(zlib.decompress(cache.render("key")))
+        assert body == {
+            "err": 0,
+            "errmsg": None,
+            "data": {"a": 1, "time": expected_time},
+        }
+
+
+def test_cached_response_is_rebuilt_when_source_changes(tmp_path: Path):
+    source = tmp_path.joinpath("source.json")
+    source.write_text("1")
+
+    cache = ResponseCache(check_interval=0)
+    cache.register("key", lambda: int(source.read_text()), sources=[tmp_path])
+    assert orjson.loads(zlib.decompress(cache.render("key")))["data"] == 1
+
+    source.write_text("22")
+    assert orjson.loads(zlib.decompress(cache.render("key")))["data"] == 22
+
+
+def test_cached_response_snapshot(tmp_path: Path):
+    source = tmp_path.joinpath("source.json")
+    source.write_text("1")
+    builds = []
+
+    def build() -> int:
+        builds.append(1)
+        return int(source.read_text())
+
+    for _ in range(2):
+        # New cache loads body saved by previous one
+        cache = ResponseCache(snapshots_dir=tmp_path.joinpath("cache"))
+        cache.register("/client/key", build, sources=[source])
+        assert orjson.loads(zlib.decompress(cache.render("/client/key")))["data"] == 1
+    assert len(builds) == 1
+    assert cache.snapshots()["/client/key"].path.name == "client.key.pickle"
+
+
+def test_cached_response_snapshot_depends_on_config_and_builder_module(
+    tmp_path: Path,
+):
+    config = tmp_path.joinpath("config.yaml")
+    config.write_text("level_required: 10")
+
+    cache = ResponseCache(snapshots_dir=tmp_path.joinpath("cache"))
+    cache.register("/client/key", _build_globals, sources=[config])
+    snapshot = cache.snapshots()["/client/key"]
+    assert Path(__file__) in snapshot.code
+
+    key = snapshot.key()
+    config.write_text("level_required: 15")
+    assert snapshot.key() != key
+
+    globals_snapshot = response_cache.snapshots()["/client/globals"]
+    assert FleaMarketConfig.__config_path__ in globals_snapshot.sources
+    assert Path(tarkov.routes.misc.__file__) in globals_snapshot.code
+
+
+@inject
+def _build_globals() -> dict:
+    return {}
+
+
+def test_streaming_response_matches_zlib_response():
+    content = {
+        "list": [{"a": i, "b": [str(i)] * i} for i in range(2000)],
+        "empty": {},
+        "nested": {"x": {"y": {"z": None}}},
+    }
+    response = ZLibORJSONStreamingResponse(content)
+    response.chunk_size = 1024
+
+    async def read_body() -> bytes:
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    body = asyncio.run(read_body())
+    assert body == ZLibORJSONResponse(content).body
+    assert response.headers["Content-Encoding"] == "deflate"
+
+
+def test_streaming_response_serializes_models_by_alias():
+    item = Item(id="item_id", tpl="template_id", slot_id=None)
+    content = TarkovSuccessResponse(data=[item])
+    response = ZLibORJSONStreamingResponse(content)
+
+    async def read_body() -> bytes:
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    body = orjson.loads(zlib.decompress(asyncio.run(read_body())))
+    assert body == {"err": 0, "errmsg": None, "data": [orjson.loads(item.json())]}
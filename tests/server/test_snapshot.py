@@ -0,0 +1,39 @@
+from pathlib import Path
+
+from server.snapshot import Snapshot
+
+
+def test_snapshot(tmp_path: Path):
+    sources_dir = tmp_path.joinpath("sources")
+    sources_dir.mkdir()
+    sources_dir.joinpath("data.json").write_text("[1, 2, 3]")
+    code_path = tmp_path.joinpath("models.py")
+    code_path.write_text("class Model: ...")
+
+    snapshot = Snapshot(
+        path=tmp_path.joinpath("cache", "data.pickle"),
+        sources=[sources_dir],
+        code=[code_path],
+    )
+    builds = []
+
+    def build() -> dict:
+        builds.append(1)
+        return {"data": [1, 2, 3]}
+
+    assert not snapshot.is_fresh()
+    assert snapshot.get_or_build(build) == {"data": [1, 2, 3]}
+    assert snapshot.get_or_build(build) == {"data": [1, 2, 3]}
+    assert len(builds) == 1
+    assert snapshot.is_fresh()
+
+    # Snapshot is rebuilt after sources or code are changed
+    sources_dir.joinpath("other.json").write_text("[]")
+    snapshot.get_or_build(build)
+    code_path.write_text("class Model:\n    field: int")
+    snapshot.get_or_build(build)
+    assert len(builds) == 3
+
+    snapshot.path.write_bytes(snapshot.key() + b"broken")
+    assert snapshot.get_or_build(build) == {"data": [1, 2, 3]}
+    assert len(builds) == 4
@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+from server.startup import ImportTimer, StartupReport, Warmup, ready_endpoint, warmup
+
+
+def test_import_timer(tmp_path: Path, monkeypatch):
+    package_dir = tmp_path.joinpath("timed_package")
+    package_dir.mkdir()
+    package_dir.joinpath("__init__.py").write_text("from . import child\n")
+    package_dir.joinpath("child.py").write_text("import time\ntime.sleep(0.05)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    report = StartupReport()
+    timer = ImportTimer(report, tmp_path)
+    timer.install()
+    try:
+        import timed_package  # noqa: F401 pylint: disable=import-outside-toplevel,unused-import
+    finally:
+        timer.uninstall()
+        sys.modules.pop("timed_package", None)
+        sys.modules.pop("timed_package.child", None)
+
+    assert report.imports["timed_package.child"] >= 0.05
+    # Time of nested import is not counted towards parent package
+    assert report.imports["timed_package"] < 0.05
+    assert "timed_package.child" in report.format()
+
+
+def test_warmup():
+    def fail() -> None:
+        raise ValueError
+
+    calls = []
+    report = StartupReport()
+    background_warmup = Warmup(report)
+    background_warmup.add("failing", fail)
+    background_warmup.add("task", lambda: calls.append(1))
+    background_warmup.run()
+
+    assert calls == [1]
+    assert list(report.steps) == ["failing", "task"]
+    assert background_warmup.ready.is_set()
+
+
+def test_ready_endpoint(monkeypatch):
+    monkeypatch.setattr(warmup, "ready", type(warmup.ready)())
+    app = Starlette()
+    app.add_route("/ready", ready_endpoint)
+    client = TestClient(app)
+
+    assert client.get("/ready").status_code == 503
+    warmup.ready.set()
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json()["ready"] is True